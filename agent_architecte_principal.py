@@ -5,20 +5,33 @@
 
 Système d'analyse et de recommandations architecturales pour le projet Tshiakani VTC.
 Analyse l'architecture iOS (Swift), Backend (Node.js) et Dashboard (React).
+
+Pour les usages sensibles au démarrage (hook pre-commit, --watch, query), préférer
+`python -m agent_architecte_principal` : un script lancé directement est recompilé à chaque
+exécution, le module reprend son bytecode en cache.
 """
 
 import os
 import json
 import re
+import threading
+import time
+import functools
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
-from collections import defaultdict
-import subprocess
-
-@dataclass
-class ArchitectureReport:
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+from collections import Counter, defaultdict, OrderedDict
+import sys
+from array import array
+
+# Démarrage : sqlite3, subprocess, hashlib, datetime et concurrent.futures (qui charge multiprocessing)
+# sont importés dans les fonctions qui s'en servent, pour que --version et les sous-commandes de lecture
+# (query, trend, diff) ne paient pas l'analyse
+
+# Version de l'analyseur : toute évolution de l'extraction invalide le cache persistant
+ANALYZER_VERSION = "1.10.0"
+
+class ArchitectureReport(NamedTuple):
     """Rapport d'architecture complet"""
     timestamp: str
     version: str
@@ -28,13 +41,2319 @@ class ArchitectureReport:
     recommendations: List[Dict]
     metrics: Dict
     quality_score: float
+    profile: Dict
+    changes: Dict
+    plugin_analyses: Dict
+    
+    def to_dict(self) -> Dict:
+        """Copie superficielle : les analyses sont partagées, seuls les dictionnaires contenant des compteurs sont recopiés"""
+        return {name: _serialized(value) for name, value in self._asdict().items()}
 
-class IOSAnalyzer:
-    """Analyseur pour l'application iOS (Swift)"""
+def _serialized(value):
+    """Forme du rapport JSON : un Counter interne redevient la liste de ses éléments répétés (format historique)
+    
+    Les compteurs ne se trouvent que dans des dictionnaires : les listes ne sont pas parcourues.
+    """
+    if isinstance(value, Counter):
+        return list(value.elements())
+    if not isinstance(value, dict):
+        return value
+    changed = {}
+    for key, item in value.items():
+        if isinstance(item, dict):
+            converted = _serialized(item)
+            if converted is not item:
+                changed[key] = converted
+    return {**value, **changed} if changed else value
+
+# Dossiers exclus de tout parcours (mêmes règles que replace_all_references.py)
+EXCLUDE_DIRS = {
+    "Pods", "build", ".git", "node_modules", "DerivedData",
+    ".build", ".swiftpm", "xcuserdata", ".DS_Store",
+    ".svn", ".hg", ".architecte_cache"
+}
+
+class GitIgnoreRules:
+    """Règles .gitignore (sous-ensemble courant de la syntaxe) appliquées pendant le parcours"""
+    
+    def __init__(self):
+        # Dossier de base relatif -> liste de (regex, négation, dossier uniquement)
+        self._rules: Dict[str, List[Tuple["re.Pattern", bool, bool]]] = {}
+    
+    def load(self, rel_dir: str, gitignore_path: Path):
+        """Charge le .gitignore d'un dossier"""
+        try:
+            lines = gitignore_path.read_text(encoding='utf-8', errors='ignore').splitlines()
+        except OSError:
+            return
+        
+        rules = []
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            
+            # Un motif sans « / » interne s'applique à n'importe quelle profondeur
+            anchored = "/" in line
+            line = line.lstrip("/")
+            prefix = "" if anchored else "(?:.*/)?"
+            rules.append((re.compile(prefix + self._translate(line) + "$"), negated, dir_only))
+        
+        if rules:
+            self._rules[rel_dir] = rules
+    
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """Convertit un motif glob gitignore en expression régulière"""
+        regex = []
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith("**/", i):
+                regex.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                regex.append(".*")
+                i += 2
+                continue
+            if char == "*":
+                regex.append("[^/]*")
+            elif char == "?":
+                regex.append("[^/]")
+            elif char == "[":
+                end = pattern.find("]", i + 1)
+                if end == -1:
+                    regex.append(re.escape(char))
+                else:
+                    content = pattern[i + 1:end].replace("\\", "\\\\")
+                    if content.startswith("!"):
+                        content = "^" + content[1:]
+                    regex.append("[" + content + "]")
+                    i = end
+            else:
+                regex.append(re.escape(char))
+            i += 1
+        return "".join(regex)
+    
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Indique si un chemin est ignoré ; les .gitignore les plus profonds et les dernières règles l'emportent"""
+        ignored = False
+        for base, rules in self._rules.items():
+            if base and not rel_path.startswith(base + "/"):
+                continue
+            local = rel_path[len(base) + 1:] if base else rel_path
+            for regex, negated, dir_only in rules:
+                if dir_only and not is_dir:
+                    continue
+                if regex.match(local):
+                    ignored = not negated
+        return ignored
+
+class FileCatalog:
+    """Index des fichiers du projet, construit en un seul parcours de l'arborescence"""
+    
+    # Dossiers toujours parcourus, même quand le parcours est limité à quelques sous-projets
+    SHARED_DIRS = (".github",)
+    
+    def __init__(self, project_path: Path, exclude_dirs: Optional[set] = None, respect_gitignore: bool = True,
+                 subprojects: Optional[Dict[str, str]] = None, include: Optional[List[str]] = None):
+        self.project_path = project_path
+        self.exclude_dirs = EXCLUDE_DIRS if exclude_dirs is None else exclude_dirs
+        self.gitignore = GitIgnoreRules() if respect_gitignore else None
+        # Sous-projets (clé -> dossier racine relatif) ; par défaut ceux des analyseurs intégrés
+        self.subprojects = {spec.name: spec.root for spec in BUILTIN_ANALYZERS} if subprojects is None else subprojects
+        # Dossiers relatifs à parcourir (None : toute l'arborescence) ; les fichiers de la racine sont toujours indexés
+        self.include = None if include is None else tuple(include) + self.SHARED_DIRS
+        self._files_by_dir: Dict[str, List[str]] = {}
+        self._subdirs_by_dir: Dict[str, List[str]] = {}
+        self._files_by_extension: Dict[str, List[str]] = defaultdict(list)
+        self._files_by_subproject: Dict[str, List[str]] = defaultdict(list)
+        self._build()
+    
+    def _build(self):
+        """Parcourt l'arborescence une seule fois, sans jamais descendre dans les dossiers exclus ou ignorés"""
+        root = str(self.project_path)
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, root)
+            rel_dir = "" if rel_dir == "." else Path(rel_dir).as_posix()
+            prefix = rel_dir + "/" if rel_dir else ""
+            
+            if self.gitignore is not None:
+                if ".gitignore" in filenames:
+                    self.gitignore.load(rel_dir, Path(dirpath) / ".gitignore")
+                dirnames[:] = [d for d in dirnames if d not in self.exclude_dirs and not self.gitignore.is_ignored(prefix + d, True)]
+                filenames = [f for f in filenames if not self.gitignore.is_ignored(prefix + f, False)]
+            else:
+                dirnames[:] = [d for d in dirnames if d not in self.exclude_dirs]
+            if self.include is not None and not self._included(rel_dir):
+                # Dossier intermédiaire : ne descendre que vers les dossiers inclus, sans indexer ses fichiers
+                dirnames[:] = [d for d in dirnames if any(folder == prefix + d or folder.startswith(prefix + d + "/") for folder in self.include)]
+                if rel_dir:
+                    filenames = []
+            
+            # Élaguer sur place : os.walk ne descend que dans les dossiers conservés
+            dirnames.sort()
+            self._subdirs_by_dir[rel_dir] = list(dirnames)
+            self._files_by_dir[rel_dir] = sorted(filenames)
+            
+            subproject = self._subproject_of(rel_dir)
+            for filename in self._files_by_dir[rel_dir]:
+                rel_path = f"{rel_dir}/{filename}" if rel_dir else filename
+                self._files_by_extension[os.path.splitext(filename)[1].lower()].append(rel_path)
+                if subproject:
+                    self._files_by_subproject[subproject].append(rel_path)
+    
+    def _included(self, rel_dir: str) -> bool:
+        """Indique si un dossier relatif est (dans) un dossier à parcourir"""
+        return any(rel_dir == folder or rel_dir.startswith(folder + "/") for folder in self.include)
+    
+    def covers(self, rel_path: str) -> bool:
+        """Indique si le parcours a couvert un fichier (chemin relatif posix) : tout le projet sans include"""
+        rel_dir = rel_path.rpartition("/")[0]
+        return self.include is None or not rel_dir or self._included(rel_dir)
+    
+    def _subproject_of(self, rel_dir: str) -> Optional[str]:
+        """Retourne le sous-projet contenant un dossier relatif"""
+        for name, folder in self.subprojects.items():
+            if rel_dir == folder or rel_dir.startswith(folder + "/"):
+                return name
+        return None
+    
+    def subproject_of(self, rel_path: str) -> Optional[str]:
+        """Sous-projet contenant un fichier (chemin relatif posix)"""
+        return self._subproject_of(rel_path.rpartition("/")[0])
+    
+    def _relative(self, path: Path) -> str:
+        """Chemin relatif (posix) à la racine du projet"""
+        rel = path.relative_to(self.project_path).as_posix()
+        return "" if rel == "." else rel
+    
+    def is_dir(self, path: Path) -> bool:
+        """Indique si le dossier a été indexé"""
+        return self._relative(path) in self._files_by_dir
+    
+    def is_file(self, path: Path) -> bool:
+        """Indique si le fichier a été indexé"""
+        rel = self._relative(path)
+        parent, _, name = rel.rpartition("/")
+        return name in self._files_by_dir.get(parent, ())
+    
+    def subdirs(self, directory: Path) -> List[Path]:
+        """Sous-dossiers directs d'un dossier"""
+        rel = self._relative(directory)
+        return [directory / name for name in self._subdirs_by_dir.get(rel, [])]
+    
+    def files(self, directory: Path, suffixes: Optional[Tuple[str, ...]] = None, recursive: bool = False) -> List[Path]:
+        """Fichiers d'un dossier (équivalent de glob/rglob), filtrés par extension"""
+        rel = self._relative(directory)
+        if rel not in self._files_by_dir:
+            return []
+        
+        found = []
+        pending = [rel]
+        for current in pending:
+            base = self.project_path / current if current else self.project_path
+            for filename in self._files_by_dir[current]:
+                if suffixes is None or os.path.splitext(filename)[1] in suffixes:
+                    found.append(base / filename)
+            if recursive:
+                pending.extend(f"{current}/{d}" if current else d for d in self._subdirs_by_dir[current])
+        return found
+    
+    def directories(self) -> List[Path]:
+        """Dossiers indexés (racine comprise)"""
+        return [self.project_path / rel if rel else self.project_path for rel in self._files_by_dir]
+    
+    def relative_paths(self) -> set:
+        """Ensemble des chemins relatifs indexés"""
+        return {rel for paths in self._files_by_extension.values() for rel in paths}
+    
+    def files_by_extension(self, suffix: str) -> List[Path]:
+        """Tous les fichiers du projet ayant une extension donnée"""
+        return [self.project_path / rel for rel in self._files_by_extension.get(suffix.lower(), [])]
+    
+    def subproject_files(self, name: str) -> List[Path]:
+        """Tous les fichiers d'un sous-projet"""
+        return [self.project_path / rel for rel in self._files_by_subproject.get(name, [])]
+
+class PhaseProfiler:
+    """Télémétrie par phase d'analyse : temps, fichiers visités, octets lus, temps regex et hits de cache"""
+    
+    FIELDS = ("wall_time", "files_visited", "bytes_read", "regex_time", "cache_hits")
+    
+    # Phase à laquelle sont attribués les événements survenant hors de toute phase
+    UNATTRIBUTED = "(hors phase)"
+    
+    def __init__(self):
+        self.phases: Dict[str, Dict] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def _stats(self, name: str) -> Dict:
+        """Compteurs d'une phase (créés dans l'ordre de première apparition)"""
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = {key: 0 for key in self.FIELDS}
+            stats["wall_time"] = 0.0
+            stats["regex_time"] = 0.0
+        return stats
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Chronomètre une phase ; les événements du thread courant lui sont attribués"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        with self._lock:
+            self._stats(name)
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            with self._lock:
+                self.phases[name]["wall_time"] += elapsed
+    
+    def record(self, files_visited: int = 0, bytes_read: int = 0, regex_time: float = 0.0, cache_hits: int = 0):
+        """Attribue des événements à la phase en cours du thread courant (la plus interne)"""
+        stack = getattr(self._local, "stack", None)
+        name = stack[-1] if stack else self.UNATTRIBUTED
+        with self._lock:
+            stats = self._stats(name)
+            stats["files_visited"] += files_visited
+            stats["bytes_read"] += bytes_read
+            stats["regex_time"] += regex_time
+            stats["cache_hits"] += cache_hits
+    
+    def reset(self):
+        """Remet les compteurs à zéro"""
+        with self._lock:
+            self.phases.clear()
+    
+    def to_dict(self) -> Dict:
+        """Section « profile » du rapport"""
+        with self._lock:
+            phases = {
+                name: {key: round(value, 6) if isinstance(value, float) else value for key, value in stats.items()}
+                for name, stats in self.phases.items()
+            }
+        totals = {key: sum(stats[key] for stats in phases.values()) for key in ("files_visited", "bytes_read", "cache_hits")}
+        totals["regex_time"] = round(sum(stats["regex_time"] for stats in phases.values()), 6)
+        return {"phases": phases, "totals": totals}
+
+def profiled_phase(method):
+    """Décore une méthode d'analyseur pour la profiler sous le nom « Classe.méthode »"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.profiler.phase(f"{type(self).__name__}.{method.__name__}"):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+class ContentStore:
+    """Cache LRU du contenu des fichiers : chaque fichier est décodé une seule fois par analyse"""
+    
+    # Plafond mémoire par défaut (octets lus)
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, profiler: Optional[PhaseProfiler] = None):
+        self.max_bytes = max_bytes
+        self.profiler = profiler or PhaseProfiler()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Path, Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def read(self, path: Path) -> str:
+        """Retourne le texte du fichier, lu et décodé au plus une fois tant qu'il reste en cache"""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+                self.hits += 1
+            else:
+                self.misses += 1
+        
+        if entry is not None:
+            self.profiler.record(files_visited=1, cache_hits=1)
+            return entry[0]
+        raw = path.read_bytes()
+        self.profiler.record(files_visited=1, bytes_read=len(raw))
+        return self.decode(path, raw)
+    
+    def read_json(self, path: Path) -> Dict:
+        """Retourne le contenu JSON d'un fichier via le cache"""
+        return json.loads(self.read(path))
+    
+    def _evict(self):
+        """Évince les entrées les moins récemment utilisées au-delà du plafond"""
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+    
+    def clear(self):
+        """Vide le cache"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+    
+    def invalidate(self, path: Path):
+        """Oublie le contenu d'un fichier modifié"""
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+
+    def decode(self, path: Path, raw: bytes) -> str:
+        """Décode un contenu déjà lu et le conserve dans le cache"""
+        text = raw.decode('utf-8', errors='ignore')
+        
+        # Les fichiers plus gros que le plafond ne sont jamais conservés
+        with self._lock:
+            if path not in self._entries and len(raw) <= self.max_bytes:
+                self._entries[path] = (text, len(raw))
+                self.current_bytes += len(raw)
+                self._evict()
+        return text
+
+class LazyPattern:
+    """Expression régulière compilée au premier usage (le démarrage ne compile rien)"""
+    
+    def __init__(self, pattern: str, flags: int = 0):
+        self.pattern = pattern
+        self.flags = flags
+    
+    def __getattr__(self, name: str):
+        # Appelé seulement pour un attribut absent : la méthode est ensuite lue directement sur l'instance
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = getattr(re.compile(self.pattern, self.flags), name)
+        setattr(self, name, value)
+        return value
+
+class FeatureDetector:
+    """Détecteur compilé : toutes les caractéristiques déclarées d'un fichier en un seul passage
+    
+    Chaque caractéristique compte ses occurrences comme re.findall sur son propre motif (avec ses drapeaux) ;
+    l'expression combinée ne sert qu'à sauter les positions où aucune ne peut commencer. Elle est construite
+    au premier scan.
+    """
+    
+    # Drapeaux exprimables dans un groupe (?x:...) de l'expression combinée
+    SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"), (re.ASCII, "a"))
+    
+    def __init__(self, literals: Optional[Dict[str, List[str]]] = None, patterns: Optional[Dict[str, Tuple[str, int]]] = None):
+        self.literals = literals or {}
+        self.patterns = patterns or {}
+        self.names = list(self.literals) + list(self.patterns)
+    
+    @functools.cached_property
+    def _compiled(self) -> Tuple[Optional["re.Pattern"], Dict[str, List[Tuple]], List[Tuple]]:
+        """(positions candidates, caractéristiques à essayer selon le premier caractère, celles à essayer partout)
+        
+        Une caractéristique est (nom, motif compilé, nombre de groupes ou None pour un littéral).
+        """
+        # Un littéral est l'alternative de ses textes : « @StateObject » compte aussi pour « @State »
+        features = [(name, re.compile("|".join(re.escape(text) for text in texts)), None, {text[0] for text in texts})
+                    for name, texts in self.literals.items() if texts]
+        branches = [feature[1].pattern for feature in features]
+        for name, (pattern, flags) in self.patterns.items():
+            regex = re.compile(pattern, flags)
+            chars = None if flags & re.VERBOSE else self._leading_chars(pattern)
+            if chars is not None and flags & re.IGNORECASE:
+                chars = {variant for c in chars for variant in (c.lower(), c.upper())}
+            features.append((name, regex, regex.groups, chars))
+            scoped = "".join(letter for flag, letter in self.SCOPED_FLAGS if flags & flag)
+            branches.append(f"(?{scoped}:{pattern}\n)" if flags & re.VERBOSE else f"(?{scoped}:{pattern})" if scoped else f"(?:{pattern})")
+        if not features:
+            return None, {}, []
+        
+        # Anticipation de largeur nulle : chaque position est testée une seule fois, sans consommer le texte.
+        # Le filtre sur le premier caractère permet au moteur de sauter les positions sans candidat.
+        leading = set()
+        for feature in features:
+            leading = None if leading is None or feature[3] is None else leading | feature[3]
+        prefix = "(?=[" + "".join(re.escape(c) for c in sorted(leading)) + "])" if leading else ""
+        # Une référence arrière numérotée changerait de groupe une fois combinée : seul le premier caractère filtre alors
+        combinable = not any(re.search(r"\\[1-9]", pattern) for pattern, _ in self.patterns.values())
+        try:
+            candidates = re.compile(prefix + "(?=" + "|".join(branches) + ")") if combinable else None
+        except re.error:
+            # Motif non combinable (drapeaux globaux en ligne...)
+            candidates = None
+        if candidates is None:
+            candidates = re.compile(prefix or "(?=[\\s\\S])")
+        
+        always = [feature[:3] for feature in features if feature[3] is None]
+        by_char: Dict[str, List[Tuple]] = defaultdict(list)
+        for feature in features:
+            for c in feature[3] or ():
+                by_char[c].append(feature[:3])
+        for c in by_char:
+            by_char[c] += always
+        return candidates, dict(by_char), always
+    
+    @classmethod
+    def _leading_chars(cls, pattern: str) -> Optional[set]:
+        """Premiers caractères d'un motif simple : littéraux et groupes d'alternatives littérales"""
+        if not pattern:
+            return None
+        if pattern[0] == "(":
+            depth, end, i = 0, -1, 0
+            while i < len(pattern):
+                if pattern[i] == "\\":
+                    i += 2
+                    continue
+                if pattern[i] == "(":
+                    depth += 1
+                elif pattern[i] == ")":
+                    depth -= 1
+                    if depth == 0:
+                        end = i
+                        break
+                i += 1
+            if end == -1 or pattern[end + 1:end + 2] in ("?", "*", "{"):
+                return None
+            inner = pattern[1:end]
+            if inner.startswith("?:"):
+                inner = inner[2:]
+            elif inner.startswith("?"):
+                return None
+            
+            # Découper les alternatives de premier niveau
+            alternatives, depth, start, i = [], 0, 0, 0
+            while i < len(inner):
+                if inner[i] == "\\":
+                    i += 2
+                    continue
+                if inner[i] == "(":
+                    depth += 1
+                elif inner[i] == ")":
+                    depth -= 1
+                elif inner[i] == "|" and depth == 0:
+                    alternatives.append(inner[start:i])
+                    start = i + 1
+                i += 1
+            alternatives.append(inner[start:])
+            
+            chars = set()
+            for alternative in alternatives:
+                found = cls._leading_chars(alternative)
+                if found is None:
+                    return None
+                chars |= found
+            return chars
+        
+        if pattern[0] == "\\":
+            if len(pattern) < 2 or pattern[1].isalnum():
+                return None
+            first, width = pattern[1], 2
+        elif pattern[0] in ".[^$*+?{|)":
+            return None
+        else:
+            first, width = pattern[0], 1
+        if pattern[width:width + 1] in ("?", "*", "{"):
+            return None
+        return {first}
+    
+    def scan(self, content: str) -> Tuple[Dict[str, int], Dict[str, List]]:
+        """Retourne (nombre d'occurrences par caractéristique, captures des motifs à la manière de findall)"""
+        counts = dict.fromkeys(self.names, 0)
+        captures = {name: [] for name in self.patterns}
+        candidates, by_char, always = self._compiled
+        if candidates is None:
+            return counts, captures
+        
+        # Fin de la dernière occurrence retenue : les occurrences ne se chevauchent pas, comme avec findall
+        last_end = dict.fromkeys(self.names, -1)
+        
+        # Toutes les caractéristiques pouvant commencer ici sont essayées, pas seulement la première qui réussit
+        for candidate in candidates.finditer(content):
+            position = candidate.start()
+            for name, regex, group_count in by_char.get(content[position:position + 1], always):
+                if position < last_end[name]:
+                    continue
+                match = regex.match(content, position)
+                if match is None:
+                    continue
+                counts[name] += 1
+                last_end[name] = match.end()
+                if group_count == 0:
+                    captures[name].append(match.group())
+                elif group_count == 1:
+                    captures[name].append(match.group(1))
+                elif group_count is not None:
+                    captures[name].append(match.groups())
+        
+        return counts, captures
+
+# Commentaires et chaînes Swift (ignorés par le lexer) : commentaire de ligne et chaîne simple
+# consommés d'un bloc, sinon début de commentaire bloc, de chaîne brute, multiligne ou interpolée.
+# Le premier caractère est filtré par une classe, ce qui évite d'essayer chaque branche à chaque position.
+_SWIFT_SKIP = LazyPattern(r'[/"#](?:(?<=/)(?:/[^\n]*|\*)|(?<=")(?:(?!"")[^"\\\n]*(?:\\[^(\n][^"\\\n]*)*")?|(?<=#)#*")')
+
+# Jetons Swift : noms éventuellement qualifiés (self.init, APIService.shared), attributs @..., ponctuation
+# structurante et retours à la ligne (repères de numéro de ligne). Un identifiant non ASCII est découpé
+# en plusieurs jetons, sans effet sur la structure.
+_SWIFT_TOKEN = LazyPattern(r'[.@\w]+|[{}()\[\]<>:,=\n]', re.ASCII)
+
+# Parenthèses et chaînes à l'intérieur d'une interpolation \(...)
+_SWIFT_INTERPOLATION = LazyPattern(r'[()]|#*"')
+
+def _skip_block_comment(content: str, position: int) -> int:
+    """Fin d'un commentaire /* ... */ (les commentaires Swift s'imbriquent)"""
+    depth = 1
+    while depth:
+        close = content.find("*/", position)
+        if close < 0:
+            return len(content)
+        nested = content.find("/*", position, close)
+        if nested >= 0:
+            depth += 1
+            position = nested + 2
+        else:
+            depth -= 1
+            position = close + 2
+    return position
+
+def _skip_string(content: str, start: int, end: int) -> int:
+    """Fin d'une chaîne ouverte par content[start:end] (#*" ou #*\"\"\"), interpolations comprises"""
+    hashes = end - start - 1
+    multiline = content.startswith('""', end)
+    closing = ('"""' if multiline else '"') + "#" * hashes
+    escape = "\\" + "#" * hashes
+    position = end + 2 if multiline else end
+    
+    while True:
+        close = content.find(closing, position)
+        limit = close if close >= 0 else len(content)
+        escaped = content.find(escape, position, limit)
+        
+        # Chaîne sur une ligne non terminée : s'arrêter au retour à la ligne
+        if not multiline:
+            newline = content.find("\n", position, escaped if escaped >= 0 else limit)
+            if newline >= 0:
+                return newline
+        if escaped < 0:
+            return limit + len(closing) if close >= 0 else limit
+        
+        position = escaped + len(escape)
+        if content.startswith("(", position):
+            position = _skip_interpolation(content, position + 1)
+        else:
+            position += 1
+
+def _skip_interpolation(content: str, position: int) -> int:
+    """Fin d'une interpolation \\(...) dans une chaîne"""
+    depth = 1
+    while True:
+        match = _SWIFT_INTERPOLATION.search(content, position)
+        if match is None:
+            return len(content)
+        token = match.group()
+        if token == "(":
+            depth += 1
+            position = match.end()
+        elif token == ")":
+            depth -= 1
+            position = match.end()
+            if depth == 0:
+                return position
+        else:
+            position = _skip_string(content, match.start(), match.end())
+
+def tokenize_swift(content: str) -> Tuple[List[str], int]:
+    """Découpe un source Swift en jetons en un seul passage, sans commentaires ni chaînes
+    
+    Chaque retour à la ligne (y compris dans un commentaire ou une chaîne ignorés) produit un jeton "\\n".
+    Retourne (jetons, nombre de commentaires de documentation /// ou /**).
+    """
+    tokens: List[str] = []
+    doc_comments = 0
+    position = 0
+    find_token = _SWIFT_TOKEN.findall
+    find_skip = _SWIFT_SKIP.search
+    
+    while True:
+        match = find_skip(content, position)
+        if match is None:
+            tokens.extend(find_token(content, position))
+            return tokens, doc_comments
+        
+        # Le code situé avant le commentaire ou la chaîne est découpé d'un bloc
+        start = match.start()
+        tokens.extend(find_token(content, position, start))
+        opener = match.group()
+        if opener[0] == "/":
+            if opener[1] == "/":
+                if opener.startswith("///"):
+                    doc_comments += 1
+                position = match.end()
+            else:
+                if content.startswith("/**", start) and not content.startswith("/**/", start):
+                    doc_comments += 1
+                position = _skip_block_comment(content, start + 2)
+        elif opener[0] == '"' and len(opener) > 1:
+            position = match.end()
+        else:
+            position = _skip_string(content, start, match.end())
+        
+        # Commentaires bloc et chaînes multilignes : conserver leurs retours à la ligne
+        if opener[1:2] != "/":
+            breaks = content.count("\n", start, position)
+            if breaks:
+                tokens.extend(["\n"] * breaks)
+
+# Mots-clés introduisant un type ; « class » suivi d'une déclaration est un modificateur
+SWIFT_TYPE_KEYWORDS = frozenset({"class", "struct", "enum", "protocol", "extension", "actor"})
+
+SWIFT_MODIFIERS = frozenset({
+    "private", "fileprivate", "internal", "public", "open", "static", "final", "override",
+    "lazy", "weak", "unowned", "mutating", "nonmutating", "nonisolated", "dynamic",
+    "required", "convenience", "optional", "indirect"
+})
+
+# Jetons qui terminent le type d'une propriété déclarée sans valeur initiale
+SWIFT_DECLARATION_STARTS = SWIFT_MODIFIERS | SWIFT_TYPE_KEYWORDS | frozenset({
+    "var", "let", "func", "init", "deinit", "subscript", "case", "typealias", "associatedtype", "import", "}"
+})
+
+# Attributs qui ne sont pas des property wrappers
+SWIFT_DECLARATION_ATTRIBUTES = frozenset({
+    "objc", "nonobjc", "objcMembers", "MainActor", "available", "discardableResult", "inlinable",
+    "usableFromInline", "frozen", "dynamicMemberLookup", "propertyWrapper", "resultBuilder", "main",
+    "escaping", "autoclosure", "Sendable", "preconcurrency", "IBOutlet", "IBAction", "IBInspectable",
+    "NSManaged", "GKInspectable", "ViewBuilder", "testable", "unknown"
+})
+
+# Property wrappers par lesquels une vue SwiftUI observe un objet (ViewModel, service)
+SWIFT_OBSERVABLE_WRAPPERS = ("StateObject", "ObservedObject", "EnvironmentObject")
+
+# Seuls ces jetons font évoluer l'état de l'extracteur (Preview : bloc #Preview)
+_SWIFT_STRUCTURAL = SWIFT_DECLARATION_STARTS | frozenset({"{", "(", "Preview"})
+
+def _skip_balanced(tokens: List[str], index: int, opening: str, closing: str) -> int:
+    """Indice suivant le délimiteur fermant correspondant à tokens[index] (== opening)"""
+    depth = 0
+    for position in range(index, len(tokens)):
+        token = tokens[position]
+        if token == opening:
+            depth += 1
+        elif token == closing:
+            depth -= 1
+            if depth == 0:
+                return position + 1
+    return len(tokens)
+
+def _is_stored_property(tokens: List[str], index: int) -> bool:
+    """Une propriété (var/let en tokens[index]) est stockée sauf si un bloc get/set la suit"""
+    depth = 0
+    for position in range(index + 2, len(tokens)):
+        token = tokens[position]
+        if token in "([<":
+            depth += 1
+        elif token in ")]>":
+            depth = max(0, depth - 1)
+        elif depth == 0:
+            if token == "=":
+                return True
+            if token == "{":
+                # willSet/didSet : propriété stockée observée
+                following = next((t for t in tokens[position + 1:position + 8] if t != "\n"), "")
+                return following in ("willSet", "didSet")
+            if token in SWIFT_DECLARATION_STARTS or token[0] == "@":
+                return True
+    return True
+
+def _parse_object_binding(tokens: List[str], index: int) -> Tuple[str, str, int]:
+    """Lit « var nom: Type = Type() » (var/let en tokens[index]) ; retourne (type, origine, fin de l'initialiseur)
+    
+    L'origine vaut "init" pour une instanciation, "shared" pour un singleton, "" sinon.
+    """
+    type_name, origin = "", ""
+    position = index + 2
+    count = len(tokens)
+    if position < count and tokens[position] == ":" and position + 1 < count:
+        type_name = tokens[position + 1].rsplit(".", 1)[-1]
+        position += 2
+    while position < count and tokens[position] not in ("=", "{", "\n"):
+        position += 1
+    if position + 1 < count and tokens[position] == "=":
+        value = tokens[position + 1]
+        parts = value.split(".")
+        if "shared" in parts[1:]:
+            type_name, origin = parts[parts.index("shared", 1) - 1], "shared"
+        elif value[:1].isupper() and position + 2 < count and tokens[position + 2] == "(":
+            type_name, origin = parts[-1], "init"
+            return type_name, origin, _skip_balanced(tokens, position + 2, "(", ")")
+        position += 2
+    return type_name, origin, position
+
+def _parse_type_declaration(tokens: List[str], index: int) -> Tuple[int, List[str]]:
+    """Lit « mot-clé Nom<...>: A, B where ... » ; retourne (indice de l'accolade ouvrante, conformances)"""
+    position = index + 2
+    if position < len(tokens) and tokens[position] == "<":
+        position = _skip_balanced(tokens, position, "<", ">")
+    
+    conformances = []
+    if position < len(tokens) and tokens[position] == ":":
+        position += 1
+        depth = 0
+        while position < len(tokens) and tokens[position] != "{":
+            token = tokens[position]
+            if token == "where" and depth == 0:
+                break
+            if token == "<":
+                depth += 1
+            elif token == ">":
+                depth -= 1
+            elif depth == 0 and (token[0].isalpha() or token[0] == "_"):
+                # Nom qualifié (Swift.Codable) : le dernier composant l'emporte
+                conformances.append(token.rsplit(".", 1)[-1])
+            position += 1
+    
+    while position < len(tokens) and tokens[position] != "{":
+        position += 1
+    return position, conformances
+
+def analyze_swift_tokens(tokens: List[str]) -> Dict:
+    """Compte propriétés stockées, fonctions, property wrappers et conformances d'un flux de jetons Swift"""
+    stored_properties = 0
+    functions = 0
+    static_functions = 0
+    singleton = False
+    shared_var = False
+    wrappers: Dict[str, int] = defaultdict(int)
+    conformances: Dict[str, None] = {}
+    declarations: List[List] = []
+    bindings: List[List] = []
+    shared_types: List[List] = []
+    # Type instancié (Type(...)) -> [type, première ligne, occurrences], hors aperçus et @StateObject
+    constructions: Dict[str, List] = {}
+    line = 1
+    line_index = 0
+    
+    # Portées ouvertes : nom du type pour un corps de type, False pour un bloc de code
+    scopes: List = []
+    type_body_pending = False
+    # Aperçus (#Preview, PreviewProvider) : profondeur de la portée ouverte, instanciations ignorées
+    preview_pending = False
+    preview_level: Optional[int] = None
+    owned_until = 0
+    attributes: List[str] = []
+    modifiers: set = set()
+    
+    structural = _SWIFT_STRUCTURAL
+    count = len(tokens)
+    index = 0
+    while index < count:
+        token = tokens[index]
+        if token not in structural and token[0] != "@":
+            index += 1
+            continue
+        
+        if token == "{":
+            if preview_pending and preview_level is None:
+                preview_level = len(scopes)
+            preview_pending = False
+            scopes.append(type_body_pending)
+            type_body_pending = False
+            attributes, modifiers = [], set()
+        elif token == "}":
+            if scopes:
+                scopes.pop()
+            if preview_level == len(scopes):
+                preview_level = None
+            attributes, modifiers = [], set()
+        elif token == "(":
+            previous = tokens[index - 1] if index else ""
+            if previous == "StateObject":
+                # StateObject(wrappedValue: Type(...)) : autoclosure évaluée une seule fois
+                owned_until = max(owned_until, _skip_balanced(tokens, index, "(", ")"))
+            elif previous[:1].isupper() and "." not in previous and preview_level is None and index >= owned_until:
+                line += tokens[line_index:index].count("\n")
+                line_index = index
+                construction = constructions.get(previous)
+                if construction is None:
+                    constructions[previous] = [previous, line, 1]
+                else:
+                    construction[2] += 1
+        elif token == "Preview":
+            preview_pending = True
+        elif token[0] == "@":
+            attributes.append(token[1:])
+            # Arguments de l'attribut : @Environment(\.dismiss)
+            if index + 1 < count and tokens[index + 1] == "(":
+                index = _skip_balanced(tokens, index + 1, "(", ")")
+                continue
+        elif token in SWIFT_MODIFIERS:
+            modifiers.add(token)
+        elif token in SWIFT_TYPE_KEYWORDS:
+            following = tokens[index + 1] if index + 1 < count else ""
+            if token == "class" and following in SWIFT_DECLARATION_STARTS:
+                modifiers.add("static")
+            elif not (following[:1].isalpha() or following[:1] == "_"):
+                # Étiquette ou paramètre homonyme (didOpenWithProtocol protocol: String)
+                attributes, modifiers = [], set()
+            else:
+                line += tokens[line_index:index].count("\n")
+                line_index = index
+                declarations.append([token, following, line])
+                index, inherited = _parse_type_declaration(tokens, index)
+                conformances.update(dict.fromkeys(inherited))
+                preview_pending = preview_pending or "PreviewProvider" in inherited
+                type_body_pending = following
+                attributes, modifiers = [], set()
+                continue
+        elif token == "func":
+            functions += 1
+            if "static" in modifiers:
+                static_functions += 1
+            attributes, modifiers = [], set()
+        elif token in ("var", "let"):
+            # Seules les propriétés déclarées au niveau d'un type (ou du fichier) comptent
+            if not scopes or scopes[-1]:
+                if _is_stored_property(tokens, index):
+                    stored_properties += 1
+                    for attribute in attributes:
+                        if attribute not in SWIFT_DECLARATION_ATTRIBUTES:
+                            wrappers[attribute] += 1
+                wrapper = next((a for a in attributes if a in SWIFT_OBSERVABLE_WRAPPERS), None)
+                if wrapper is not None:
+                    type_name, origin, end = _parse_object_binding(tokens, index)
+                    if type_name:
+                        line += tokens[line_index:index].count("\n")
+                        line_index = index
+                        bindings.append([wrapper, type_name, line, origin])
+                        # @StateObject : instance créée une seule fois par SwiftUI
+                        if wrapper == "StateObject":
+                            owned_until = end
+                if "static" in modifiers and index + 1 < count and tokens[index + 1] == "shared":
+                    if token == "let":
+                        singleton = True
+                    else:
+                        shared_var = True
+                    if scopes:
+                        shared_types.append([scopes[-1], token])
+            attributes, modifiers = [], set()
+        else:
+            attributes, modifiers = [], set()
+        index += 1
+    
+    return {
+        "stored_properties": stored_properties,
+        "functions": functions,
+        "static_functions": static_functions,
+        "singleton": singleton,
+        "shared_var": shared_var,
+        "property_wrappers": dict(wrappers),
+        "conformances": list(conformances),
+        "declarations": declarations,
+        "bindings": bindings,
+        "shared_types": shared_types,
+        "constructions": list(constructions.values())
+    }
+
+# Caractéristiques JavaScript détectées en un seul passage
+JS_DETECTOR = FeatureDetector(
+    literals={
+        "documented": ["///", "/*"],
+        "try": ["try"],
+        "catch": ["catch"],
+        "protected": ["auth", "requireAuth", "verifyToken"],
+        "class_based": ["class"],
+        "module_exports": ["module.exports"]
+    },
+    patterns={
+        "async_methods": (r'async\s+(\w+)', 0),
+        "hooks": (r'use(\w+)', 0),
+        "api_calls": (r'(fetch|axios|\.get|\.post|\.put|\.delete)', 0)
+    }
+)
+
+def swift_type_references(identifiers: set) -> List[str]:
+    """Noms de types (initiale majuscule) utilisés dans un fichier, composants qualifiés inclus"""
+    references = set()
+    for identifier in identifiers:
+        if "." in identifier:
+            references.update(part for part in identifier.split(".") if part[:1].isupper())
+        elif identifier[:1].isupper():
+            references.add(identifier)
+    return sorted(references)
+
+def swift_shared_uses(identifiers: set) -> List[str]:
+    """Types dont le singleton (Type.shared) est utilisé dans un fichier"""
+    shared = set()
+    for identifier in identifiers:
+        if ".shared" in identifier:
+            parts = identifier.split(".")
+            shared.update(parts[i - 1] for i in range(1, len(parts)) if parts[i] == "shared" and parts[i - 1][:1].isupper())
+    return sorted(shared)
+
+def extract_swift_features(content: str) -> Dict:
+    """Extrait les caractéristiques d'un fichier Swift à partir de son flux de jetons"""
+    tokens, doc_comments = tokenize_swift(content)
+    structure = analyze_swift_tokens(tokens)
+    wrappers = structure["property_wrappers"]
+    conformances = structure["conformances"]
+    identifiers = set(tokens)
+    return {
+        "symbols": structure["declarations"],
+        "references": swift_type_references(identifiers),
+        "documented": doc_comments > 0,
+        "singleton": structure["singleton"],
+        "shared_instance": structure["singleton"] or structure["shared_var"],
+        "published": wrappers.get("Published", 0),
+        "async_await": "async" in identifiers and "await" in identifiers,
+        "combine": "Combine" in identifiers,
+        "state_object": "StateObject" in wrappers,
+        "observed_object": "ObservedObject" in wrappers,
+        "state": "State" in wrappers,
+        "codable": any(name in conformances for name in ("Codable", "Decodable", "Encodable")),
+        "properties": structure["stored_properties"],
+        "methods": structure["functions"],
+        "property_wrappers": wrappers,
+        "conformances": conformances,
+        "object_bindings": structure["bindings"],
+        "shared_types": structure["shared_types"],
+        "constructions": structure["constructions"],
+        "shared_uses": swift_shared_uses(identifiers),
+        "factory": structure["static_functions"] > 0 and any("Factory" in name for name in identifiers),
+        "repository": any("Repository" in name for name in identifiers)
+    }
+
+# Jetons JavaScript : commentaires et expressions régulières littérales (écartés ensuite), chaînes et
+# gabarits (conservés avec leurs délimiteurs), identifiants, nombres, puis tout autre caractère isolé
+_JS_TOKEN = LazyPattern(r"""
+    //[^\n]*
+  | /\*[\s\S]*?\*/
+  | '(?:[^'\\\n]|\\.)*'
+  | "(?:[^"\\\n]|\\.)*"
+  | `(?:[^`\\]|\\.)*`
+  | (?:(?<=[=(,:!&|?{};\[])|(?<=[=(,:!&|?{};\[]\s))/(?![/*])(?:[^/\\\n\[]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*
+  | [A-Za-z_$][\w$]*
+  | \d[\w.]*
+  | \n
+  | \S
+""", re.VERBOSE)
+
+# Indices qu'un fichier déclare ou monte des routes Express (sinon le découpage est inutile)
+ROUTING_HINTS = ("Router", "express", ".use(")
+
+# Méthodes de routage Express retenues dans la table des routes
+ROUTE_METHODS = frozenset({"get", "post", "put", "delete", "patch", "all", "options", "head"})
+
+def _join_route(prefix: str, path: str) -> str:
+    """Concatène un préfixe de montage et un chemin de route Express"""
+    parts = [part.strip("/") for part in (prefix, path) if part.strip("/")]
+    return "/" + "/".join(parts)
+
+def tokenize_js(content: str) -> List[str]:
+    """Découpe un source JavaScript en jetons, sans commentaires ni expressions régulières littérales
+    
+    Chaque retour à la ligne produit un jeton "\\n", y compris dans un commentaire bloc ou un gabarit.
+    """
+    tokens = []
+    for token in _JS_TOKEN.findall(content):
+        first = token[0]
+        if first == "/" and len(token) > 1:
+            if token[1] == "*":
+                tokens.extend(["\n"] * token.count("\n"))
+            continue
+        tokens.append(token)
+        if first == "`":
+            tokens.extend(["\n"] * token.count("\n"))
+    return tokens
+
+# Mots-clés JavaScript exclus des références
+JS_KEYWORDS = frozenset({
+    "async", "await", "break", "case", "catch", "class", "const", "continue", "default", "delete", "do",
+    "else", "export", "extends", "false", "finally", "for", "from", "function", "if", "import", "in",
+    "instanceof", "let", "new", "null", "of", "return", "static", "super", "switch", "this", "throw",
+    "true", "try", "typeof", "undefined", "var", "void", "while", "yield", "require", "module", "exports"
+})
+
+def extract_js_symbols(tokens: List[str]) -> Tuple[List[List], List[str]]:
+    """Classes, fonctions et exports déclarés (avec leur ligne) et identifiants référencés d'un fichier JS"""
+    symbols: List[List] = []
+    references = set()
+    depth = 0
+    line = 1
+    count = len(tokens)
+    
+    def next_token(position: int) -> Tuple[str, int]:
+        while position < count and tokens[position] == "\n":
+            position += 1
+        return (tokens[position], position) if position < count else ("", count)
+    
+    for index, token in enumerate(tokens):
+        if token == "\n":
+            line += 1
+            continue
+        if token == "{":
+            depth += 1
+            continue
+        if token == "}":
+            depth = max(0, depth - 1)
+            continue
+        if not (token[0].isalpha() or token[0] in "_$"):
+            continue
+        if token not in JS_KEYWORDS:
+            references.add(token)
+            continue
+        
+        following, position = next_token(index + 1)
+        if token == "class" and following and following not in JS_KEYWORDS and following != "{":
+            symbols.append(["class", following, line])
+        elif token == "function" and depth == 0 and following not in ("", "(", "*"):
+            symbols.append(["function", following, line])
+        elif token in ("const", "let", "var") and depth == 0 and following not in ("", "{", "["):
+            # const nom = async (...) => / function
+            value, value_position = next_token(position + 1)
+            if value == "=":
+                value, value_position = next_token(value_position + 1)
+                if value == "async":
+                    value, value_position = next_token(value_position + 1)
+                if value == "function":
+                    symbols.append(["function", following, line])
+                elif value == "(":
+                    _, after = _split_arguments(tokens, value_position)
+                    if tokens[after:after + 2] == ["=", ">"]:
+                        symbols.append(["function", following, line])
+                elif tokens[value_position + 1:value_position + 3] == ["=", ">"]:
+                    symbols.append(["function", following, line])
+        elif token == "exports" or token == "module":
+            # module.exports = nom | { a, b } ; exports.nom = ...
+            if token == "module":
+                if tokens[index + 1:index + 3] != [".", "exports"]:
+                    continue
+                position = index + 3
+            else:
+                if index > 0 and tokens[index - 1] == ".":
+                    continue
+                position = index + 1
+            if tokens[position:position + 1] == ["."] and position + 1 < count:
+                symbols.append(["export", tokens[position + 1], line])
+            elif tokens[position:position + 1] == ["="]:
+                value, value_position = next_token(position + 1)
+                if value == "{":
+                    arguments, _ = _split_arguments(tokens, value_position)
+                    for argument in arguments:
+                        names = [t for t in argument if t != "\n"]
+                        if names and names[0] not in ("...",):
+                            symbols.append(["export", names[0], line])
+                elif value == "new":
+                    symbols.append(["export", next_token(value_position + 1)[0], line])
+                elif value and (value[0].isalpha() or value[0] in "_$") and value not in JS_KEYWORDS:
+                    symbols.append(["export", value, line])
+        elif token == "export":
+            # export default nom | export function/class/const nom | export { a, b }
+            if following == "default":
+                following, position = next_token(position + 1)
+                if following in ("function", "class", "async"):
+                    name, _ = next_token(position + 1)
+                    if following == "async":
+                        name, _ = next_token(next_token(position + 1)[1] + 1)
+                    symbols.append(["export", name if name not in ("(", "{", "") else "default", line])
+                elif following and following[0].isalpha():
+                    symbols.append(["export", following, line])
+            elif following == "{":
+                arguments, _ = _split_arguments(tokens, position)
+                for argument in arguments:
+                    names = [t for t in argument if t != "\n"]
+                    if names:
+                        symbols.append(["export", names[-1], line])
+            elif following in ("function", "class", "const", "let", "var", "async"):
+                name, name_position = next_token(position + 1)
+                if name == "function":
+                    name, _ = next_token(name_position + 1)
+                symbols.append(["export", name, line])
+    
+    return symbols, sorted(references)
+
+def _is_string_token(token: str) -> bool:
+    """Chaîne ou gabarit littéral"""
+    return token[0] in "'\"`"
+
+def _split_arguments(tokens: List[str], index: int) -> Tuple[List[List[str]], int]:
+    """Arguments d'un appel dont la parenthèse ouvrante est tokens[index] ; retourne (arguments, indice suivant)"""
+    arguments: List[List[str]] = []
+    current: List[str] = []
+    depth = 0
+    for position in range(index, len(tokens)):
+        token = tokens[position]
+        if token in "([{":
+            depth += 1
+            if depth == 1:
+                continue
+        elif token in ")]}":
+            depth -= 1
+            if depth == 0:
+                if current:
+                    arguments.append(current)
+                return arguments, position + 1
+        elif token == "," and depth == 1:
+            arguments.append(current)
+            current = []
+            continue
+        current.append(token)
+    if current:
+        arguments.append(current)
+    return arguments, len(tokens)
+
+def _argument_label(argument: List[str]) -> str:
+    """Nom lisible d'un argument de routage : auth, auth.admin, requireRole, [body] ou <inline>"""
+    if not argument:
+        return ""
+    first = argument[0]
+    if first in ("async", "function") or first == "(" or (len(argument) > 1 and argument[1] == "=" and argument[2:3] == [">"]):
+        return "<inline>"
+    if first == "[":
+        names = [token for token in argument[1:] if token[0].isalpha() or token[0] in "_$"]
+        return f"[{names[0]}]" if names else "[]"
+    label = first
+    position = 1
+    while position + 1 < len(argument) and argument[position] == ".":
+        label += "." + argument[position + 1]
+        position += 2
+    return label
+
+def _require_target(argument: List[str]) -> Optional[str]:
+    """Module d'un argument de la forme require('./chemin')"""
+    if len(argument) >= 4 and argument[0] == "require" and argument[1] == "(" and _is_string_token(argument[2]):
+        return argument[2][1:-1]
+    return None
+
+def extract_route_declarations(tokens: List[str]) -> Dict:
+    """Routes, montages, routeurs et modules requis déclarés dans un fichier Express
+    
+    Les routes sont des lignes [propriétaire, méthode, chemin, middlewares, handler] et les montages des
+    lignes [propriétaire, préfixe, arguments] où chaque argument est ["require", module] ou ["name", libellé].
+    """
+    routers: List[str] = []
+    apps: List[str] = []
+    requires: Dict[str, str] = {}
+    routes: List[List] = []
+    mounts: List[List] = []
+    exports: Optional[str] = None
+    count = len(tokens)
+    
+    for index, token in enumerate(tokens):
+        following = tokens[index + 1] if index + 1 < count else ""
+        
+        # const nom = express.Router() / express() / require('module')
+        if token in ("const", "let", "var") and index + 3 < count:
+            target = tokens[index + 1]
+            value = tokens[index + 3:index + 8]
+            if tokens[index + 2] == "=":
+                if value[:3] == ["express", ".", "Router"] or value[:2] == ["Router", "("]:
+                    routers.append(target)
+                elif value[:2] == ["express", "("]:
+                    apps.append(target)
+                elif value[:2] == ["require", "("] and len(value) > 2 and _is_string_token(value[2]):
+                    requires[target] = value[2][1:-1]
+            elif target == "{":
+                # const { a, b: c } = require('module')
+                arguments, position = _split_arguments(tokens, index + 1)
+                if tokens[position:position + 3] == ["=", "require", "("] and position + 3 < count and _is_string_token(tokens[position + 3]):
+                    for argument in arguments:
+                        if argument:
+                            requires[argument[-1]] = tokens[position + 3][1:-1]
+            continue
+        
+        # module.exports = routeur
+        if token == "module" and tokens[index + 1:index + 4] == [".", "exports", "="] and index + 4 < count:
+            exports = tokens[index + 4]
+            continue
+        
+        if following != "." or index + 3 >= count or tokens[index + 3] != "(":
+            continue
+        member = tokens[index + 2]
+        
+        if member in ROUTE_METHODS:
+            arguments, _ = _split_arguments(tokens, index + 3)
+            if arguments and len(arguments[0]) == 1 and _is_string_token(arguments[0][0]):
+                labels = [_argument_label(argument) for argument in arguments[1:]]
+                routes.append([token, member.upper(), arguments[0][0][1:-1], labels[:-1], labels[-1] if labels else ""])
+        elif member == "route":
+            # routeur.route('/chemin').get(...).post(...)
+            arguments, position = _split_arguments(tokens, index + 3)
+            if not arguments or len(arguments[0]) != 1 or not _is_string_token(arguments[0][0]):
+                continue
+            path = arguments[0][0][1:-1]
+            while position + 2 < count and tokens[position] == "." and tokens[position + 1] in ROUTE_METHODS and tokens[position + 2] == "(":
+                method = tokens[position + 1].upper()
+                handlers, position = _split_arguments(tokens, position + 2)
+                labels = [_argument_label(argument) for argument in handlers]
+                routes.append([token, method, path, labels[:-1], labels[-1] if labels else ""])
+        elif member == "use":
+            arguments, _ = _split_arguments(tokens, index + 3)
+            prefix = ""
+            if arguments and len(arguments[0]) == 1 and _is_string_token(arguments[0][0]):
+                prefix = arguments[0].pop()[1:-1]
+                arguments = arguments[1:]
+            targets = []
+            for argument in arguments:
+                module = _require_target(argument)
+                targets.append(["require", module] if module is not None else ["name", _argument_label(argument)])
+            mounts.append([token, prefix, targets])
+    
+    # Seuls les routeurs et applications Express (ou les paramètres nommés router/app) déclarent des routes
+    owners = set(routers) | set(apps) | {"router", "app"}
+    return {
+        "routers": routers,
+        "apps": apps,
+        "requires": requires,
+        "routes": [route for route in routes if route[0] in owners],
+        "mounts": [mount for mount in mounts if mount[0] in owners],
+        "exports": exports
+    }
+
+def extract_js_imports(tokens: List[str]) -> List[str]:
+    """Modules importés par un fichier : require('x'), import ... from 'x', import 'x', import('x'), export ... from 'x'"""
+    imports: Dict[str, None] = {}
+    count = len(tokens)
+    for index, token in enumerate(tokens):
+        if token in ("require", "import") and index + 2 < count and tokens[index + 1] == "(" and _is_string_token(tokens[index + 2]):
+            imports[tokens[index + 2][1:-1]] = None
+        elif token in ("from", "import") and index + 1 < count and tokens[index + 1][0] in "'\"":
+            if token == "from" or index == 0 or tokens[index - 1] != ".":
+                imports[tokens[index + 1][1:-1]] = None
+    return list(imports)
+
+# Décorateurs de relation TypeORM -> type de relation (forme EntitySchema)
+TYPEORM_RELATIONS = {"OneToOne": "one-to-one", "OneToMany": "one-to-many", "ManyToOne": "many-to-one", "ManyToMany": "many-to-many"}
+
+def _object_entries(tokens: List[str], index: int) -> Dict[str, List[str]]:
+    """Entrées « clé: valeur » d'un objet littéral dont l'accolade ouvrante est tokens[index]"""
+    entries = {}
+    for entry in _split_arguments(tokens, index)[0]:
+        if len(entry) >= 2 and entry[1] == ":":
+            entries[entry[0][1:-1] if _is_string_token(entry[0]) else entry[0]] = entry[2:]
+    return entries
+
+def _string_value(value: List[str]) -> str:
+    """Valeur d'une chaîne littérale seule ("" sinon)"""
+    return value[0][1:-1] if len(value) == 1 and _is_string_token(value[0]) else ""
+
+def _relation_target(argument: List[str]) -> str:
+    """Entité cible : 'User', User ou () => User"""
+    names = [token for token in argument if token[0].isalpha() or token[0] in "_$'\""]
+    if not names:
+        return ""
+    return names[-1][1:-1] if _is_string_token(names[-1]) else names[-1]
+
+def extract_entities(tokens: List[str]) -> List[Dict]:
+    """Entités TypeORM : new EntitySchema({...}) ou classes @Entity, avec colonnes et relations"""
+    entities = []
+    count = len(tokens)
+    for index, token in enumerate(tokens):
+        if token == "EntitySchema" and tokens[index + 1:index + 3] == ["(", "{"]:
+            fields = _object_entries(tokens, index + 2)
+            columns = fields.get("columns", [])
+            relations = []
+            declared = fields.get("relations", [])
+            if declared[:1] == ["{"]:
+                for name, value in _object_entries(declared, 0).items():
+                    attributes = _object_entries(value, 0) if value[:1] == ["{"] else {}
+                    relations.append([name, _string_value(attributes.get("type", [])), _relation_target(attributes.get("target", []))])
+            entities.append({
+                "name": _string_value(fields.get("name", [])),
+                "table": _string_value(fields.get("tableName", [])),
+                "columns": len(_object_entries(columns, 0)) if columns[:1] == ["{"] else 0,
+                "relations": relations
+            })
+        elif token == "@" and index + 1 < count and tokens[index + 1] == "Entity":
+            # Classe décorée : colonnes et relations sont les décorateurs du corps de la classe
+            arguments, position = _split_arguments(tokens, index + 2) if tokens[index + 2:index + 3] == ["("] else ([], index + 2)
+            while position < count and tokens[position] != "class":
+                position += 1
+            if position + 2 >= count:
+                continue
+            name = tokens[position + 1]
+            while position < count and tokens[position] != "{":
+                position += 1
+            end = _skip_balanced(tokens, position, "{", "}")
+            columns = 0
+            relations = []
+            cursor = position
+            while cursor < end - 1:
+                if tokens[cursor] == "@":
+                    decorator = tokens[cursor + 1]
+                    if decorator.endswith("Column"):
+                        columns += 1
+                    elif decorator in TYPEORM_RELATIONS and tokens[cursor + 2:cursor + 3] == ["("]:
+                        decorator_arguments, after = _split_arguments(tokens, cursor + 2)
+                        target = _relation_target(decorator_arguments[0]) if decorator_arguments else ""
+                        relations.append([tokens[after] if after < end else "", TYPEORM_RELATIONS[decorator], target])
+                        cursor = after
+                        continue
+                cursor += 1
+            entities.append({
+                "name": name,
+                "table": _string_value(arguments[0]) if arguments else "",
+                "columns": columns,
+                "relations": relations
+            })
+    return entities
+
+def extract_js_features(content: str) -> Dict:
+    """Extrait les caractéristiques d'un fichier JavaScript"""
+    counts, captures = JS_DETECTOR.scan(content)
+    tokens = tokenize_js(content)
+    symbols, references = extract_js_symbols(tokens)
+    code = [token for token in tokens if token != "\n"]
+    routing = None
+    if any(hint in content for hint in ROUTING_HINTS):
+        routing = extract_route_declarations(code)
+    routes = routing["routes"] if routing else []
+    entities = extract_entities(code) if "EntitySchema" in content or "@Entity" in content else []
+    http_methods = defaultdict(int)
+    for _, method, _, _, _ in routes:
+        http_methods[method] += 1
+    
+    return {
+        "symbols": symbols,
+        "references": references,
+        "imports": extract_js_imports(code),
+        "documented": counts["documented"] > 0,
+        "error_handling": counts["try"] > 0 and counts["catch"] > 0,
+        "http_methods": dict(http_methods),
+        "protected": counts["protected"] > 0,
+        "endpoints": [f"{method} {path}" for _, method, path, _, _ in routes],
+        "async_methods": counts["async_methods"],
+        "class_based": counts["class_based"] > 0,
+        "module_exports": counts["module_exports"] > 0,
+        "relations": sum(len(entity["relations"]) for entity in entities),
+        "entities": entities,
+        "hooks": dict(Counter(captures["hooks"])),
+        "api_calls": dict(Counter(captures["api_calls"])),
+        "routing": routing
+    }
+
+# Extracteur par type de fichier : (clé du type, fonction d'extraction)
+FEATURE_EXTRACTORS = {
+    ".swift": ("swift", extract_swift_features),
+    ".js": ("js", extract_js_features),
+    ".jsx": ("js", extract_js_features),
+    ".mjs": ("js", extract_js_features),
+    ".ts": ("js", extract_js_features),
+    ".tsx": ("js", extract_js_features)
+}
+
+class FeatureRecord:
+    """Caractéristiques d'un fichier en mémoire : enregistrement compact (__slots__) lu comme un dict
+    
+    Les extracteurs produisent des dicts (cache, processus de travail) ; FeatureStore les convertit
+    une fois reçus. Les noms partagés entre fichiers sont internés et les listes imbriquées deviennent
+    des tuples. to_dict() redonne la forme sérialisée.
+    """
+    
+    __slots__ = ()
+    # Listes de chaînes internées / listes d'enregistrements [chaîne, ..., entier] convertis en tuples
+    INTERNED: Tuple[str, ...] = ()
+    NESTED: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FeatureRecord":
+        record = cls.__new__(cls)
+        intern = sys.intern
+        for key in cls.__slots__:
+            value = data.get(key)
+            if key in cls.INTERNED:
+                value = tuple(intern(item) for item in value or ())
+            elif key in cls.NESTED:
+                value = tuple(tuple(intern(item) if isinstance(item, str) else item for item in entry) for entry in value or ())
+            elif isinstance(value, dict):
+                value = {intern(name): count for name, count in value.items()}
+            setattr(record, key, value)
+        return record
+    
+    def to_dict(self) -> Dict:
+        """Forme sérialisable (listes JSON)"""
+        data = {}
+        for key in self.__slots__:
+            value = getattr(self, key)
+            if key in self.NESTED:
+                value = [list(entry) for entry in value]
+            elif key in self.INTERNED:
+                value = list(value)
+            data[key] = value
+        return data
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+class SwiftFeatures(FeatureRecord):
+    """Caractéristiques d'un fichier Swift"""
+    
+    __slots__ = (
+        "symbols", "references", "documented", "singleton", "shared_instance", "published", "async_await",
+        "combine", "state_object", "observed_object", "state", "codable", "properties", "methods",
+        "property_wrappers", "conformances", "object_bindings", "shared_types", "constructions", "shared_uses",
+        "factory", "repository", "lines"
+    )
+    INTERNED = ("references", "conformances", "shared_uses")
+    NESTED = ("symbols", "object_bindings", "shared_types", "constructions")
+
+class JSFeatures(FeatureRecord):
+    """Caractéristiques d'un fichier JavaScript"""
+    
+    __slots__ = (
+        "symbols", "references", "imports", "documented", "error_handling", "http_methods", "protected",
+        "endpoints", "async_methods", "class_based", "module_exports", "relations", "entities", "hooks",
+        "api_calls", "routing", "lines"
+    )
+    INTERNED = ("references", "imports")
+    NESTED = ("symbols",)
+
+# Enregistrement par type de fichier (clé de FEATURE_EXTRACTORS)
+FEATURE_RECORDS = {"swift": SwiftFeatures, "js": JSFeatures}
+
+# Taille des blocs lus lors du parcours d'un fichier
+READ_CHUNK_SIZE = 1024 * 1024
+
+def scan_file(path: Path) -> Tuple[bytes, str, int]:
+    """Lit un fichier par blocs en calculant son hash et son nombre de lignes au fil de la lecture"""
+    import hashlib
+    digest = hashlib.blake2b(digest_size=16)
+    chunks = []
+    lines = 0
+    last = b""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            lines += chunk.count(b"\n")
+            chunks.append(chunk)
+            last = chunk
+    
+    # Une dernière ligne sans retour à la ligne compte aussi
+    if last and not last.endswith(b"\n"):
+        lines += 1
+    return b"".join(chunks), digest.hexdigest(), lines
+
+def extract_features(path: Path, raw: bytes, lines: int, text: Optional[str] = None) -> Dict:
+    """Applique l'extracteur correspondant au type de fichier"""
+    _, extractor = FEATURE_EXTRACTORS[path.suffix]
+    features = extractor(text if text is not None else raw.decode('utf-8', errors='ignore'))
+    features["lines"] = lines
+    return features
+
+def _extract_file(path: str) -> Tuple[int, int, str, Dict, float]:
+    """Lit, hache et analyse un fichier (exécuté dans un processus de travail) ; retourne aussi le temps d'extraction"""
+    file_path = Path(path)
+    stat = file_path.stat()
+    raw, digest, lines = scan_file(file_path)
+    start = time.perf_counter()
+    features = extract_features(file_path, raw, lines)
+    return stat.st_mtime_ns, stat.st_size, digest, features, time.perf_counter() - start
+
+class AnalysisCache:
+    """Cache persistant (SQLite) des caractéristiques extraites, indexé par empreinte de fichier"""
+    
+    CACHE_DIR = ".architecte_cache"
+    FILENAME = "analysis.sqlite"
+    
+    # Index de requêtes (sous-commande `query`) : tables réécrites à chaque analyse
+    INDEX_TABLES = {
+        "idx_files": "path TEXT PRIMARY KEY, kind TEXT, subproject TEXT, lines INTEGER",
+        "idx_routes": "method TEXT, path TEXT, file TEXT, middlewares TEXT, entry TEXT",
+        "idx_singletons": "name TEXT, file TEXT, mutable INTEGER, users TEXT",
+        "idx_entities": "name TEXT, file TEXT, table_name TEXT, columns INTEGER",
+        "idx_relations": "entity TEXT, file TEXT, property TEXT, type TEXT, target TEXT"
+    }
+    INDEX_COLUMNS = {
+        "idx_files_lines": "idx_files (lines)",
+        "idx_routes_method": "idx_routes (method)",
+        "idx_relations_entity": "idx_relations (entity)",
+        "idx_relations_target": "idx_relations (target)"
+    }
+    
+    def __init__(self, project_path: Path, cache_dir: Optional[Path] = None):
+        import sqlite3
+        self.cache_dir = cache_dir or (project_path / self.CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / self.FILENAME
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._pending_files: List[Tuple] = []
+        self._pending_features: List[Tuple] = []
+        self._prepare()
+        self._fingerprints: Dict[str, Tuple[int, int, str]] = {
+            path: (mtime_ns, size, digest)
+            for path, mtime_ns, size, digest in self.connection.execute("SELECT path, mtime_ns, size, hash FROM files")
+        }
+    
+    def _prepare(self):
+        """Crée le schéma et l'invalide si la version de l'analyseur a changé"""
+        cursor = self.connection.cursor()
+        cursor.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = cursor.execute("SELECT value FROM meta WHERE key = 'analyzer_version'").fetchone()
+        if row is None or row[0] != ANALYZER_VERSION:
+            for table in ("files", "features", *self.INDEX_TABLES):
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute("DELETE FROM meta WHERE key = 'index_timestamp'")
+            cursor.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('analyzer_version', ?)", (ANALYZER_VERSION,))
+        cursor.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, hash TEXT)")
+        cursor.execute("CREATE TABLE IF NOT EXISTS features (hash TEXT, kind TEXT, data TEXT, PRIMARY KEY (hash, kind))")
+        for table, columns in self.INDEX_TABLES.items():
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+        for name, target in self.INDEX_COLUMNS.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+        self.connection.commit()
+    
+    def fingerprint(self, rel_path: str) -> Optional[Tuple[int, int, str]]:
+        """Empreinte (mtime, taille, hash) enregistrée pour un fichier"""
+        return self._fingerprints.get(rel_path)
+    
+    def features(self, digest: str, kind: str) -> Optional[Dict]:
+        """Caractéristiques enregistrées pour un contenu donné"""
+        row = self.connection.execute("SELECT data FROM features WHERE hash = ? AND kind = ?", (digest, kind)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def record(self, rel_path: str, mtime_ns: int, size: int, digest: str, kind: str, features: Optional[Dict] = None):
+        """Enregistre une empreinte (et les caractéristiques si elles viennent d'être extraites)"""
+        self._fingerprints[rel_path] = (mtime_ns, size, digest)
+        self._pending_files.append((rel_path, mtime_ns, size, digest))
+        if features is not None:
+            self._pending_features.append((digest, kind, json.dumps(features, sort_keys=True)))
+    
+    def baseline_features(self) -> List[Tuple[str, str, str, str]]:
+        """(chemin, hash, type, caractéristiques sérialisées) de tous les fichiers enregistrés, en une requête"""
+        return self.connection.execute(
+            "SELECT files.path, files.hash, features.kind, features.data FROM files JOIN features ON files.hash = features.hash"
+        ).fetchall()
+    
+    def baseline(self) -> Optional[Dict]:
+        """État git (commit, fichiers modifiés) de l'arbre dont le cache reflète le contenu"""
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'baseline'").fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def set_baseline(self, baseline: Dict):
+        """Enregistre l'état git de l'arbre qui vient d'être analysé"""
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('baseline', ?)", (json.dumps(baseline),))
+    
+    def save(self, live_paths: Optional[set] = None, covered: Optional[Callable[[str], bool]] = None):
+        """Écrit les modifications en une transaction et purge les fichiers disparus
+        
+        Avec covered, seuls les fichiers d'une partie parcourue du projet peuvent être purgés.
+        L'état git de référence est oublié : seule l'analyse qui vient d'écrire peut l'enregistrer à nouveau.
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM meta WHERE key = 'baseline'")
+            self.connection.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", self._pending_files)
+            self.connection.executemany("INSERT OR REPLACE INTO features VALUES (?, ?, ?)", self._pending_features)
+            if live_paths is not None:
+                stale = [(path,) for path in self._fingerprints if path not in live_paths and (covered is None or covered(path))]
+                self.connection.executemany("DELETE FROM files WHERE path = ?", stale)
+                for (path,) in stale:
+                    del self._fingerprints[path]
+                self.connection.execute("DELETE FROM features WHERE hash NOT IN (SELECT hash FROM files)")
+        self._pending_files = []
+        self._pending_features = []
+    
+    def save_index(self, rows: Dict[str, List[Tuple]]):
+        """Remplace le contenu des tables de l'index de requêtes (une transaction)"""
+        from datetime import datetime
+        with self.connection:
+            for table, table_rows in rows.items():
+                self.connection.execute(f"DELETE FROM {table}")
+                if table_rows:
+                    placeholders = ", ".join("?" * len(table_rows[0]))
+                    self.connection.executemany(f"INSERT INTO {table} VALUES ({placeholders})", table_rows)
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('index_timestamp', ?)", (datetime.now().isoformat(),))
+    
+    def close(self):
+        """Ferme la connexion"""
+        self.connection.close()
+
+class QueryIndex:
+    """Lecture seule de l'index de requêtes et de l'index des symboles laissés par la dernière analyse"""
+    
+    def __init__(self, connection: "sqlite3.Connection", cache_dir: Path, timestamp: str):
+        self.connection = connection
+        self.cache_dir = cache_dir
+        self.timestamp = timestamp
+    
+    @classmethod
+    def open(cls, project_path: Path) -> Optional["QueryIndex"]:
+        """Ouvre l'index (None s'il est absent, incomplet ou d'une autre version de l'analyseur)"""
+        import sqlite3
+        cache_dir = project_path / AnalysisCache.CACHE_DIR
+        db_path = cache_dir / AnalysisCache.FILENAME
+        if not db_path.is_file():
+            return None
+        try:
+            connection = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+            meta = dict(connection.execute("SELECT key, value FROM meta"))
+        except sqlite3.Error:
+            return None
+        if meta.get("analyzer_version") != ANALYZER_VERSION or "index_timestamp" not in meta:
+            connection.close()
+            return None
+        return cls(connection, cache_dir, meta["index_timestamp"])
+    
+    def routes(self, method: Optional[str] = None, prefix: str = "", file: str = "") -> List[Dict]:
+        """Routes de la table de routage (méthode, préfixe de chemin, fichier)"""
+        query = "SELECT method, path, file, middlewares, entry FROM idx_routes WHERE path LIKE ? AND file LIKE ?"
+        parameters: List = [prefix.replace("%", "") + "%", f"%{file}%"]
+        if method:
+            query += " AND method = ?"
+            parameters.append(method.upper())
+        rows = self.connection.execute(query + " ORDER BY path, method", parameters)
+        return [{"method": m, "path": p, "file": f, "middlewares": json.loads(mw), "entry": e} for m, p, f, mw, e in rows]
+    
+    def singletons(self) -> List[Dict]:
+        """Singletons déclarés (static let/var shared) et fichiers qui les utilisent"""
+        rows = self.connection.execute("SELECT name, file, mutable, users FROM idx_singletons ORDER BY name")
+        return [{"name": n, "file": f, "mutable": bool(m), "users": json.loads(u)} for n, f, m, u in rows]
+    
+    def files(self, min_lines: int = 0, kind: Optional[str] = None, subproject: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Fichiers analysés, du plus long au plus court"""
+        query = "SELECT path, kind, subproject, lines FROM idx_files WHERE lines >= ?"
+        parameters: List = [min_lines]
+        for column, value in (("kind", kind), ("subproject", subproject)):
+            if value:
+                query += f" AND {column} = ?"
+                parameters.append(value)
+        query += " ORDER BY lines DESC, path"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return [{"path": p, "kind": k, "subproject": sp, "lines": n} for p, k, sp, n in self.connection.execute(query, parameters)]
+    
+    def entity(self, name: str) -> List[Dict]:
+        """Définitions d'une entité et leurs relations : sortantes (déclarées) et entrantes (entités qui la ciblent)"""
+        inverse = [
+            {"entity": e, "file": f, "property": p, "type": t}
+            for e, f, p, t in self.connection.execute("SELECT entity, file, property, type FROM idx_relations WHERE target = ? ORDER BY entity, file, property", (name,))
+        ]
+        definitions = []
+        for file, table, columns in self.connection.execute("SELECT file, table_name, columns FROM idx_entities WHERE name = ? ORDER BY file", (name,)).fetchall():
+            relations = self.connection.execute("SELECT property, type, target FROM idx_relations WHERE entity = ? AND file = ? ORDER BY property", (name, file))
+            definitions.append({
+                "name": name, "file": file, "table": table, "columns": columns,
+                "relations": [{"property": p, "type": t, "target": target} for p, t, target in relations],
+                "referenced_by": inverse
+            })
+        return definitions
+    
+    def entity_names(self) -> List[str]:
+        """Noms des entités indexées"""
+        return [name for (name,) in self.connection.execute("SELECT DISTINCT name FROM idx_entities ORDER BY name")]
+    
+    def symbols(self) -> Optional["SymbolIndex"]:
+        """Index des symboles enregistré à côté de la base"""
+        return SymbolIndex.load(self.cache_dir / SymbolIndex.FILENAME)
+    
+    def close(self):
+        """Ferme la connexion"""
+        self.connection.close()
+
+class FeatureStore:
+    """Caractéristiques par fichier : ré-extraites seulement si l'empreinte du fichier a changé"""
+    
+    def __init__(self, project_path: Path, content: ContentStore, cache: Optional[AnalysisCache] = None):
+        self.project_path = project_path
+        self.content = content
+        self.cache = cache
+        self.profiler = content.profiler
+        self.cache_hits = 0
+        self.extracted = 0
+        # Appelé une fois par fichier dès que ses caractéristiques sont disponibles (rapport NDJSON)
+        self.listener: Optional[Callable[[Path, FeatureRecord], None]] = None
+        # Clé : chemin (str) du fichier ; valeur : enregistrement compact
+        self._features: Dict[str, FeatureRecord] = {}
+        self._lock = threading.RLock()
+    
+    def get(self, path: Path) -> FeatureRecord:
+        """Caractéristiques d'un fichier (mémoire, puis cache persistant, puis extraction)"""
+        key = str(path)
+        with self._lock:
+            features = self._features.get(key)
+            if features is None:
+                features = self._compact(path, self._load(path))
+                self._features[key] = features
+                if self.listener is not None:
+                    self.listener(path, features)
+            else:
+                self.profiler.record(files_visited=1, cache_hits=1)
+            return features
+    
+    def invalidate(self, path: Path):
+        """Oublie les caractéristiques d'un fichier modifié (revalidées par empreinte au prochain accès)"""
+        with self._lock:
+            self._features.pop(str(path), None)
+    
+    def clear(self):
+        """Oublie toutes les caractéristiques en mémoire"""
+        with self._lock:
+            self._features.clear()
+    
+    def prefetch(self, paths: List[Path], jobs: int = 1):
+        """Charge les caractéristiques d'un lot de fichiers, en répartissant les extractions sur un pool de processus"""
+        from concurrent.futures import ProcessPoolExecutor
+        pending = []
+        with self._lock:
+            for path in paths:
+                if str(path) in self._features:
+                    continue
+                features = self._cached(path)
+                if features is not None:
+                    self._adopt(path, self._compact(path, features))
+                else:
+                    pending.append(path)
+        
+        if not pending:
+            return
+        if jobs <= 1 or len(pending) < 2:
+            for path in pending:
+                self.get(path)
+            return
+        
+        # Empreinte modifiée (checkout neuf, touch) : un contenu déjà connu du cache n'est pas envoyé au pool.
+        # Un chemin absent du cache (analyse à froid, nouveau fichier) part directement à l'extraction.
+        if self.cache is not None:
+            unknown = []
+            with self._lock:
+                for path in pending:
+                    if self.cache.fingerprint(path.relative_to(self.project_path).as_posix()) is None:
+                        unknown.append(path)
+                        continue
+                    stat = path.stat()
+                    raw, digest, _ = scan_file(path)
+                    features = self._known_content(path, stat, digest, len(raw))
+                    if features is None:
+                        unknown.append(path)
+                    else:
+                        self._adopt(path, self._compact(path, features))
+            pending = unknown
+            if not pending:
+                return
+        
+        # Les résultats sont rangés par chemin : l'ordre d'achèvement n'a aucune influence
+        chunksize = max(1, len(pending) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_extract_file, [str(p) for p in pending], chunksize=chunksize))
+        
+        with self._lock:
+            for path, (mtime_ns, size, digest, features, regex_time) in zip(pending, results):
+                self.extracted += 1
+                if self.cache is not None:
+                    kind, _ = FEATURE_EXTRACTORS[path.suffix]
+                    rel_path = path.relative_to(self.project_path).as_posix()
+                    self.cache.record(rel_path, mtime_ns, size, digest, kind, features)
+                self._adopt(path, self._compact(path, features))
+                self.profiler.record(files_visited=1, bytes_read=size, regex_time=regex_time)
+    
+    def preload(self, paths: List[Path], changed: set) -> int:
+        """Reprend du cache, sans vérifier leur empreinte, les caractéristiques des fichiers hors de changed (chemins relatifs)"""
+        if self.cache is None:
+            return 0
+        wanted = {path.relative_to(self.project_path).as_posix(): path for path in paths}
+        shared: Dict[Tuple[str, str], FeatureRecord] = {}
+        loaded = 0
+        for rel_path, digest, kind, data in self.cache.baseline_features():
+            path = wanted.get(rel_path)
+            if path is None or rel_path in changed or str(path) in self._features or FEATURE_EXTRACTORS[path.suffix][0] != kind:
+                continue
+            record = shared.get((digest, kind))
+            if record is None:
+                record = shared[(digest, kind)] = FEATURE_RECORDS[kind].from_dict(json.loads(data))
+            self._adopt(path, record)
+            loaded += 1
+        self.cache_hits += loaded
+        self.profiler.record(files_visited=loaded, cache_hits=loaded)
+        return loaded
+    
+    def _adopt(self, path: Path, features: FeatureRecord):
+        """Retient les caractéristiques chargées par lot et les signale au listener"""
+        with self._lock:
+            self._features[str(path)] = features
+            if self.listener is not None:
+                self.listener(path, features)
+    
+    @staticmethod
+    def _compact(path: Path, features: Dict) -> FeatureRecord:
+        """Convertit les caractéristiques sérialisées en enregistrement compact"""
+        kind, _ = FEATURE_EXTRACTORS[path.suffix]
+        return FEATURE_RECORDS[kind].from_dict(features)
+    
+    def _cached(self, path: Path) -> Optional[Dict]:
+        """Caractéristiques du cache persistant si l'empreinte (mtime, taille) est inchangée"""
+        if self.cache is None:
+            return None
+        kind, _ = FEATURE_EXTRACTORS[path.suffix]
+        stat = path.stat()
+        known = self.cache.fingerprint(path.relative_to(self.project_path).as_posix())
+        if known is not None and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+            features = self.cache.features(known[2], kind)
+            if features is not None:
+                self.cache_hits += 1
+                self.profiler.record(files_visited=1, cache_hits=1)
+                return features
+        return None
+    
+    def _known_content(self, path: Path, stat: os.stat_result, digest: str, bytes_read: int) -> Optional[Dict]:
+        """Caractéristiques du cache pour un contenu déjà connu (hash inchangé), dont l'empreinte est alors mise à jour"""
+        kind, _ = FEATURE_EXTRACTORS[path.suffix]
+        features = self.cache.features(digest, kind)
+        if features is not None:
+            self.cache_hits += 1
+            self.profiler.record(files_visited=1, bytes_read=bytes_read, cache_hits=1)
+            self.cache.record(path.relative_to(self.project_path).as_posix(), stat.st_mtime_ns, stat.st_size, digest, kind)
+        return features
+    
+    def _load(self, path: Path) -> Dict:
+        """Charge les caractéristiques depuis le cache ou les extrait du contenu"""
+        kind, _ = FEATURE_EXTRACTORS[path.suffix]
+        features = self._cached(path)
+        if features is not None:
+            return features
+        
+        # Empreinte modifiée : comparer le hash du contenu avant de ré-extraire
+        stat = path.stat()
+        raw, digest, lines = scan_file(path)
+        if self.cache is not None:
+            features = self._known_content(path, stat, digest, len(raw))
+            if features is not None:
+                return features
+        
+        # Texte décodé pour la seule extraction : inutile de le garder dans le ContentStore
+        self.extracted += 1
+        start = time.perf_counter()
+        features = extract_features(path, raw, lines)
+        self.profiler.record(files_visited=1, bytes_read=len(raw), regex_time=time.perf_counter() - start)
+        if self.cache is not None:
+            self.cache.record(path.relative_to(self.project_path).as_posix(), stat.st_mtime_ns, stat.st_size, digest, kind, features)
+        return features
+
+def _git(project_path: Path, *arguments: str) -> str:
+    """Sortie d'une commande git exécutée dans le projet (ValueError si elle échoue)"""
+    import subprocess
+    try:
+        result = subprocess.run(["git", *arguments], cwd=project_path, capture_output=True, text=True)
+    except OSError as e:
+        raise ValueError(f"git indisponible: {e}")
+    if result.returncode != 0:
+        raise ValueError(result.stderr.strip() or f"échec de git {' '.join(arguments)}")
+    return result.stdout
+
+def git_changed_paths(project_path: Path, ref: str) -> set:
+    """Chemins (relatifs au projet) modifiés depuis ref dans l'arbre de travail, fichiers non suivis compris"""
+    changed = _git(project_path, "diff", "--name-only", "--relative", "--no-renames", "-z", ref, "--").split("\0")
+    changed += _git(project_path, "ls-files", "--others", "--exclude-standard", "-z").split("\0")
+    return {path for path in changed if path}
+
+def git_baseline(project_path: Path) -> Optional[Dict]:
+    """Commit courant et fichiers modifiés depuis ce commit (None hors d'un dépôt git)"""
+    try:
+        commit = _git(project_path, "rev-parse", "HEAD").strip()
+        return {"commit": commit, "dirty": sorted(git_changed_paths(project_path, commit))}
+    except ValueError:
+        return None
+
+def prefetch_shared(requests: List[Tuple[FeatureStore, List[Path]]], jobs: int = 1) -> Dict[str, int]:
+    """Charge les caractéristiques de plusieurs projets sur un seul pool : un contenu identique n'est extrait qu'une fois
+    
+    Chaque fichier est identifié par son hash (celui du cache de son projet si l'empreinte est inchangée) ;
+    les enregistrements compacts sont partagés entre projets et chaque cache reçoit ce qui lui manque.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    shared: Dict[Tuple[str, str], FeatureRecord] = {}
+    # (hash, type) -> fichiers de ce contenu encore à extraire : (store, chemin, chemin relatif, mtime, taille)
+    pending: Dict[Tuple[str, str], List[Tuple[FeatureStore, Path, str, int, int]]] = {}
+    stats = Counter()
+    
+    for store, paths in requests:
+        for path in paths:
+            if str(path) in store._features:
+                continue
+            kind, _ = FEATURE_EXTRACTORS[path.suffix]
+            stat = path.stat()
+            rel_path = path.relative_to(store.project_path).as_posix()
+            known = store.cache.fingerprint(rel_path) if store.cache is not None else None
+            if known is not None and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+                digest = known[2]
+            else:
+                _, digest, _ = scan_file(path)
+                known = None
+            stats["files"] += 1
+            
+            features = store.cache.features(digest, kind) if store.cache is not None else None
+            if features is not None:
+                # Contenu déjà connu du cache de ce projet
+                record = shared.setdefault((digest, kind), store._compact(path, features))
+                if known is None:
+                    store.cache.record(rel_path, stat.st_mtime_ns, stat.st_size, digest, kind)
+                store.cache_hits += 1
+                stats["cache_hits"] += 1
+            elif (digest, kind) in shared:
+                # Contenu déjà chargé pour un autre projet du lot
+                record = shared[(digest, kind)]
+                if store.cache is not None:
+                    store.cache.record(rel_path, stat.st_mtime_ns, stat.st_size, digest, kind, record.to_dict())
+                stats["shared_hits"] += 1
+            else:
+                pending.setdefault((digest, kind), []).append((store, path, rel_path, stat.st_mtime_ns, stat.st_size))
+                continue
+            store.profiler.record(files_visited=1, cache_hits=1)
+            store._adopt(path, record)
+    
+    # Un seul représentant par contenu ; les résultats sont rangés par contenu, quel que soit l'ordre d'achèvement
+    work = [str(files[0][1]) for files in pending.values()]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_extract_file, work, chunksize=max(1, len(work) // (jobs * 4))))
+    else:
+        results = [_extract_file(path) for path in work]
+    
+    for ((_, kind), files), (_, _, digest, features, regex_time) in zip(pending.items(), results):
+        record = None
+        for position, (store, path, rel_path, mtime_ns, size) in enumerate(files):
+            if store.cache is not None:
+                store.cache.record(rel_path, mtime_ns, size, digest, kind, features)
+            if record is None:
+                record = store._compact(path, features)
+            if position == 0:
+                store.extracted += 1
+                store.profiler.record(files_visited=1, bytes_read=size, regex_time=regex_time)
+            else:
+                stats["shared_hits"] += 1
+                store.profiler.record(files_visited=1, cache_hits=1)
+            store._adopt(path, record)
+    stats["extracted"] = len(work)
+    stats["unique_contents"] = len(shared.keys() | pending.keys())
+    return dict(stats)
+
+class SymbolIndex:
+    """Index des symboles du projet : définitions (fichier, ligne, nature) et fichiers qui les référencent
+    
+    Fichiers et noms sont internés et désignés par leur indice ; les postings sont des tableaux d'entiers
+    (array) : triplets (fichier, ligne, nature) pour les définitions, fichiers triés pour les références.
+    """
+    
+    FILENAME = "symbols.json"
+    KINDS = ("class", "struct", "enum", "protocol", "extension", "actor", "function", "export")
+    
+    def __init__(self):
+        self.files: List[str] = []
+        self.names: List[str] = []
+        self.definitions: List[array] = []
+        self.references: List[array] = []
+        self._name_ids: Dict[str, int] = {}
+        self._kind_ids = {kind: index for index, kind in enumerate(self.KINDS)}
+    
+    @classmethod
+    def build(cls, entries: List[Tuple[str, Dict]]) -> "SymbolIndex":
+        """Construit l'index à partir des caractéristiques (symbols, references) de chaque fichier"""
+        index = cls()
+        entries = sorted(entries, key=lambda entry: entry[0])
+        for path, features in entries:
+            file_id = len(index.files)
+            index.files.append(sys.intern(path))
+            for kind, name, line in features.get("symbols", ()):
+                index._postings(name, create=True)[0].extend((file_id, line, index._kind_ids[kind]))
+        
+        # Seuls les noms définis dans le projet sont indexés en référence (fichiers parcourus dans l'ordre)
+        for file_id, (_, features) in enumerate(entries):
+            for name in features.get("references", ()):
+                name_id = index._name_ids.get(name)
+                if name_id is not None:
+                    index.references[name_id].append(file_id)
+        return index
+    
+    def _postings(self, name: str, create: bool = False) -> Optional[Tuple[array, array]]:
+        """(définitions, références) d'un nom"""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            if not create:
+                return None
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(sys.intern(name))
+            self.definitions.append(array("I"))
+            self.references.append(array("I"))
+        return self.definitions[name_id], self.references[name_id]
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def definitions_of(self, name: str) -> List[Tuple[str, int, str]]:
+        """Définitions d'un symbole : (fichier, ligne, nature)"""
+        postings = self._postings(name)
+        if postings is None:
+            return []
+        flat = postings[0]
+        return [(self.files[flat[i]], flat[i + 1], self.KINDS[flat[i + 2]]) for i in range(0, len(flat), 3)]
+    
+    def references_to(self, name: str, prefix: str = "") -> List[str]:
+        """Fichiers (sous prefix) qui utilisent un symbole sans le définir"""
+        postings = self._postings(name)
+        if postings is None:
+            return []
+        definers = set(postings[0][0::3])
+        return [self.files[file_id] for file_id in postings[1] if file_id not in definers and self.files[file_id].startswith(prefix)]
+    
+    def symbols(self, kind: Optional[str] = None, prefix: str = "") -> List[str]:
+        """Noms définis (d'une nature donnée, dans les fichiers sous prefix)"""
+        kind_id = self._kind_ids.get(kind) if kind else None
+        found = []
+        for name, flat in zip(self.names, self.definitions):
+            for i in range(0, len(flat), 3):
+                if (kind_id is None or flat[i + 2] == kind_id) and self.files[flat[i]].startswith(prefix):
+                    found.append(name)
+                    break
+        return found
+    
+    def save(self, path: Path):
+        """Enregistre l'index (listes d'entiers, noms et fichiers une seule fois)"""
+        data = {
+            "analyzer_version": ANALYZER_VERSION,
+            "kinds": list(self.KINDS),
+            "files": self.files,
+            "names": self.names,
+            "definitions": [postings.tolist() for postings in self.definitions],
+            "references": [postings.tolist() for postings in self.references]
+        }
+        path.write_text(json.dumps(data, separators=(",", ":")), encoding='utf-8')
+    
+    @classmethod
+    def load(cls, path: Path) -> Optional["SymbolIndex"]:
+        """Charge un index enregistré (None s'il est absent ou d'une autre version de l'analyseur)"""
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if data.get("analyzer_version") != ANALYZER_VERSION:
+            return None
+        index = cls()
+        index.files = [sys.intern(name) for name in data["files"]]
+        index.names = [sys.intern(name) for name in data["names"]]
+        index._name_ids = {name: name_id for name_id, name in enumerate(index.names)}
+        index.definitions = [array("I", postings) for postings in data["definitions"]]
+        index.references = [array("I", postings) for postings in data["references"]]
+        return index
+
+def strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """Composantes fortement connexes (Tarjan, itératif, temps linéaire)
+    
+    Les composantes sont produites en ordre topologique inverse : une composante apparaît après
+    toutes celles qu'elle atteint.
+    """
+    index_of: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: set = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+    
+    for root in graph:
+        if root in index_of:
+            continue
+        index_of[root] = lowlink[root] = len(index_of)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index_of:
+                    index_of[successor] = lowlink[successor] = len(index_of)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(graph.get(successor, ()))))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+    return components
+
+def analyze_module_graph(graph: Dict[str, List[str]], external: Dict[str, int], top: int = 10) -> Dict:
+    """Cycles, fan-in/fan-out et plus longues chaînes d'imports d'un graphe de modules"""
+    fan_in: Dict[str, int] = dict.fromkeys(graph, 0)
+    for targets in graph.values():
+        for target in targets:
+            fan_in[target] += 1
+    
+    components = strongly_connected_components(graph)
+    component_of = {member: position for position, component in enumerate(components) for member in component}
+    cycles = [component for component in components if len(component) > 1 or component[0] in graph[component[0]]]
+    
+    # Plus longue chaîne sur le graphe des composantes (acyclique) : les successeurs sont déjà calculés
+    depth: List[int] = []
+    following: List[Optional[int]] = []
+    for position, component in enumerate(components):
+        best, best_next = 0, None
+        for member in component:
+            for target in graph[member]:
+                successor = component_of[target]
+                if successor != position and depth[successor] > best:
+                    best, best_next = depth[successor], successor
+        depth.append(best + len(component))
+        following.append(best_next)
+    
+    # Chaînes partant des composantes qu'aucune autre n'importe
+    imported = {component_of[target] for member, targets in graph.items() for target in targets if component_of[target] != component_of[member]}
+    starts = sorted((position for position in range(len(components)) if position not in imported), key=lambda position: (-depth[position], components[position][0]))
+    chains = []
+    for position in starts[:5]:
+        chain = []
+        current: Optional[int] = position
+        while current is not None:
+            component = components[current]
+            chain.append(component[0] if len(component) == 1 else f"{component[0]} (+{len(component) - 1} en cycle)")
+            current = following[current]
+        chains.append({"length": depth[position], "modules": chain})
+    
+    def ranking(values: Dict[str, int]) -> List[Dict]:
+        ranked = sorted(((count, module) for module, count in values.items() if count), key=lambda item: (-item[0], item[1]))
+        return [{"module": module, "count": count} for count, module in ranked[:top]]
+    
+    return {
+        "modules": len(graph),
+        "edges": sum(len(targets) for targets in graph.values()),
+        "external_packages": dict(sorted(external.items(), key=lambda item: (-item[1], item[0]))),
+        "cycles": cycles,
+        "fan_in": ranking(fan_in),
+        "fan_out": ranking({module: len(targets) for module, targets in graph.items()}),
+        "longest_chains": chains,
+        "max_depth": max(depth, default=0)
+    }
+
+class BaseAnalyzer:
+    """Base commune des analyseurs : catalogue, contenu et caractéristiques partagés
+    
+    Les analyseurs de plugins en héritent : analyze() retourne leur section du rapport,
+    feature_files() les fichiers à précharger et recommendations() leurs recommandations.
+    """
     
-    def __init__(self, project_path: Path):
+    # Dossier du sous-projet (relatif au projet) si le registre n'en fournit pas
+    DEFAULT_ROOT = ""
+    
+    def __init__(self, project_path: Path, catalog: Optional[FileCatalog] = None, content: Optional[ContentStore] = None, root: Optional[str] = None):
         self.project_path = project_path
-        self.ios_path = project_path / "Tshiakani VTC"
+        self.root = project_path / (self.DEFAULT_ROOT if root is None else root)
+        self._catalog = catalog
+        self.content = content or ContentStore()
+        self.features = FeatureStore(project_path, self.content)
+    
+    @property
+    def profiler(self) -> PhaseProfiler:
+        """Profileur partagé avec le magasin de contenu"""
+        return self.content.profiler
+    
+    @property
+    def catalog(self) -> FileCatalog:
+        """Catalogue partagé, construit à la demande si l'analyseur est utilisé seul"""
+        if self._catalog is None:
+            self._catalog = FileCatalog(self.project_path)
+        return self._catalog
+    
+    @catalog.setter
+    def catalog(self, catalog: FileCatalog):
+        self._catalog = catalog
+    
+    def feature_files(self) -> List[Path]:
+        """Fichiers dont l'analyseur utilise les caractéristiques (préchargés en mode parallèle)"""
+        return []
+    
+    def analyze(self) -> Dict:
+        """Section du rapport produite par l'analyseur"""
+        return {}
+    
+    def recommendations(self, analysis: Dict) -> List[Dict]:
+        """Recommandations propres à l'analyseur (plugins ; celles des analyseurs intégrés viennent du moteur)"""
+        return []
+    
+    # Extensions essayées pour résoudre un import relatif sans extension
+    MODULE_EXTENSIONS = (".js",)
+    
+    def _resolve_module(self, source: Path, module: str) -> Optional[Path]:
+        """Fichier désigné par un import relatif depuis source (module, module.ext ou module/index.ext)"""
+        if not module.startswith("."):
+            return None
+        base = Path(os.path.normpath(source.parent / module))
+        candidates = [base] + [base.with_name(base.name + ext) for ext in self.MODULE_EXTENSIONS]
+        candidates += [base / f"index{ext}" for ext in self.MODULE_EXTENSIONS]
+        for candidate in candidates:
+            if candidate.suffix in FEATURE_EXTRACTORS and self.catalog.is_file(candidate):
+                return candidate
+        return None
+    
+    def _build_module_graph(self, files: List[Path]) -> Dict:
+        """Graphe require/import à partir des fichiers donnés (et des modules du projet qu'ils atteignent)"""
+        graph: Dict[str, List[str]] = {}
+        external: Dict[str, int] = defaultdict(int)
+        pending = list(files)
+        seen = set(pending)
+        
+        for path in pending:
+            try:
+                imports = self.features.get(path)["imports"]
+            except OSError:
+                continue
+            targets: Dict[str, None] = {}
+            for module in imports:
+                resolved = self._resolve_module(path, module)
+                if resolved is None:
+                    if not module.startswith("."):
+                        # Paquet externe : seul le nom du paquet compte (@scope/paquet, paquet/sous-module)
+                        parts = module.split("/")
+                        external["/".join(parts[:2]) if module.startswith("@") else parts[0]] += 1
+                    continue
+                targets[resolved.relative_to(self.project_path).as_posix()] = None
+                if resolved not in seen:
+                    seen.add(resolved)
+                    pending.append(resolved)
+            graph[path.relative_to(self.project_path).as_posix()] = list(targets)
+        
+        # Modules atteints mais illisibles : nœuds sans successeur
+        for targets in list(graph.values()):
+            for target in targets:
+                graph.setdefault(target, [])
+        return analyze_module_graph(graph, dict(external))
+
+class IOSAnalyzer(BaseAnalyzer):
+    """Analyseur pour l'application iOS (Swift)"""
+    
+    DEFAULT_ROOT = "Tshiakani VTC"
+    
+    def __init__(self, project_path: Path, catalog: Optional[FileCatalog] = None, content: Optional[ContentStore] = None, root: Optional[str] = None):
+        super().__init__(project_path, catalog, content, root)
+        self.ios_path = self.root
+    
+    def feature_files(self) -> List[Path]:
+        """Fichiers Swift de l'application"""
+        return self.catalog.files(self.ios_path, (".swift",), recursive=True)
         
     def analyze(self) -> Dict:
         """Analyse complète de l'architecture iOS"""
@@ -46,11 +2365,13 @@ class IOSAnalyzer:
             "viewmodels": self._analyze_viewmodels(),
             "patterns": self._analyze_patterns(),
             "dependencies": self._analyze_dependencies(),
+            "usage_graph": self._analyze_usage_graph(),
             "code_quality": self._analyze_code_quality(),
             "metrics": self._calculate_metrics()
         }
         return analysis
     
+    @profiled_phase
     def _analyze_structure(self) -> Dict:
         """Analyse la structure du projet iOS"""
         structure = {
@@ -62,31 +2383,30 @@ class IOSAnalyzer:
             "resources": []
         }
         
-        if not self.ios_path.exists():
+        if not self.catalog.is_dir(self.ios_path):
             return structure
         
         # Analyser les dossiers
-        for item in self.ios_path.iterdir():
-            if item.is_dir():
-                if item.name == "Models":
-                    structure["models"] = [f.name for f in item.glob("*.swift")]
-                elif item.name == "Views":
-                    structure["views"] = self._count_swift_files_recursive(item)
-                elif item.name == "ViewModels":
-                    structure["viewmodels"] = [f.name for f in item.glob("*.swift")]
-                elif item.name == "Services":
-                    structure["services"] = [f.name for f in item.glob("*.swift")]
-                elif item.name == "Extensions":
-                    structure["extensions"] = [f.name for f in item.glob("*.swift")]
-                elif item.name == "Resources":
-                    structure["resources"] = self._analyze_resources(item)
+        for item in self.catalog.subdirs(self.ios_path):
+            if item.name == "Models":
+                structure["models"] = [f.name for f in self.catalog.files(item, (".swift",))]
+            elif item.name == "Views":
+                structure["views"] = self._count_swift_files_recursive(item)
+            elif item.name == "ViewModels":
+                structure["viewmodels"] = [f.name for f in self.catalog.files(item, (".swift",))]
+            elif item.name == "Services":
+                structure["services"] = [f.name for f in self.catalog.files(item, (".swift",))]
+            elif item.name == "Extensions":
+                structure["extensions"] = [f.name for f in self.catalog.files(item, (".swift",))]
+            elif item.name == "Resources":
+                structure["resources"] = self._analyze_resources(item)
         
         return structure
     
     def _count_swift_files_recursive(self, directory: Path) -> List[str]:
         """Compte récursivement les fichiers Swift"""
         files = []
-        for item in directory.rglob("*.swift"):
+        for item in self.catalog.files(directory, (".swift",), recursive=True):
             files.append(str(item.relative_to(self.ios_path)))
         return files
     
@@ -99,67 +2419,62 @@ class IOSAnalyzer:
             "assets": []
         }
         
-        for item in resources_path.rglob("*"):
-            if item.is_file():
-                if "Colors" in str(item):
-                    resources["colors"].append(item.name)
-                elif "Fonts" in str(item):
-                    resources["fonts"].append(item.name)
-                elif "Localization" in str(item):
-                    resources["localization"].append(item.name)
-                elif item.suffix in [".png", ".jpg", ".jpeg", ".pdf"]:
-                    resources["assets"].append(item.name)
+        for item in self.catalog.files(resources_path, recursive=True):
+            if "Colors" in str(item):
+                resources["colors"].append(item.name)
+            elif "Fonts" in str(item):
+                resources["fonts"].append(item.name)
+            elif "Localization" in str(item):
+                resources["localization"].append(item.name)
+            elif item.suffix in [".png", ".jpg", ".jpeg", ".pdf"]:
+                resources["assets"].append(item.name)
         
         return resources
     
+    @profiled_phase
     def _analyze_services(self) -> Dict:
         """Analyse les services iOS"""
         services_path = self.ios_path / "Services"
         services = {
             "count": 0,
             "list": [],
-            "patterns": [],
+            "patterns": Counter(),
             "singletons": []
         }
         
-        if not services_path.exists():
-            return services
-        
-        for service_file in services_path.glob("*.swift"):
+        for service_file in self.catalog.files(services_path, (".swift",)):
             services["count"] += 1
             services["list"].append(service_file.name)
             
             # Analyser le contenu
-            content = service_file.read_text(encoding='utf-8', errors='ignore')
+            features = self.features.get(service_file)
             
             # Détecter les singletons
-            if "static let shared" in content or "static var shared" in content:
+            if features["shared_instance"]:
                 services["singletons"].append(service_file.stem)
             
             # Détecter les patterns
-            if "@Published" in content:
-                services["patterns"].append("ObservableObject")
-            if "async" in content and "await" in content:
-                services["patterns"].append("Async/Await")
-            if "Combine" in content:
-                services["patterns"].append("Combine")
+            if features["published"]:
+                services["patterns"]["ObservableObject"] += 1
+            if features["async_await"]:
+                services["patterns"]["Async/Await"] += 1
+            if features["combine"]:
+                services["patterns"]["Combine"] += 1
         
         return services
     
+    @profiled_phase
     def _analyze_views(self) -> Dict:
         """Analyse les vues SwiftUI"""
         views_path = self.ios_path / "Views"
         views = {
             "count": 0,
-            "by_category": defaultdict(int),
+            "by_category": Counter(),
             "components": [],
-            "patterns": []
+            "patterns": Counter()
         }
         
-        if not views_path.exists():
-            return views
-        
-        for view_file in views_path.rglob("*.swift"):
+        for view_file in self.catalog.files(views_path, (".swift",), recursive=True):
             views["count"] += 1
             category = view_file.parent.name
             views["by_category"][category] += 1
@@ -168,14 +2483,16 @@ class IOSAnalyzer:
                 views["components"].append(str(view_file.relative_to(self.ios_path)))
             
             # Analyser les patterns
-            content = view_file.read_text(encoding='utf-8', errors='ignore')
-            if "@StateObject" in content:
-                views["patterns"].append("MVVM")
-            if "@State" in content:
-                views["patterns"].append("State Management")
-        
-        return dict(views)
+            features = self.features.get(view_file)
+            if features["state_object"]:
+                views["patterns"]["MVVM"] += 1
+            if features["state"]:
+                views["patterns"]["State Management"] += 1
+        
+        views["by_category"] = dict(views["by_category"])
+        return views
     
+    @profiled_phase
     def _analyze_models(self) -> Dict:
         """Analyse les modèles de données"""
         models_path = self.ios_path / "Models"
@@ -186,24 +2503,22 @@ class IOSAnalyzer:
             "properties": defaultdict(int)
         }
         
-        if not models_path.exists():
-            return models
-        
-        for model_file in models_path.glob("*.swift"):
+        for model_file in self.catalog.files(models_path, (".swift",)):
             models["count"] += 1
             models["list"].append(model_file.stem)
             
-            content = model_file.read_text(encoding='utf-8', errors='ignore')
+            features = self.features.get(model_file)
             
-            if "Codable" in content or ": Codable" in content:
+            if features["codable"]:
                 models["codable"].append(model_file.stem)
             
             # Compter les propriétés
-            properties = re.findall(r'(var|let)\s+(\w+)', content)
-            models["properties"][model_file.stem] = len(properties)
+            models["properties"][model_file.stem] = features["properties"]
         
-        return dict(models)
+        models["properties"] = dict(models["properties"])
+        return models
     
+    @profiled_phase
     def _analyze_viewmodels(self) -> Dict:
         """Analyse les ViewModels"""
         viewmodels_path = self.ios_path / "ViewModels"
@@ -214,25 +2529,23 @@ class IOSAnalyzer:
             "methods": defaultdict(int)
         }
         
-        if not viewmodels_path.exists():
-            return viewmodels
-        
-        for vm_file in viewmodels_path.glob("*.swift"):
+        for vm_file in self.catalog.files(viewmodels_path, (".swift",)):
             viewmodels["count"] += 1
             viewmodels["list"].append(vm_file.stem)
             
-            content = vm_file.read_text(encoding='utf-8', errors='ignore')
+            features = self.features.get(vm_file)
             
             # Compter les propriétés @Published
-            published = len(re.findall(r'@Published', content))
-            viewmodels["published_properties"][vm_file.stem] = published
+            viewmodels["published_properties"][vm_file.stem] = features["published"]
             
             # Compter les méthodes
-            methods = len(re.findall(r'func\s+\w+', content))
-            viewmodels["methods"][vm_file.stem] = methods
+            viewmodels["methods"][vm_file.stem] = features["methods"]
         
-        return dict(viewmodels)
+        viewmodels["published_properties"] = dict(viewmodels["published_properties"])
+        viewmodels["methods"] = dict(viewmodels["methods"])
+        return viewmodels
     
+    @profiled_phase
     def _analyze_patterns(self) -> Dict:
         """Analyse les patterns architecturaux"""
         patterns = {
@@ -244,36 +2557,40 @@ class IOSAnalyzer:
         }
         
         # Analyser les fichiers pour détecter les patterns
-        ios_files = list(self.ios_path.rglob("*.swift"))
+        ios_files = self.catalog.files(self.ios_path, (".swift",), recursive=True)
         
-        for file_path in ios_files[:50]:  # Limiter pour performance
+        for file_path in ios_files:
+            # Tous les patterns sont détectés : inutile de parcourir la suite
+            if all(patterns.values()):
+                break
             try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
+                features = self.features.get(file_path)
                 
                 # MVVM
-                if "@StateObject" in content or "@ObservedObject" in content:
+                if features["state_object"] or features["observed_object"]:
                     patterns["mvvm"] = True
                 
                 # Singleton
-                if "static let shared" in content:
+                if features["singleton"]:
                     patterns["singleton"] = True
                 
                 # Observer
-                if "@Published" in content or "Combine" in content:
+                if features["published"] or features["combine"]:
                     patterns["observer"] = True
                 
                 # Factory
-                if "Factory" in content and "static func" in content:
+                if features["factory"]:
                     patterns["factory"] = True
                 
                 # Repository (moins commun en iOS)
-                if "Repository" in content:
+                if features["repository"]:
                     patterns["repository"] = True
             except:
                 continue
         
         return patterns
     
+    @profiled_phase
     def _analyze_dependencies(self) -> Dict:
         """Analyse les dépendances externes"""
         dependencies = {
@@ -284,19 +2601,98 @@ class IOSAnalyzer:
         # Chercher Package.swift ou project.pbxproj
         project_file = self.project_path / "Tshiakani VTC.xcodeproj" / "project.pbxproj"
         
-        if project_file.exists():
-            content = project_file.read_text(encoding='utf-8', errors='ignore')
+        if self.catalog.is_file(project_file):
+            content = self.content.read(project_file)
             
             # Détecter les frameworks
             frameworks = re.findall(r'(\w+\.framework)', content)
-            dependencies["frameworks"] = list(set(frameworks))
+            dependencies["frameworks"] = sorted(set(frameworks))
             
             # Détecter les packages Swift
             packages = re.findall(r'packageProductDependency.*?name = "(\w+)"', content)
-            dependencies["packages"] = list(set(packages))
+            dependencies["packages"] = sorted(set(packages))
         
         return dependencies
     
+    # Couches du graphe d'usage : dossier de premier niveau -> rôle
+    USAGE_LAYERS = {"Views": "view", "ViewModels": "viewmodel", "Services": "service"}
+    
+    @profiled_phase
+    def _analyze_usage_graph(self) -> Dict:
+        """Graphe Vue -> ViewModel -> Service : objets observés, instanciations et singletons, résolus par l'index des symboles"""
+        entries = []
+        for path in self.feature_files():
+            try:
+                entries.append((path.relative_to(self.ios_path).as_posix(), self.features.get(path)))
+            except OSError:
+                continue
+        index = SymbolIndex.build(entries)
+        
+        # Couche de chaque type défini sous Views/ViewModels/Services (première définition hors extension) ;
+        # ViewModels et services sont des classes (ou acteurs), les autres types de ces dossiers sont ignorés
+        layers: Dict[str, str] = {}
+        for layer_folder, layer in self.USAGE_LAYERS.items():
+            for name in index.symbols(prefix=layer_folder + "/"):
+                if name not in layers:
+                    definitions = [d for d in index.definitions_of(name) if d[2] != "extension"]
+                    if definitions and definitions[0][0].startswith(layer_folder + "/"):
+                        if layer == "view" or definitions[0][2] in ("class", "actor"):
+                            layers[name] = layer
+        
+        graph = {
+            "ownership": [],
+            "viewmodel_services": {},
+            "singletons": defaultdict(list),
+            "render_instantiations": []
+        }
+        # Liens distincts (fichier, type) -> couches reliées
+        links: Dict[Tuple[str, str], str] = {}
+        for relative, features in entries:
+            layer = self.USAGE_LAYERS.get(relative.split("/", 1)[0])
+            shared = set(features.get("shared_uses", ()))
+            for name in shared:
+                if name in layers:
+                    graph["singletons"][name].append(relative)
+            if layer is None:
+                continue
+            
+            if layer == "view":
+                for wrapper, type_name, line, origin in features.get("object_bindings", ()):
+                    if type_name not in layers:
+                        continue
+                    graph["ownership"].append({
+                        "view": relative, "type": type_name, "layer": layers[type_name],
+                        "wrapper": wrapper, "origin": origin, "line": line
+                    })
+                    links[(relative, type_name)] = f"view->{layers[type_name]}"
+                    # @ObservedObject instancié sur place : recréé à chaque rendu du parent
+                    if wrapper == "ObservedObject" and origin == "init":
+                        graph["render_instantiations"].append({"view": relative, "type": type_name, "layer": layers[type_name], "line": line})
+                # Instanciation directe (hors @StateObject et aperçus) : à chaque rendu
+                for name, line, _ in features.get("constructions", ()):
+                    target = layers.get(name)
+                    if target in ("viewmodel", "service"):
+                        links[(relative, name)] = f"view->{target}"
+                        graph["render_instantiations"].append({"view": relative, "type": name, "layer": target, "line": line})
+            
+            services = set()
+            defined = {name for _, name, _ in features.get("symbols", ())}
+            for name in features.get("references", ()):
+                target = layers.get(name) if name not in defined else None
+                if target == "service" or (target == "viewmodel" and layer != "view"):
+                    links.setdefault((relative, name), f"{layer}->{target}")
+                    if target == "service":
+                        services.add(name)
+            if layer == "viewmodel" and services:
+                graph["viewmodel_services"][relative] = sorted(services)
+        
+        graph["edges"] = dict(sorted(Counter(links.values()).items()))
+        graph["singletons"] = {name: sorted(files) for name, files in sorted(graph["singletons"].items())}
+        graph["render_instantiations"].sort(key=lambda item: (item["view"], item["line"]))
+        graph["mvvm_views"] = len({owned["view"] for owned in graph["ownership"] if owned["layer"] == "viewmodel"})
+        return graph
+    
+    @profiled_phase
     def _analyze_code_quality(self) -> Dict:
         """Analyse la qualité du code"""
         quality = {
@@ -307,20 +2703,19 @@ class IOSAnalyzer:
             "documentation": 0
         }
         
-        swift_files = list(self.ios_path.rglob("*.swift"))
+        swift_files = self.catalog.files(self.ios_path, (".swift",), recursive=True)
         quality["total_files"] = len(swift_files)
         
         total_lines = 0
         documented_files = 0
         
-        for file_path in swift_files[:100]:  # Limiter pour performance
+        for file_path in swift_files:
             try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-                lines = len(content.splitlines())
-                total_lines += lines
+                features = self.features.get(file_path)
+                total_lines += features["lines"]
                 
                 # Vérifier la documentation
-                if "///" in content or "/**" in content:
+                if features["documented"]:
                     documented_files += 1
             except:
                 continue
@@ -332,22 +2727,38 @@ class IOSAnalyzer:
         
         return quality
     
+    @profiled_phase
     def _calculate_metrics(self) -> Dict:
         """Calcule les métriques iOS"""
         metrics = {
-            "services_count": len(list((self.ios_path / "Services").glob("*.swift")) if (self.ios_path / "Services").exists() else []),
-            "views_count": len(list((self.ios_path / "Views").rglob("*.swift")) if (self.ios_path / "Views").exists() else []),
-            "models_count": len(list((self.ios_path / "Models").glob("*.swift")) if (self.ios_path / "Models").exists() else []),
-            "viewmodels_count": len(list((self.ios_path / "ViewModels").glob("*.swift")) if (self.ios_path / "ViewModels").exists() else [])
+            "services_count": len(self.catalog.files(self.ios_path / "Services", (".swift",))),
+            "views_count": len(self.catalog.files(self.ios_path / "Views", (".swift",), recursive=True)),
+            "models_count": len(self.catalog.files(self.ios_path / "Models", (".swift",))),
+            "viewmodels_count": len(self.catalog.files(self.ios_path / "ViewModels", (".swift",)))
         }
         return metrics
 
-class BackendAnalyzer:
+class BackendAnalyzer(BaseAnalyzer):
     """Analyseur pour le backend Node.js"""
     
-    def __init__(self, project_path: Path):
-        self.project_path = project_path
-        self.backend_path = project_path / "backend"
+    # Dossiers contenant des routeurs Express
+    ROUTE_FOLDERS = ("routes.postgres", "routes", "modules")
+    
+    # Points d'entrée qui montent les routeurs sur l'application
+    ENTRY_POINTS = ("server.postgres.js", "server.js")
+    
+    # Dossiers dont le graphe des require() est analysé
+    MODULE_GRAPH_FOLDERS = ("services", "routes.postgres", "middlewares.postgres", "modules")
+    
+    DEFAULT_ROOT = "backend"
+    
+    def __init__(self, project_path: Path, catalog: Optional[FileCatalog] = None, content: Optional[ContentStore] = None, root: Optional[str] = None):
+        super().__init__(project_path, catalog, content, root)
+        self.backend_path = self.root
+    
+    def feature_files(self) -> List[Path]:
+        """Fichiers JavaScript du backend"""
+        return self.catalog.files(self.backend_path, (".js",), recursive=True)
     
     def analyze(self) -> Dict:
         """Analyse complète de l'architecture backend"""
@@ -360,11 +2771,13 @@ class BackendAnalyzer:
             "database": self._analyze_database(),
             "dependencies": self._analyze_dependencies(),
             "security": self._analyze_security(),
+            "module_graph": self._analyze_module_graph(),
             "code_quality": self._analyze_code_quality(),
             "metrics": self._calculate_metrics()
         }
         return analysis
     
+    @profiled_phase
     def _analyze_structure(self) -> Dict:
         """Analyse la structure du backend"""
         structure = {
@@ -377,117 +2790,174 @@ class BackendAnalyzer:
             "config": []
         }
         
-        if not self.backend_path.exists():
+        if not self.catalog.is_dir(self.backend_path):
             return structure
         
-        # Routes
-        routes_path = self.backend_path / "routes.postgres"
-        if routes_path.exists():
-            structure["routes"] = [f.name for f in routes_path.glob("*.js")]
-        
-        # Services
-        services_path = self.backend_path / "services"
-        if services_path.exists():
-            structure["services"] = [f.name for f in services_path.glob("*.js")]
-        
-        # Middlewares
-        middlewares_path = self.backend_path / "middlewares.postgres"
-        if middlewares_path.exists():
-            structure["middlewares"] = [f.name for f in middlewares_path.glob("*.js")]
-        
-        # Entities
-        entities_path = self.backend_path / "entities"
-        if entities_path.exists():
-            structure["entities"] = [f.name for f in entities_path.glob("*.js")]
-        
-        # Models
-        models_path = self.backend_path / "models"
-        if models_path.exists():
-            structure["models"] = [f.name for f in models_path.glob("*.js")]
-        
-        # Utils
-        utils_path = self.backend_path / "utils"
-        if utils_path.exists():
-            structure["utils"] = [f.name for f in utils_path.glob("*.js")]
-        
-        # Config
-        config_path = self.backend_path / "config"
-        if config_path.exists():
-            structure["config"] = [f.name for f in config_path.glob("*.js")]
+        folders = {
+            "routes": "routes.postgres",
+            "services": "services",
+            "middlewares": "middlewares.postgres",
+            "entities": "entities",
+            "models": "models",
+            "utils": "utils",
+            "config": "config"
+        }
+        for key, folder in folders.items():
+            structure[key] = [f.name for f in self.catalog.files(self.backend_path / folder, (".js",))]
         
         return structure
     
+    @profiled_phase
     def _analyze_routes(self) -> Dict:
-        """Analyse les routes API"""
-        routes_path = self.backend_path / "routes.postgres"
+        """Analyse les routes API à partir de la table des routes (préfixes de montage résolus)"""
         routes = {
             "count": 0,
             "endpoints": [],
             "methods": defaultdict(int),
-            "protected": []
+            "protected": [],
+            "table": [],
+            "unmounted": []
         }
         
-        if not routes_path.exists():
-            return routes
+        route_files = []
+        for folder in self.ROUTE_FOLDERS:
+            route_files.extend(self.catalog.files(self.backend_path / folder, (".js",), recursive=True))
         
-        for route_file in routes_path.glob("*.js"):
+        for route_file in route_files:
+            try:
+                features = self.features.get(route_file)
+            except OSError:
+                continue
+            if not features["routing"] or not features["routing"]["routes"]:
+                continue
             routes["count"] += 1
             
-            try:
-                content = route_file.read_text(encoding='utf-8', errors='ignore')
-                
-                # Détecter les méthodes HTTP
-                methods = re.findall(r'(app\.|router\.)(get|post|put|delete|patch)', content, re.IGNORECASE)
-                for method in methods:
-                    routes["methods"][method[1].upper()] += 1
-                
-                # Détecter les routes protégées
-                if "auth" in content or "requireAuth" in content or "verifyToken" in content:
-                    routes["protected"].append(route_file.stem)
-                
-                # Extraire les endpoints
-                endpoints = re.findall(r'(get|post|put|delete|patch)\s*\([\'"](\/api\/[^\'"]+)', content, re.IGNORECASE)
-                for method, endpoint in endpoints:
-                    routes["endpoints"].append(f"{method.upper()} {endpoint}")
-            except:
+            # Détecter les routes protégées
+            if features["protected"]:
+                routes["protected"].append(route_file.stem)
+        
+        table, unmounted = self._build_route_table(route_files)
+        routes["table"] = table
+        routes["unmounted"] = unmounted
+        for row in table:
+            routes["methods"][row["method"]] += 1
+            routes["endpoints"].append(f"{row['method']} {row['path']}")
+        
+        routes["methods"] = dict(routes["methods"])
+        return routes
+    
+    def _routing(self, path: Path) -> Optional[Dict]:
+        """Déclarations de routage d'un fichier (mises en cache avec ses caractéristiques)"""
+        try:
+            return self.features.get(path)["routing"]
+        except OSError:
+            return None
+    
+    def _build_route_table(self, route_files: List[Path]) -> Tuple[List[Dict], List[str]]:
+        """Table (méthode, chemin, fichier, middlewares) : chaque routeur reçoit le préfixe sous lequel il est monté"""
+        table: List[Dict] = []
+        mounted: set = set()
+        
+        def relative(path: Path) -> str:
+            return path.relative_to(self.project_path).as_posix()
+        
+        def mount(path: Path, owner: str, prefix: str, middlewares: List[str], entry: Optional[str], chain: frozenset):
+            key = (path, owner)
+            routing = self._routing(path)
+            if routing is None or key in chain:
+                return
+            chain = chain | {key}
+            mounted.add(path)
+            
+            for route_owner, method, route_path, route_middlewares, _ in routing["routes"]:
+                if route_owner == owner:
+                    table.append({
+                        "method": method,
+                        "path": _join_route(prefix, route_path),
+                        "file": relative(path),
+                        "middlewares": middlewares + route_middlewares,
+                        "entry": entry
+                    })
+            
+            for mount_owner, mount_prefix, targets in routing["mounts"]:
+                if mount_owner != owner:
+                    continue
+                # Les arguments qui ne sont pas des routeurs sont des middlewares appliqués aux suivants
+                inherited = list(middlewares)
+                for kind, target in targets:
+                    if kind == "name" and target in routing["routers"]:
+                        mount(path, target, _join_route(prefix, mount_prefix), inherited, entry, chain)
+                        continue
+                    module = target if kind == "require" else routing["requires"].get(target)
+                    resolved = self._resolve_module(path, module) if module else None
+                    target_routing = self._routing(resolved) if resolved else None
+                    exported = target_routing["exports"] if target_routing else None
+                    if exported:
+                        mount(resolved, exported, _join_route(prefix, mount_prefix), inherited, entry, chain)
+                    elif kind == "name":
+                        inherited.append(target)
+        
+        for entry_name in self.ENTRY_POINTS:
+            entry_file = self.backend_path / entry_name
+            if not self.catalog.is_file(entry_file):
                 continue
+            routing = self._routing(entry_file)
+            for app in (routing["apps"] if routing else []):
+                mount(entry_file, app, "", [], relative(entry_file), frozenset())
+        
+        # Routeurs jamais montés : chemins tels que déclarés
+        unmounted = []
+        for route_file in route_files:
+            routing = self._routing(route_file)
+            if route_file in mounted or not routing or not routing["routes"]:
+                continue
+            unmounted.append(relative(route_file))
+            for owner in dict.fromkeys(route[0] for route in routing["routes"]):
+                mount(route_file, owner, "", [], None, frozenset())
         
-        return dict(routes)
+        return table, unmounted
+    
+    @profiled_phase
+    def _analyze_module_graph(self) -> Dict:
+        """Graphe des require() : cycles, fan-in/fan-out et plus longues chaînes"""
+        files = []
+        for folder in self.MODULE_GRAPH_FOLDERS:
+            files.extend(self.catalog.files(self.backend_path / folder, (".js",), recursive=True))
+        return self._build_module_graph(files)
     
+    @profiled_phase
     def _analyze_services(self) -> Dict:
         """Analyse les services backend"""
         services_path = self.backend_path / "services"
         services = {
             "count": 0,
             "list": [],
-            "patterns": [],
+            "patterns": Counter(),
             "async_methods": defaultdict(int)
         }
         
-        if not services_path.exists():
-            return services
-        
-        for service_file in services_path.glob("*.js"):
+        for service_file in self.catalog.files(services_path, (".js",)):
             services["count"] += 1
             services["list"].append(service_file.stem)
             
             try:
-                content = service_file.read_text(encoding='utf-8', errors='ignore')
+                features = self.features.get(service_file)
                 
                 # Détecter les méthodes async
-                async_methods = len(re.findall(r'async\s+(\w+)', content))
-                services["async_methods"][service_file.stem] = async_methods
+                services["async_methods"][service_file.stem] = features["async_methods"]
                 
                 # Détecter les patterns
-                if "class" in content:
-                    services["patterns"].append("Class-based")
-                if "module.exports" in content:
-                    services["patterns"].append("Module exports")
+                if features["class_based"]:
+                    services["patterns"]["Class-based"] += 1
+                if features["module_exports"]:
+                    services["patterns"]["Module exports"] += 1
             except:
                 continue
         
-        return dict(services)
+        services["async_methods"] = dict(services["async_methods"])
+        return services
     
+    @profiled_phase
     def _analyze_middlewares(self) -> Dict:
         """Analyse les middlewares"""
         middlewares_path = self.backend_path / "middlewares.postgres"
@@ -497,29 +2967,23 @@ class BackendAnalyzer:
             "types": []
         }
         
-        if not middlewares_path.exists():
-            return middlewares
-        
-        for middleware_file in middlewares_path.glob("*.js"):
+        for middleware_file in self.catalog.files(middlewares_path, (".js",)):
             middlewares["count"] += 1
             middlewares["list"].append(middleware_file.stem)
             
-            try:
-                content = middleware_file.read_text(encoding='utf-8', errors='ignore')
-                
-                if "auth" in middleware_file.stem.lower():
-                    middlewares["types"].append("Authentication")
-                elif "geo" in middleware_file.stem.lower():
-                    middlewares["types"].append("Geofencing")
-                elif "rate" in middleware_file.stem.lower():
-                    middlewares["types"].append("Rate Limiting")
-                else:
-                    middlewares["types"].append("Custom")
-            except:
-                continue
+            # Le type se déduit du nom du fichier, sans lire son contenu
+            if "auth" in middleware_file.stem.lower():
+                middlewares["types"].append("Authentication")
+            elif "geo" in middleware_file.stem.lower():
+                middlewares["types"].append("Geofencing")
+            elif "rate" in middleware_file.stem.lower():
+                middlewares["types"].append("Rate Limiting")
+            else:
+                middlewares["types"].append("Custom")
         
         return middlewares
     
+    @profiled_phase
     def _analyze_entities(self) -> Dict:
         """Analyse les entités TypeORM"""
         entities_path = self.backend_path / "entities"
@@ -529,24 +2993,20 @@ class BackendAnalyzer:
             "relations": defaultdict(int)
         }
         
-        if not entities_path.exists():
-            return entities
-        
-        for entity_file in entities_path.glob("*.js"):
+        for entity_file in self.catalog.files(entities_path, (".js",)):
             entities["count"] += 1
             entities["list"].append(entity_file.stem)
             
             try:
-                content = entity_file.read_text(encoding='utf-8', errors='ignore')
-                
                 # Compter les relations
-                relations = len(re.findall(r'@(OneToMany|ManyToOne|ManyToMany|OneToOne)', content))
-                entities["relations"][entity_file.stem] = relations
+                entities["relations"][entity_file.stem] = self.features.get(entity_file)["relations"]
             except:
                 continue
         
-        return dict(entities)
+        entities["relations"] = dict(entities["relations"])
+        return entities
     
+    @profiled_phase
     def _analyze_database(self) -> Dict:
         """Analyse la configuration de la base de données"""
         database = {
@@ -558,9 +3018,9 @@ class BackendAnalyzer:
         
         # Vérifier PostGIS
         config_file = self.backend_path / "config" / "database.js"
-        if config_file.exists():
+        if self.catalog.is_file(config_file):
             try:
-                content = config_file.read_text(encoding='utf-8', errors='ignore')
+                content = self.content.read(config_file)
                 if "postgis" in content.lower() or "PostGIS" in content:
                     database["postgis"] = True
             except:
@@ -568,11 +3028,11 @@ class BackendAnalyzer:
         
         # Analyser les migrations
         migrations_path = self.backend_path / "migrations"
-        if migrations_path.exists():
-            database["migrations"] = [f.name for f in migrations_path.glob("*.sql")]
+        database["migrations"] = [f.name for f in self.catalog.files(migrations_path, (".sql",))]
         
         return database
     
+    @profiled_phase
     def _analyze_dependencies(self) -> Dict:
         """Analyse les dépendances npm"""
         package_file = self.backend_path / "package.json"
@@ -582,10 +3042,9 @@ class BackendAnalyzer:
             "total": 0
         }
         
-        if package_file.exists():
+        if self.catalog.is_file(package_file):
             try:
-                with open(package_file, 'r', encoding='utf-8') as f:
-                    package_data = json.load(f)
+                package_data = self.content.read_json(package_file)
                 
                 dependencies["production"] = package_data.get("dependencies", {})
                 dependencies["development"] = package_data.get("devDependencies", {})
@@ -595,6 +3054,7 @@ class BackendAnalyzer:
         
         return dependencies
     
+    @profiled_phase
     def _analyze_security(self) -> Dict:
         """Analyse la sécurité"""
         security = {
@@ -608,9 +3068,9 @@ class BackendAnalyzer:
         
         # Analyser server.postgres.js
         server_file = self.backend_path / "server.postgres.js"
-        if server_file.exists():
+        if self.catalog.is_file(server_file):
             try:
-                content = server_file.read_text(encoding='utf-8', errors='ignore')
+                content = self.content.read(server_file)
                 
                 security["jwt"] = "jsonwebtoken" in content or "jwt" in content.lower()
                 security["helmet"] = "helmet" in content.lower()
@@ -623,6 +3083,7 @@ class BackendAnalyzer:
         
         return security
     
+    @profiled_phase
     def _analyze_code_quality(self) -> Dict:
         """Analyse la qualité du code"""
         quality = {
@@ -633,25 +3094,24 @@ class BackendAnalyzer:
             "error_handling": False
         }
         
-        js_files = list(self.backend_path.rglob("*.js"))
+        js_files = self.catalog.files(self.backend_path, (".js",), recursive=True)
         quality["total_files"] = len(js_files)
         
         total_lines = 0
         documented_files = 0
         error_handling_files = 0
         
-        for file_path in js_files[:100]:  # Limiter pour performance
+        for file_path in js_files:
             try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-                lines = len(content.splitlines())
-                total_lines += lines
+                features = self.features.get(file_path)
+                total_lines += features["lines"]
                 
                 # Vérifier la documentation
-                if "///" in content or "/**" in content or "/*" in content:
+                if features["documented"]:
                     documented_files += 1
                 
                 # Vérifier la gestion d'erreurs
-                if "try" in content and "catch" in content:
+                if features["error_handling"]:
                     error_handling_files += 1
             except:
                 continue
@@ -664,22 +3124,46 @@ class BackendAnalyzer:
         
         return quality
     
+    @profiled_phase
     def _calculate_metrics(self) -> Dict:
         """Calcule les métriques backend"""
         metrics = {
-            "routes_count": len(list((self.backend_path / "routes.postgres").glob("*.js")) if (self.backend_path / "routes.postgres").exists() else []),
-            "services_count": len(list((self.backend_path / "services").glob("*.js")) if (self.backend_path / "services").exists() else []),
-            "entities_count": len(list((self.backend_path / "entities").glob("*.js")) if (self.backend_path / "entities").exists() else []),
-            "middlewares_count": len(list((self.backend_path / "middlewares.postgres").glob("*.js")) if (self.backend_path / "middlewares.postgres").exists() else [])
+            "routes_count": len(self.catalog.files(self.backend_path / "routes.postgres", (".js",))),
+            "services_count": len(self.catalog.files(self.backend_path / "services", (".js",))),
+            "entities_count": len(self.catalog.files(self.backend_path / "entities", (".js",))),
+            "middlewares_count": len(self.catalog.files(self.backend_path / "middlewares.postgres", (".js",)))
         }
         return metrics
 
-class DashboardAnalyzer:
+class DashboardAnalyzer(BaseAnalyzer):
     """Analyseur pour le dashboard Admin (React)"""
     
-    def __init__(self, project_path: Path):
-        self.project_path = project_path
-        self.dashboard_path = project_path / "admin-dashboard"
+    # Extensions des fichiers sources React / TypeScript
+    SOURCE_EXTENSIONS = (".js", ".jsx", ".mjs", ".ts", ".tsx")
+    MODULE_EXTENSIONS = SOURCE_EXTENSIONS
+    
+    DEFAULT_ROOT = "admin-dashboard"
+    
+    def __init__(self, project_path: Path, catalog: Optional[FileCatalog] = None, content: Optional[ContentStore] = None, root: Optional[str] = None):
+        super().__init__(project_path, catalog, content, root)
+        self.dashboard_path = self.root
+        self._sources: Optional[Tuple[FileCatalog, Dict[Optional[str], List[Path]]]] = None
+    
+    def _source_files(self, folder: Optional[str] = None) -> List[Path]:
+        """Fichiers sources de src/, énumérés une seule fois puis regroupés par dossier de premier niveau"""
+        if self._sources is None or self._sources[0] is not self.catalog:
+            src_path = self.dashboard_path / "src"
+            by_folder: Dict[Optional[str], List[Path]] = defaultdict(list)
+            for path in self.catalog.files(src_path, self.SOURCE_EXTENSIONS, recursive=True):
+                parts = path.relative_to(src_path).parts
+                by_folder[parts[0] if len(parts) > 1 else ""].append(path)
+                by_folder[None].append(path)
+            self._sources = (self.catalog, dict(by_folder))
+        return self._sources[1].get(folder, [])
+    
+    def feature_files(self) -> List[Path]:
+        """Tous les fichiers sources du dashboard"""
+        return self._source_files()
     
     def analyze(self) -> Dict:
         """Analyse complète de l'architecture dashboard"""
@@ -689,11 +3173,13 @@ class DashboardAnalyzer:
             "pages": self._analyze_pages(),
             "services": self._analyze_services(),
             "dependencies": self._analyze_dependencies(),
+            "module_graph": self._analyze_module_graph(),
             "code_quality": self._analyze_code_quality(),
             "metrics": self._calculate_metrics()
         }
         return analysis
     
+    @profiled_phase
     def _analyze_structure(self) -> Dict:
         """Analyse la structure du dashboard"""
         structure = {
@@ -703,106 +3189,77 @@ class DashboardAnalyzer:
             "utils": []
         }
         
-        if not self.dashboard_path.exists():
-            return structure
-        
         src_path = self.dashboard_path / "src"
-        if not src_path.exists():
+        if not self.catalog.is_dir(src_path):
             return structure
         
-        # Components
-        components_path = src_path / "components"
-        if components_path.exists():
-            structure["components"] = [f.name for f in components_path.rglob("*.jsx")]
-        
-        # Pages
-        pages_path = src_path / "pages"
-        if pages_path.exists():
-            structure["pages"] = [f.name for f in pages_path.rglob("*.jsx")]
-        
-        # Services
-        services_path = src_path / "services"
-        if services_path.exists():
-            structure["services"] = [f.name for f in services_path.rglob("*.js")]
-        
-        # Utils
-        utils_path = src_path / "utils"
-        if utils_path.exists():
-            structure["utils"] = [f.name for f in utils_path.rglob("*.js")]
+        for folder in ("components", "pages", "services", "utils"):
+            structure[folder] = [f.name for f in self._source_files(folder)]
         
         return structure
     
+    @profiled_phase
     def _analyze_components(self) -> Dict:
         """Analyse les composants React"""
-        components_path = self.dashboard_path / "src" / "components"
         components = {
             "count": 0,
             "list": [],
-            "hooks": []
+            "hooks": Counter()
         }
         
-        if not components_path.exists():
-            return components
-        
-        for component_file in components_path.rglob("*.jsx"):
+        for component_file in self._source_files("components"):
             components["count"] += 1
             components["list"].append(str(component_file.relative_to(self.dashboard_path)))
             
             try:
-                content = component_file.read_text(encoding='utf-8', errors='ignore')
-                
                 # Détecter les hooks
-                hooks = re.findall(r'use(\w+)', content)
-                components["hooks"].extend(hooks)
+                components["hooks"].update(self.features.get(component_file)["hooks"])
             except:
                 continue
         
         return components
     
+    @profiled_phase
     def _analyze_pages(self) -> Dict:
         """Analyse les pages"""
-        pages_path = self.dashboard_path / "src" / "pages"
         pages = {
             "count": 0,
             "list": []
         }
         
-        if not pages_path.exists():
-            return pages
-        
-        for page_file in pages_path.rglob("*.jsx"):
+        for page_file in self._source_files("pages"):
             pages["count"] += 1
             pages["list"].append(page_file.stem)
         
         return pages
     
+    @profiled_phase
     def _analyze_services(self) -> Dict:
         """Analyse les services"""
-        services_path = self.dashboard_path / "src" / "services"
         services = {
             "count": 0,
             "list": [],
-            "api_calls": []
+            "api_calls": Counter()
         }
         
-        if not services_path.exists():
-            return services
-        
-        for service_file in services_path.rglob("*.js"):
+        for service_file in self._source_files("services"):
             services["count"] += 1
             services["list"].append(service_file.stem)
             
             try:
-                content = service_file.read_text(encoding='utf-8', errors='ignore')
-                
                 # Détecter les appels API
-                api_calls = re.findall(r'(fetch|axios|\.get|\.post|\.put|\.delete)', content)
-                services["api_calls"].extend(api_calls)
+                services["api_calls"].update(self.features.get(service_file)["api_calls"])
             except:
                 continue
         
         return services
     
+    @profiled_phase
+    def _analyze_module_graph(self) -> Dict:
+        """Graphe des imports de src/ : cycles, fan-in/fan-out et plus longues chaînes"""
+        return self._build_module_graph(self._source_files())
+    
+    @profiled_phase
     def _analyze_dependencies(self) -> Dict:
         """Analyse les dépendances npm"""
         package_file = self.dashboard_path / "package.json"
@@ -812,10 +3269,9 @@ class DashboardAnalyzer:
             "total": 0
         }
         
-        if package_file.exists():
+        if self.catalog.is_file(package_file):
             try:
-                with open(package_file, 'r', encoding='utf-8') as f:
-                    package_data = json.load(f)
+                package_data = self.content.read_json(package_file)
                 
                 dependencies["production"] = package_data.get("dependencies", {})
                 dependencies["development"] = package_data.get("devDependencies", {})
@@ -825,6 +3281,7 @@ class DashboardAnalyzer:
         
         return dependencies
     
+    @profiled_phase
     def _analyze_code_quality(self) -> Dict:
         """Analyse la qualité du code"""
         quality = {
@@ -834,20 +3291,19 @@ class DashboardAnalyzer:
             "documentation": 0
         }
         
-        js_files = list((self.dashboard_path / "src").rglob("*.{js,jsx}")) if (self.dashboard_path / "src").exists() else []
+        js_files = self._source_files()
         quality["total_files"] = len(js_files)
         
         total_lines = 0
         documented_files = 0
         
-        for file_path in js_files[:50]:  # Limiter pour performance
+        for file_path in js_files:
             try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-                lines = len(content.splitlines())
-                total_lines += lines
+                features = self.features.get(file_path)
+                total_lines += features["lines"]
                 
                 # Vérifier la documentation
-                if "///" in content or "/**" in content or "/*" in content:
+                if features["documented"]:
                     documented_files += 1
             except:
                 continue
@@ -859,34 +3315,194 @@ class DashboardAnalyzer:
         
         return quality
     
+    @profiled_phase
     def _calculate_metrics(self) -> Dict:
         """Calcule les métriques dashboard"""
-        src_path = self.dashboard_path / "src"
         metrics = {
-            "components_count": len(list((src_path / "components").rglob("*.jsx")) if (src_path / "components").exists() else []),
-            "pages_count": len(list((src_path / "pages").rglob("*.jsx")) if (src_path / "pages").exists() else []),
-            "services_count": len(list((src_path / "services").rglob("*.js")) if (src_path / "services").exists() else [])
+            "components_count": len(self._source_files("components")),
+            "pages_count": len(self._source_files("pages")),
+            "services_count": len(self._source_files("services"))
         }
         return metrics
 
+class AnalyzerSpec(NamedTuple):
+    """Analyseur enregistré : dossiers couverts (le premier est la racine du sous-projet) et classe à instancier
+    
+    factory est une classe ou une référence « module:Classe », importée seulement si le sous-projet existe.
+    Avec local, la référence vient de la configuration du projet analysé : le module est un fichier de ce projet.
+    """
+    name: str
+    paths: Tuple[str, ...]
+    factory: Union[type, str]
+    label: str = ""
+    local: bool = False
+    
+    @property
+    def root(self) -> str:
+        """Dossier racine du sous-projet"""
+        return self.paths[0]
+    
+    def load(self, project_path: Path) -> type:
+        """Classe de l'analyseur (import du module du plugin à la demande)"""
+        if not isinstance(self.factory, str):
+            return self.factory
+        module_name, _, attribute = self.factory.partition(":")
+        if self.local:
+            return getattr(_load_project_module(project_path, module_name), attribute or "Analyzer")
+        import importlib
+        return getattr(importlib.import_module(module_name), attribute or "Analyzer")
+    
+    def create(self, project_path: Path, content: ContentStore) -> BaseAnalyzer:
+        """Instancie l'analyseur sur son sous-projet"""
+        return self.load(project_path)(project_path, content=content, root=self.root)
+
+def _load_project_module(project_path: Path, module_name: str):
+    """Module d'un plugin du projet (« tools.mon_plugin » ou « tools/mon_plugin.py »), exécuté depuis son fichier
+    
+    Le module reçoit un nom propre à la racine analysée : sys.path n'est pas modifié et deux projets
+    déclarant le même module n'en partagent jamais l'exécution.
+    """
+    import hashlib
+    import importlib.util
+    root = project_path.resolve()
+    relative = Path(module_name) if module_name.endswith(".py") else Path(*module_name.split("."))
+    file_path = (root / relative).resolve()
+    if file_path.is_dir():
+        file_path = file_path / "__init__.py"
+    elif file_path.suffix != ".py":
+        file_path = file_path.with_suffix(".py")
+    if root not in file_path.parents or not file_path.is_file():
+        raise ImportError(f"module {module_name} introuvable dans {root}")
+    
+    unique_name = f"_architecte_plugin_{hashlib.blake2b(str(root).encode(), digest_size=6).hexdigest()}_{module_name.replace('.', '_').replace('/', '_')}"
+    spec = importlib.util.spec_from_file_location(unique_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    # Enregistré le temps de l'exécution (dataclasses, typing), sous ce seul nom, puis retiré
+    sys.modules[unique_name] = module
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.modules.pop(unique_name, None)
+    return module
+
+# Analyseurs intégrés, dans l'ordre du rapport
+BUILTIN_ANALYZERS = (
+    AnalyzerSpec("ios", ("Tshiakani VTC", "TshiakaniVTCTests", "TshiakaniVTCUITests"), IOSAnalyzer, "  📱 Analyse iOS..."),
+    AnalyzerSpec("backend", ("backend",), BackendAnalyzer, "  🔧 Analyse Backend..."),
+    AnalyzerSpec("dashboard", ("admin-dashboard",), DashboardAnalyzer, "  🎨 Analyse Dashboard...")
+)
+
+# Champ du rapport de chaque analyseur intégré (les plugins vont dans plugin_analyses)
+BUILTIN_REPORT_FIELDS = {"ios": "ios_analysis", "backend": "backend_analysis", "dashboard": "dashboard_analysis"}
+
+# Groupe d'entry points des plugins : nom -> AnalyzerSpec ou dict {"paths", "analyzer", "label"}
+ANALYZER_ENTRY_POINT_GROUP = "architecte.analyzers"
+
+# Configuration du projet : {"analyzers": {nom: {"paths", "analyzer", "label"} | {"enabled": false}}}.
+# Un « analyzer » déclaré là exécute du code du projet analysé : il n'est chargé qu'avec --project-plugins.
+ANALYZER_CONFIG_FILE = ".architecte.json"
+
+def _analyzer_spec(name: str, declaration: Union[AnalyzerSpec, Dict], base: Optional[AnalyzerSpec] = None, local: bool = False) -> AnalyzerSpec:
+    """Spécification déclarée par un entry point ou la configuration (complète éventuellement un analyseur existant)
+    
+    local : la déclaration vient de la configuration du projet, son « analyzer » est un module de ce projet.
+    """
+    if isinstance(declaration, AnalyzerSpec):
+        return declaration._replace(name=name)
+    paths = declaration.get("paths") or ([declaration["path"]] if "path" in declaration else list(base.paths if base else ()))
+    factory = declaration.get("analyzer", base.factory if base else None)
+    if not paths or factory is None:
+        raise ValueError("« paths » et « analyzer » sont requis")
+    return AnalyzerSpec(name, tuple(paths), factory, declaration.get("label", base.label if base else f"  🧩 Analyse {name}..."),
+                        local=(local and "analyzer" in declaration) or (base.local if base else False))
+
+@functools.lru_cache(maxsize=None)
+def _entry_point_specs() -> Tuple[AnalyzerSpec, ...]:
+    """Analyseurs déclarés par les paquets installés (seule la déclaration est importée, pas l'analyseur)"""
+    from importlib.metadata import entry_points
+    try:
+        declared = entry_points(group=ANALYZER_ENTRY_POINT_GROUP)
+    except TypeError:
+        declared = entry_points().get(ANALYZER_ENTRY_POINT_GROUP, [])
+    specs = []
+    for entry_point in declared:
+        try:
+            specs.append(_analyzer_spec(entry_point.name, entry_point.load()))
+        except Exception as e:
+            print(f"  ⚠️ Plugin {entry_point.name} ignoré: {e}")
+    return tuple(specs)
+
+def load_analyzer_specs(project_path: Path, only: Optional[List[str]] = None, project_plugins: bool = False) -> List[AnalyzerSpec]:
+    """Registre des analyseurs : intégrés, puis entry points, puis configuration du projet (ajouts, dossiers, désactivations)
+    
+    Les analyseurs dont le code vient du projet analysé ne sont retenus qu'avec project_plugins.
+    """
+    specs = {spec.name: spec for spec in BUILTIN_ANALYZERS}
+    specs.update((spec.name, spec) for spec in _entry_point_specs())
+    
+    config_path = project_path / ANALYZER_CONFIG_FILE
+    if config_path.is_file():
+        try:
+            with open(config_path, encoding='utf-8') as f:
+                configured = json.load(f).get("analyzers", {})
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"  ⚠️ Configuration {ANALYZER_CONFIG_FILE} ignorée: {e}")
+            configured = {}
+        for name, declaration in configured.items():
+            if declaration is False or (isinstance(declaration, dict) and declaration.get("enabled") is False):
+                specs.pop(name, None)
+                continue
+            if isinstance(declaration, dict) and "analyzer" in declaration and not project_plugins:
+                print(f"  ⚠️ Analyseur {name} du projet ignoré : son code n'est chargé qu'avec --project-plugins")
+                continue
+            try:
+                specs[name] = _analyzer_spec(name, declaration, specs.get(name), local=True)
+            except (ValueError, AttributeError, TypeError) as e:
+                print(f"  ⚠️ Analyseur {name} ignoré: {e}")
+    
+    if only is not None:
+        unknown = sorted(set(only) - specs.keys())
+        if unknown:
+            print(f"  ⚠️ Analyseurs inconnus: {', '.join(unknown)} (disponibles: {', '.join(specs)})")
+        specs = {name: spec for name, spec in specs.items() if name in only}
+    return list(specs.values())
+
 class RecommendationEngine:
     """Moteur de recommandations architecturales"""
     
-    def __init__(self):
+    def __init__(self, project_path: Path = Path("."), catalog: Optional[FileCatalog] = None):
         self.recommendations = []
+        self.project_path = project_path
+        self._catalog = catalog
+        # Racines des sous-projets analysés (clé du registre -> dossier)
+        self.roots: Dict[str, Path] = {spec.name: project_path / spec.root for spec in BUILTIN_ANALYZERS}
+    
+    @property
+    def catalog(self) -> FileCatalog:
+        """Catalogue partagé, construit à la demande si le moteur est utilisé seul"""
+        if self._catalog is None:
+            self._catalog = FileCatalog(self.project_path)
+        return self._catalog
+    
+    @catalog.setter
+    def catalog(self, catalog: FileCatalog):
+        self._catalog = catalog
     
     def generate_recommendations(self, ios_analysis: Dict, backend_analysis: Dict, dashboard_analysis: Dict) -> List[Dict]:
         """Génère des recommandations basées sur l'analyse"""
         recommendations = []
         
         # Recommandations iOS
-        recommendations.extend(self._ios_recommendations(ios_analysis))
+        if ios_analysis:
+            recommendations.extend(self._ios_recommendations(ios_analysis))
         
         # Recommandations Backend
-        recommendations.extend(self._backend_recommendations(backend_analysis))
+        if backend_analysis:
+            recommendations.extend(self._backend_recommendations(backend_analysis))
         
         # Recommandations Dashboard
-        recommendations.extend(self._dashboard_recommendations(dashboard_analysis))
+        if dashboard_analysis:
+            recommendations.extend(self._dashboard_recommendations(dashboard_analysis))
         
         # Recommandations globales
         recommendations.extend(self._global_recommendations(ios_analysis, backend_analysis, dashboard_analysis))
@@ -909,7 +3525,7 @@ class RecommendationEngine:
             })
         
         # Vérifier les tests
-        if not any("test" in str(f).lower() for f in Path(".").rglob("*.swift")):
+        if not any("test" in str(f.relative_to(self.project_path)).lower() for f in self.catalog.files_by_extension(".swift")):
             recommendations.append({
                 "category": "iOS",
                 "priority": "high",
@@ -918,6 +3534,18 @@ class RecommendationEngine:
                 "impact": "Qualité"
             })
         
+        # Vérifier les instanciations dans les vues (recréées à chaque rendu)
+        instantiations = analysis.get("usage_graph", {}).get("render_instantiations", [])
+        if instantiations:
+            views = sorted({item["view"] for item in instantiations})
+            recommendations.append({
+                "category": "iOS",
+                "priority": "high",
+                "title": "Ne pas instancier de ViewModels ou services dans les vues",
+                "description": f"{len(instantiations)} instanciation(s) recréée(s) à chaque rendu dans {len(views)} vue(s) ({', '.join(views[:3])}). Utilisez @StateObject ou injectez l'instance existante.",
+                "impact": "Performance"
+            })
+        
         # Vérifier les services
         services = analysis.get("services", {})
         if services.get("count", 0) > 15:
@@ -958,7 +3586,7 @@ class RecommendationEngine:
             })
         
         # Vérifier les tests
-        if not (Path("backend") / "__tests__").exists():
+        if not self.catalog.is_dir(self.roots["backend"] / "__tests__"):
             recommendations.append({
                 "category": "Backend",
                 "priority": "high",
@@ -967,6 +3595,9 @@ class RecommendationEngine:
                 "impact": "Qualité"
             })
         
+        # Vérifier les require() circulaires (coût au démarrage à froid)
+        recommendations.extend(self._module_graph_recommendations("Backend", analysis.get("module_graph", {})))
+        
         # Vérifier PostGIS
         database = analysis.get("database", {})
         if not database.get("postgis", False):
@@ -984,6 +3615,8 @@ class RecommendationEngine:
         """Recommandations pour le dashboard"""
         recommendations = []
         
+        recommendations.extend(self._module_graph_recommendations("Dashboard", analysis.get("module_graph", {})))
+        
         # Vérifier la documentation
         code_quality = analysis.get("code_quality", {})
         if code_quality.get("documentation", 0) < 30:
@@ -997,6 +3630,20 @@ class RecommendationEngine:
         
         return recommendations
     
+    def _module_graph_recommendations(self, category: str, graph: Dict) -> List[Dict]:
+        """Recommandations sur les imports circulaires"""
+        cycles = graph.get("cycles", [])
+        if not cycles:
+            return []
+        largest = max(cycles, key=len)
+        return [{
+            "category": category,
+            "priority": "medium",
+            "title": "Supprimer les dépendances circulaires",
+            "description": f"{len(cycles)} cycle(s) d'imports détecté(s), le plus grand regroupe {len(largest)} modules (dont {largest[0]}).",
+            "impact": "Performance"
+        }]
+    
     def _global_recommendations(self, ios_analysis: Dict, backend_analysis: Dict, dashboard_analysis: Dict) -> List[Dict]:
         """Recommandations globales"""
         recommendations = []
@@ -1011,7 +3658,7 @@ class RecommendationEngine:
         })
         
         # CI/CD
-        if not Path(".github/workflows").exists() and not Path(".gitlab-ci.yml").exists():
+        if not self.catalog.is_dir(self.project_path / ".github" / "workflows") and not self.catalog.is_file(self.project_path / ".gitlab-ci.yml"):
             recommendations.append({
                 "category": "Global",
                 "priority": "medium",
@@ -1021,7 +3668,7 @@ class RecommendationEngine:
             })
         
         # Documentation API
-        if not (Path("backend") / "swagger.json").exists():
+        if "backend" in self.roots and not self.catalog.is_file(self.roots["backend"] / "swagger.json"):
             recommendations.append({
                 "category": "Global",
                 "priority": "medium",
@@ -1032,37 +3679,552 @@ class RecommendationEngine:
         
         return recommendations
 
+# Profondeur des piles conservées par tracemalloc en mode --profile
+TRACEMALLOC_FRAMES = 32
+
+# Seuil (secondes) en dessous duquel une branche de pile CPU n'est plus développée
+FOLDED_MIN_SECONDS = 1e-5
+
+def _frame_label(filename: str, line: int, name: str) -> str:
+    """Libellé d'un cadre de pile, sans les séparateurs du format replié"""
+    location = f"{os.path.basename(filename)}:{line}"
+    label = f"{name} ({location})" if name else location
+    return label.replace(";", ":")
+
+def folded_cpu_stacks(stats) -> str:
+    """Convertit des statistiques cProfile en piles repliées (« a;b;c microsecondes ») pour flamegraph
+    
+    cProfile ne conserve que les arcs appelant → appelé : le temps de chaque fonction est réparti
+    le long des chemins au prorata du temps cumulé de chaque arc.
+    """
+    entries = stats.stats
+    callees: Dict[Tuple, Dict[Tuple, float]] = defaultdict(dict)
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees[caller][function] = cumulative
+    
+    folded: Dict[str, float] = defaultdict(float)
+    
+    def walk(function: Tuple, stack: List[str], visiting: set, scale: float):
+        _, _, self_time, cumulative, _ = entries[function]
+        stack = stack + [_frame_label(*function)]
+        if self_time * scale > 0:
+            folded[";".join(stack)] += self_time * scale
+        visiting.add(function)
+        for callee, edge_time in callees.get(function, {}).items():
+            callee_cumulative = entries[callee][3]
+            share = scale * edge_time
+            if callee in visiting or callee_cumulative <= 0 or share < FOLDED_MIN_SECONDS:
+                continue
+            walk(callee, stack, visiting, share / callee_cumulative)
+        visiting.discard(function)
+    
+    for function, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            walk(function, [], set(), 1.0)
+    
+    return "".join(f"{stack} {int(seconds * 1e6)}\n" for stack, seconds in sorted(folded.items()) if seconds >= 1e-6)
+
+def folded_memory_stacks(snapshot) -> str:
+    """Convertit un instantané tracemalloc en piles repliées (« a;b;c octets ») pour flamegraph"""
+    lines = []
+    for statistic in snapshot.statistics("traceback"):
+        stack = ";".join(_frame_label(frame.filename, frame.lineno, "") for frame in statistic.traceback)
+        lines.append(f"{stack} {statistic.size}\n")
+    return "".join(lines)
+
+# Mode --watch : délai de regroupement des événements d'une même sauvegarde et période de scrutation
+WATCH_DEBOUNCE_SECONDS = 0.03
+WATCH_POLL_INTERVAL = 0.5
+
+# Fichiers sans effet sur l'analyse : rapports générés et fichiers temporaires des éditeurs
+WATCH_IGNORED_PREFIXES = ("RAPPORT_ARCHITECTURE_", "PROFIL_ARCHITECTURE_")
+WATCH_IGNORED_SUFFIXES = ("~", ".swp", ".swx", ".tmp")
+
+class InotifyWatcher:
+    """Surveillance inotify (Linux, via ctypes) des dossiers du catalogue
+    
+    wait() bloque jusqu'à un lot de modifications : (fichiers modifiés, structure modifiée).
+    Les fichiers valent None si des événements ont été perdus (file d'attente du noyau saturée).
+    """
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    
+    STRUCTURAL = IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | STRUCTURAL
+    
+    def __init__(self, debounce: float = WATCH_DEBOUNCE_SECONDS):
+        import ctypes
+        import ctypes.util
+        
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify n'est disponible que sous Linux")
+        self.debounce = debounce
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._directories: Dict[int, Path] = {}
+        self._watched: set = set()
+    
+    def watch(self, catalog: FileCatalog):
+        """Surveille les dossiers du catalogue qui ne le sont pas encore"""
+        import ctypes
+        
+        for directory in catalog.directories():
+            if directory in self._watched:
+                continue
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                # Dossier supprimé entre-temps : il sera retiré du catalogue à la prochaine reconstruction
+                if errno == 2:
+                    continue
+                raise OSError(errno, os.strerror(errno), str(directory))
+            self._directories[wd] = directory
+            self._watched.add(directory)
+    
+    def wait(self) -> Tuple[Optional[set], bool]:
+        """Attend un lot d'événements, regroupés tant qu'ils arrivent à moins de debounce secondes d'intervalle"""
+        import select
+        import struct
+        
+        changed: Optional[set] = set()
+        structural = False
+        timeout = None
+        while True:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            if not ready:
+                return changed, structural
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = struct.unpack_from("iIII", buffer, offset)
+                name = buffer[offset + 16:offset + 16 + length].rstrip(b"\0")
+                offset += 16 + length
+                if mask & self.IN_Q_OVERFLOW:
+                    changed, structural = None, True
+                    continue
+                if mask & self.IN_IGNORED:
+                    self._watched.discard(self._directories.pop(wd, None))
+                    continue
+                if mask & (self.STRUCTURAL | self.IN_ISDIR):
+                    structural = True
+                directory = self._directories.get(wd)
+                if directory is not None and name and changed is not None:
+                    changed.add(directory / os.fsdecode(name))
+            timeout = self.debounce
+    
+    def close(self):
+        """Libère le descripteur inotify"""
+        os.close(self._fd)
+
+class PollingWatcher:
+    """Surveillance par scrutation périodique (mtime et taille des fichiers, mtime des dossiers)"""
+    
+    def __init__(self, interval: float = WATCH_POLL_INTERVAL):
+        self.interval = interval
+        self._files: Dict[Path, Tuple[int, int]] = {}
+        self._directories: Dict[Path, int] = {}
+    
+    def watch(self, catalog: FileCatalog):
+        """Prend l'instantané de référence du catalogue"""
+        self._directories = dict(self._snapshot(catalog.directories(), lambda st: st.st_mtime_ns))
+        self._files = dict(self._snapshot(
+            [catalog.project_path / rel for rel in catalog.relative_paths()],
+            lambda st: (st.st_mtime_ns, st.st_size)
+        ))
+    
+    @staticmethod
+    def _snapshot(paths: List[Path], key):
+        """(chemin, empreinte) des chemins encore présents"""
+        for path in paths:
+            try:
+                yield path, key(path.stat())
+            except OSError:
+                continue
+    
+    def wait(self) -> Tuple[Optional[set], bool]:
+        """Attend qu'un fichier ou un dossier du dernier instantané change"""
+        while True:
+            time.sleep(self.interval)
+            changed = set()
+            structural = False
+            for path, known in self._files.items():
+                try:
+                    stat = path.stat()
+                except OSError:
+                    changed.add(path)
+                    structural = True
+                    continue
+                if (stat.st_mtime_ns, stat.st_size) != known:
+                    changed.add(path)
+                    self._files[path] = (stat.st_mtime_ns, stat.st_size)
+            # Création ou suppression d'une entrée : le mtime du dossier parent change
+            for directory, known in self._directories.items():
+                try:
+                    if directory.stat().st_mtime_ns != known:
+                        structural = True
+                except OSError:
+                    structural = True
+            if changed or structural:
+                return changed, structural
+    
+    def close(self):
+        """Rien à libérer"""
+
+def create_watcher(poll_interval: float = WATCH_POLL_INTERVAL):
+    """inotify si disponible, sinon scrutation périodique"""
+    try:
+        return InotifyWatcher()
+    except (OSError, AttributeError) as e:
+        print(f"  ⚠️ inotify indisponible ({e}), surveillance par scrutation toutes les {poll_interval}s")
+        return PollingWatcher(poll_interval)
+
+# Taille au-delà de laquelle un fichier est signalé dans le rapport NDJSON
+LARGE_FILE_LINES = 500
+
+def file_findings(features: Dict) -> List[Dict]:
+    """Constats propres à un fichier (sans contexte global), émis avec son enregistrement NDJSON"""
+    findings = []
+    if features.get("lines", 0) > LARGE_FILE_LINES:
+        findings.append({"code": "large_file", "message": f"{features['lines']} lignes (plus de {LARGE_FILE_LINES})"})
+    if not features.get("documented", True):
+        findings.append({"code": "undocumented", "message": "Aucun commentaire de documentation"})
+    if features.get("shared_instance") and not features.get("singleton"):
+        findings.append({"code": "mutable_singleton", "message": "static var shared : singleton réaffectable"})
+    for wrapper, type_name, line, origin in features.get("object_bindings", ()):
+        if wrapper == "ObservedObject" and origin == "init":
+            findings.append({"code": "observed_object_init", "line": line, "message": f"@ObservedObject {type_name} instancié sur place (recréé à chaque rendu)"})
+    return findings
+
+class NDJSONReportWriter:
+    """Rapport en flux : un enregistrement JSON par ligne et par fichier analysé, dès que ses caractéristiques sont prêtes
+    
+    Le fichier est écrit ligne à ligne (tamponnage par ligne) : il peut être lu pendant l'analyse.
+    La dernière ligne est un enregistrement « summary » avec les agrégats du rapport.
+    """
+    
+    def __init__(self, project_path: Path, output_path: Path, subprojects: Optional[Dict[str, str]] = None):
+        from datetime import datetime
+        self.project_path = project_path
+        self.output_path = output_path
+        self.subprojects = {spec.name: spec.root for spec in BUILTIN_ANALYZERS} if subprojects is None else subprojects
+        self.records = 0
+        self._file = open(output_path, 'w', encoding='utf-8', buffering=1)
+        self._lock = threading.Lock()
+        self._write({"type": "header", "version": ANALYZER_VERSION, "project": str(project_path.resolve()), "timestamp": datetime.now().isoformat()})
+    
+    def _write(self, record: Dict):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+    
+    def file_record(self, path: Path, features: FeatureRecord):
+        """Enregistrement d'un fichier : caractéristiques, nombre de lignes et constats"""
+        rel_path = path.relative_to(self.project_path).as_posix()
+        self._write({
+            "type": "file",
+            "path": rel_path,
+            "subproject": next((name for name, folder in self.subprojects.items() if rel_path.startswith(folder + "/")), None),
+            "kind": FEATURE_EXTRACTORS[path.suffix][0],
+            "lines": features.get("lines", 0),
+            "features": features.to_dict(),
+            "findings": file_findings(features)
+        })
+        self.records += 1
+    
+    def close(self, report: Optional[ArchitectureReport] = None):
+        """Termine le flux par le résumé du rapport"""
+        if report is not None:
+            self._write({
+                "type": "summary",
+                "files": self.records,
+                "quality_score": report.quality_score,
+                "metrics": report.metrics,
+                "recommendations": report.recommendations
+            })
+        self._file.close()
+
 class AgentArchitectePrincipal:
     """Agent Architecte Principal - Système d'analyse architecturale"""
     
-    def __init__(self, project_path: str = "."):
+    def __init__(self, project_path: str = ".", max_cache_bytes: int = ContentStore.DEFAULT_MAX_BYTES, use_cache: bool = True, jobs: int = 1,
+                 only: Optional[List[str]] = None, project_plugins: bool = False):
         self.project_path = Path(project_path)
-        self.ios_analyzer = IOSAnalyzer(self.project_path)
-        self.backend_analyzer = BackendAnalyzer(self.project_path)
-        self.dashboard_analyzer = DashboardAnalyzer(self.project_path)
-        self.recommendation_engine = RecommendationEngine()
+        self.use_cache = use_cache
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.profiler = PhaseProfiler()
+        self.content = ContentStore(max_cache_bytes, self.profiler)
+        
+        # Registre des analyseurs ; seuls ceux dont le sous-projet existe sont importés et instanciés
+        self.specs = [spec for spec in load_analyzer_specs(self.project_path, only, project_plugins) if (self.project_path / spec.root).is_dir()]
+        # Sélection explicite : le catalogue ne parcourt que les dossiers des analyseurs retenus.
+        # Une analyse partielle ne remplace ni l'index, ni l'état git de référence, ni l'historique.
+        self.catalog_include = None if only is None else [path for spec in self.specs for path in spec.paths]
+        self.partial = only is not None
+        self.analyzers: Dict[str, BaseAnalyzer] = {}
+        for spec in self.specs:
+            try:
+                self.analyzers[spec.name] = spec.create(self.project_path, self.content)
+            except Exception as e:
+                print(f"  ⚠️ Analyseur {spec.name} indisponible: {e}")
+        self.recommendation_engine = RecommendationEngine(self.project_path)
+        self.recommendation_engine.roots = {name: analyzer.root for name, analyzer in self.analyzers.items()}
+        # Rapport NDJSON alimenté pendant l'analyse (optionnel)
+        self.stream: Optional[NDJSONReportWriter] = None
+        # Référence git : seuls les fichiers modifiés depuis sont relus (optionnel)
+        self.since: Optional[str] = None
     
     def analyze(self) -> ArchitectureReport:
-        """Effectue une analyse complète de l'architecture"""
+        """Effectue une analyse complète de l'architecture (ou des seuls changements depuis self.since)"""
+        from concurrent.futures import ThreadPoolExecutor
+        cache = self._open_cache()
+        try:
+            if cache is None:
+                return self._analyze_full(cache) if self.since is None else self._analyze_since(cache, self.since)
+            # État git relevé pendant l'analyse (git tourne dans son propre processus)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending_baseline = executor.submit(git_baseline, self.project_path)
+                report = self._analyze_full(cache) if self.since is None else self._analyze_since(cache, self.since)
+                baseline = pending_baseline.result()
+            if baseline is not None and not self.partial:
+                cache.set_baseline(baseline)
+            return report
+        finally:
+            if cache is not None:
+                cache.close()
+    
+    def _analyze_full(self, cache: Optional[AnalysisCache]) -> ArchitectureReport:
+        """Analyse complète avec un cache déjà ouvert (laissé ouvert pour les ré-analyses à chaud)"""
         print("🏛️ Analyse de l'architecture en cours...")
+        start = time.perf_counter()
+        self._prepare(cache)
+        return self._aggregate(start)
+    
+    def _analyze_since(self, cache: Optional[AnalysisCache], ref: str) -> ArchitectureReport:
+        """Relit les fichiers modifiés depuis ref et reprend tous les autres de la dernière analyse complète
+        
+        Les agrégats et recommandations portent toujours sur tout le projet ; les constats par fichier des
+        fichiers modifiés sont ajoutés au rapport (section changes). Lève ValueError si git échoue.
+        """
+        print(f"🏛️ Analyse des changements depuis {ref}...")
+        start = time.perf_counter()
+        changed = git_changed_paths(self.project_path, ref)
+        baseline = cache.baseline() if cache is not None else None
+        if baseline is not None:
+            # Le cache reflète le commit de référence et ses fichiers modifiés d'alors, pas forcément ref
+            if baseline["commit"] != _git(self.project_path, "rev-parse", f"{ref}^{{commit}}").strip():
+                changed |= git_changed_paths(self.project_path, baseline["commit"])
+            changed.update(baseline["dirty"])
+        statuses = {
+            rel_path: "deleted" if not (self.project_path / rel_path).exists()
+            else "modified" if cache is not None and cache.fingerprint(rel_path) is not None else "added"
+            for rel_path in changed
+        }
         
-        # Analyser iOS
-        print("  📱 Analyse iOS...")
-        ios_analysis = self.ios_analyzer.analyze()
-        
-        # Analyser Backend
-        print("  🔧 Analyse Backend...")
-        backend_analysis = self.backend_analyzer.analyze()
-        
-        # Analyser Dashboard
-        print("  🎨 Analyse Dashboard...")
-        dashboard_analysis = self.dashboard_analyzer.analyze()
+        self._prepare(cache)
+        reused = 0
+        if baseline is None:
+            print("  ⚠️ Aucune analyse complète de référence : toutes les empreintes seront vérifiées")
+        else:
+            with self.profiler.phase("FeatureStore.preload"):
+                reused = self.features.preload(self.feature_files(), changed)
+            print(f"  ♻️ {reused} fichiers repris de l'analyse de référence, {len(changed)} modifiés")
+        
+        report = self._aggregate(start)
+        return report._replace(changes=self._changes(ref, statuses, baseline, reused))
+    
+    def _changes(self, ref: str, statuses: Dict[str, str], baseline: Optional[Dict], reused: int) -> Dict:
+        """Section changes : fichiers analysés modifiés depuis ref et leurs constats"""
+        analyzed = {path.relative_to(self.project_path).as_posix(): path for path in self.feature_files()}
+        files = []
+        for rel_path, status in sorted(statuses.items()):
+            if status == "deleted":
+                if os.path.splitext(rel_path)[1] in FEATURE_EXTRACTORS:
+                    files.append({"path": rel_path, "status": status, "findings": []})
+            elif rel_path in analyzed:
+                features = self.features.get(analyzed[rel_path])
+                files.append({"path": rel_path, "status": status, "lines": features["lines"], "findings": file_findings(features)})
+        return {
+            "since": ref,
+            "baseline_commit": baseline["commit"] if baseline is not None else None,
+            "changed_paths": len(statuses),
+            "files": files,
+            "reused": reused,
+            "extracted": self.features.extracted
+        }
+    
+    def _prepare(self, cache: Optional[AnalysisCache]):
+        """Catalogue et magasin de caractéristiques neufs (avant une analyse complète)"""
+        self.profiler.reset()
+        # Indexer l'arborescence une seule fois et partager le contenu lu entre les analyseurs
+        with self.profiler.phase("FileCatalog"):
+            catalog = self._new_catalog()
+        self.content.clear()
+        self.features = FeatureStore(self.project_path, self.content, cache)
+        if self.stream is not None:
+            self.features.listener = self.stream.file_record
+        self._share(catalog)
+    
+    def reanalyze(self, changed: Optional[set], structural: bool = False) -> ArchitectureReport:
+        """Ré-analyse à chaud : seuls les fichiers modifiés sont relus, les agrégats sont recalculés
+        
+        structural indique des fichiers ou dossiers créés/supprimés (catalogue à reconstruire) ;
+        changed vaut None si les modifications sont inconnues (tout est revalidé par empreinte).
+        """
+        self.profiler.reset()
+        start = time.perf_counter()
+        if structural:
+            with self.profiler.phase("FileCatalog"):
+                self._share(self._new_catalog())
+        if changed is None:
+            self.content.clear()
+            self.features.clear()
+        else:
+            for path in changed:
+                self.content.invalidate(path)
+                self.features.invalidate(path)
+        return self._aggregate(start, verbose=False)
+    
+    def watch(self, poll_interval: float = WATCH_POLL_INTERVAL, output_prefix: str = "RAPPORT_ARCHITECTURE_LIVE"):
+        """Mode résident : analyse complète, puis rapports régénérés à chaque modification du projet"""
+        from datetime import datetime
+        markdown_name, json_name = f"{output_prefix}.md", f"{output_prefix}.json"
+        cache = self._open_cache()
+        watcher = create_watcher(poll_interval)
+        try:
+            report = self._analyze_full(cache)
+            self.generate_report(report, markdown_name)
+            self.generate_json_report(report, json_name)
+            try:
+                watcher.watch(self.catalog)
+            except OSError as e:
+                print(f"  ⚠️ inotify limité ({e}), surveillance par scrutation toutes les {poll_interval}s")
+                watcher.close()
+                watcher = PollingWatcher(poll_interval)
+                watcher.watch(self.catalog)
+            print(f"👀 Surveillance de {self.project_path} ({type(watcher).__name__}), Ctrl+C pour arrêter")
+            print(f"   Rapports: {self.project_path / markdown_name}, {self.project_path / json_name}")
+            
+            while True:
+                changed, structural = watcher.wait()
+                if changed is not None:
+                    changed = {path for path in changed if self._watch_relevant(path)}
+                    if not changed and not structural:
+                        continue
+                
+                start = time.perf_counter()
+                report = self.reanalyze(changed, structural)
+                self.generate_report(report, markdown_name)
+                self.generate_json_report(report, json_name)
+                if structural:
+                    watcher.watch(self.catalog)
+                elapsed = (time.perf_counter() - start) * 1000
+                touched = "?" if changed is None else len(changed)
+                print(f"🔄 {datetime.now().strftime('%H:%M:%S')} {touched} fichier(s) modifié(s), rapport régénéré en {elapsed:.0f} ms "
+                      f"(score {report.quality_score:.1f}, {len(report.recommendations)} recommandations)")
+        except KeyboardInterrupt:
+            print("\n👋 Surveillance arrêtée")
+        finally:
+            watcher.close()
+            if cache is not None:
+                cache.close()
+    
+    def _watch_relevant(self, path: Path) -> bool:
+        """Écarte les rapports générés, les fichiers temporaires et les dossiers exclus"""
+        try:
+            parts = path.relative_to(self.project_path).parts
+        except ValueError:
+            return False
+        name = parts[-1] if parts else ""
+        if name.startswith(WATCH_IGNORED_PREFIXES) or name.endswith(WATCH_IGNORED_SUFFIXES):
+            return False
+        return not any(part in EXCLUDE_DIRS for part in parts)
+    
+    def _new_catalog(self) -> FileCatalog:
+        """Catalogue des sous-projets enregistrés (limité aux dossiers des analyseurs sélectionnés, le cas échéant)"""
+        subprojects = {spec.name: spec.root for spec in self.specs}
+        return FileCatalog(self.project_path, subprojects=subprojects, include=self.catalog_include)
+    
+    def _share(self, catalog: FileCatalog):
+        """Partage catalogue, contenu et caractéristiques entre les analyseurs"""
+        self.catalog = catalog
+        for analyzer in self.analyzers.values():
+            analyzer.catalog = self.catalog
+            analyzer.content = self.content
+            analyzer.features = self.features
+        self.recommendation_engine.catalog = self.catalog
+    
+    def _aggregate(self, start: float, verbose: bool = True) -> ArchitectureReport:
+        """Analyseurs, index des symboles, recommandations et rapport à partir des caractéristiques"""
+        from concurrent.futures import ThreadPoolExecutor
+        from datetime import datetime
+        cache = self.features.cache
+        labels = {spec.name: spec.label for spec in self.specs}
+        analyzers = [(labels[name], analyzer) for name, analyzer in self.analyzers.items()]
+        
+        if self.jobs > 1 and analyzers:
+            # Extraire les caractéristiques sur un pool de processus, puis agréger en parallèle
+            if verbose:
+                print(f"  ⚙️ Extraction parallèle ({self.jobs} processus)...")
+            with self.profiler.phase("FeatureStore.prefetch"):
+                self.features.prefetch(self.feature_files(), self.jobs)
+            if verbose:
+                for label, _ in analyzers:
+                    print(label)
+            with ThreadPoolExecutor(max_workers=len(analyzers)) as executor:
+                futures = [executor.submit(analyzer.analyze) for _, analyzer in analyzers]
+                results = [future.result() for future in futures]
+        else:
+            results = []
+            for label, analyzer in analyzers:
+                if verbose:
+                    print(label)
+                results.append(analyzer.analyze())
+        analyses = dict(zip(self.analyzers, results))
+        ios_analysis, backend_analysis, dashboard_analysis = (analyses.get(name, {}) for name in BUILTIN_REPORT_FIELDS)
+        plugin_analyses = {name: analysis for name, analysis in analyses.items() if name not in BUILTIN_REPORT_FIELDS}
+        
+        # Index des symboles, construit à partir des caractéristiques déjà extraites
+        entries = self._feature_entries()
+        with self.profiler.phase("SymbolIndex.build"):
+            self.symbols = self._build_symbol_index(entries, None if self.partial else cache)
+        
+        # Index de requêtes (sous-commande `query`), enregistré avec le cache (celui de la dernière analyse complète est conservé)
+        if cache is not None and not self.partial:
+            with self.profiler.phase("QueryIndex.save"):
+                cache.save_index(self._query_index_rows(entries, ios_analysis, backend_analysis))
+        
+        # Enregistrer les caractéristiques pour la prochaine exécution
+        if cache is not None:
+            with self.profiler.phase("AnalysisCache.save"):
+                cache.save(self.catalog.relative_paths(), self.catalog.covers)
         
         # Générer les recommandations
-        print("  💡 Génération des recommandations...")
-        recommendations = self.recommendation_engine.generate_recommendations(
-            ios_analysis, backend_analysis, dashboard_analysis
-        )
+        if verbose:
+            print("  💡 Génération des recommandations...")
+        with self.profiler.phase("RecommendationEngine.generate_recommendations"):
+            recommendations = self.recommendation_engine.generate_recommendations(
+                ios_analysis, backend_analysis, dashboard_analysis
+            )
+            for name, analysis in plugin_analyses.items():
+                recommendations.extend(self.analyzers[name].recommendations(analysis))
         
         # Calculer le score de qualité
         quality_score = self._calculate_quality_score(
@@ -1072,17 +4234,122 @@ class AgentArchitectePrincipal:
         # Créer le rapport
         report = ArchitectureReport(
             timestamp=datetime.now().isoformat(),
-            version="1.0.0",
+            version=ANALYZER_VERSION,
             ios_analysis=ios_analysis,
             backend_analysis=backend_analysis,
             dashboard_analysis=dashboard_analysis,
             recommendations=recommendations,
             metrics=self._calculate_global_metrics(ios_analysis, backend_analysis, dashboard_analysis),
-            quality_score=quality_score
+            quality_score=quality_score,
+            profile=self._profile_summary(time.perf_counter() - start),
+            changes={},
+            plugin_analyses=plugin_analyses
         )
         
         return report
     
+    def _profile_summary(self, total_seconds: float) -> Dict:
+        """Télémétrie de l'analyse : phases, totaux et statistiques des caches"""
+        profile = self.profiler.to_dict()
+        profile["total_seconds"] = round(total_seconds, 6)
+        profile["jobs"] = self.jobs
+        profile["content_store"] = {
+            "hits": self.content.hits,
+            "misses": self.content.misses,
+            "evictions": self.content.evictions
+        }
+        profile["feature_store"] = {
+            "cache_hits": self.features.cache_hits,
+            "extracted": self.features.extracted
+        }
+        return profile
+    
+    def analyze_profiled(self, output_prefix: Optional[str] = None) -> Tuple[ArchitectureReport, List[str]]:
+        """Analyse sous cProfile et tracemalloc, puis écrit les profils (pstats et piles repliées pour flamegraph)"""
+        import cProfile
+        import pstats
+        import tracemalloc
+        from datetime import datetime
+        
+        if output_prefix is None:
+            output_prefix = f"PROFIL_ARCHITECTURE_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        base = self.project_path / output_prefix
+        
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                report = self.analyze()
+            finally:
+                profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        
+        stats_file = base.with_name(base.name + ".prof")
+        profiler.dump_stats(str(stats_file))
+        cpu_file = base.with_name(base.name + ".cpu.folded")
+        cpu_file.write_text(folded_cpu_stacks(pstats.Stats(profiler)), encoding='utf-8')
+        memory_file = base.with_name(base.name + ".mem.folded")
+        memory_file.write_text(folded_memory_stacks(snapshot), encoding='utf-8')
+        
+        return report, [str(stats_file), str(cpu_file), str(memory_file)]
+    
+    def feature_files(self) -> List[Path]:
+        """Fichiers dont les analyseurs extraient des caractéristiques"""
+        return [path for analyzer in self.analyzers.values() for path in analyzer.feature_files()]
+    
+    def _feature_entries(self) -> List[Tuple[str, FeatureRecord]]:
+        """(chemin relatif, caractéristiques) de tous les fichiers analysés"""
+        entries = []
+        for path in self.feature_files():
+            try:
+                entries.append((path.relative_to(self.project_path).as_posix(), self.features.get(path)))
+            except OSError:
+                continue
+        return entries
+    
+    def _query_index_rows(self, entries: List[Tuple[str, FeatureRecord]], ios_analysis: Dict, backend_analysis: Dict) -> Dict[str, List[Tuple]]:
+        """Lignes des tables de l'index de requêtes"""
+        singleton_users = ios_analysis.get("usage_graph", {}).get("singletons", {})
+        ios_prefix = self.analyzers["ios"].root.relative_to(self.project_path).as_posix() + "/" if "ios" in self.analyzers else ""
+        rows: Dict[str, List[Tuple]] = {table: [] for table in AnalysisCache.INDEX_TABLES}
+        
+        for rel_path, features in dict(entries).items():
+            rows["idx_files"].append((rel_path, FEATURE_EXTRACTORS[os.path.splitext(rel_path)[1]][0], self.catalog.subproject_of(rel_path), features["lines"]))
+            for name, declaration in dict(features.get("shared_types", ())).items():
+                users = [ios_prefix + user for user in singleton_users.get(name, [])]
+                rows["idx_singletons"].append((name, rel_path, int(declaration == "var"), json.dumps(users)))
+            for entity in features.get("entities", ()):
+                rows["idx_entities"].append((entity["name"], rel_path, entity["table"], entity["columns"]))
+                rows["idx_relations"].extend((entity["name"], rel_path, *relation) for relation in entity["relations"])
+        
+        for row in backend_analysis.get("routes", {}).get("table", []):
+            rows["idx_routes"].append((row["method"], row["path"], row["file"], json.dumps(row["middlewares"]), row["entry"]))
+        return rows
+    
+    def _build_symbol_index(self, entries: List[Tuple[str, FeatureRecord]], cache: Optional[AnalysisCache]) -> SymbolIndex:
+        """Indexe les symboles de tous les fichiers analysés et conserve l'index avec le cache"""
+        symbols = SymbolIndex.build(entries)
+        if cache is not None:
+            try:
+                symbols.save(cache.cache_dir / SymbolIndex.FILENAME)
+            except OSError as e:
+                print(f"  ⚠️ Index des symboles non enregistré: {e}")
+        return symbols
+    
+    def _open_cache(self) -> Optional[AnalysisCache]:
+        """Ouvre le cache persistant, ou continue sans cache s'il est inaccessible"""
+        import sqlite3
+        if not self.use_cache:
+            return None
+        try:
+            return AnalysisCache(self.project_path)
+        except (OSError, sqlite3.Error) as e:
+            print(f"  ⚠️ Cache désactivé: {e}")
+            return None
+    
     def _calculate_quality_score(self, ios_analysis: Dict, backend_analysis: Dict, dashboard_analysis: Dict) -> float:
         """Calcule un score de qualité global (0-100)"""
         score = 0.0
@@ -1120,11 +4387,13 @@ class AgentArchitectePrincipal:
             "total_ios_files": ios_analysis.get("code_quality", {}).get("total_files", 0),
             "total_backend_files": backend_analysis.get("code_quality", {}).get("total_files", 0),
             "total_dashboard_files": dashboard_analysis.get("code_quality", {}).get("total_files", 0),
+            "total_symbols": len(self.symbols),
             "total_recommendations": len(self.recommendation_engine.recommendations) if hasattr(self.recommendation_engine, 'recommendations') else 0
         }
     
     def generate_report(self, report: ArchitectureReport, output_file: Optional[str] = None) -> str:
         """Génère un rapport Markdown"""
+        from datetime import datetime
         if output_file is None:
             output_file = f"RAPPORT_ARCHITECTURE_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
         
@@ -1162,6 +4431,9 @@ class AgentArchitectePrincipal:
 ### Patterns Détectés
 {self._format_patterns(report.ios_analysis.get('patterns', {}))}
 
+### Graphe Vue → ViewModel → Service
+{self._format_usage_graph(report.ios_analysis.get('usage_graph', {}))}
+
 ### Qualité du Code
 - **Fichiers**: {report.ios_analysis.get('code_quality', {}).get('total_files', 0)}
 - **Lignes**: {report.ios_analysis.get('code_quality', {}).get('total_lines', 0)}
@@ -1185,6 +4457,9 @@ class AgentArchitectePrincipal:
 - **ORM**: {report.backend_analysis.get('database', {}).get('orm', 'N/A')}
 - **PostGIS**: {'✅ Oui' if report.backend_analysis.get('database', {}).get('postgis', False) else '❌ Non'}
 
+### Graphe des Modules
+{self._format_module_graph(report.backend_analysis.get('module_graph', {}))}
+
 ### Qualité du Code
 - **Fichiers**: {report.backend_analysis.get('code_quality', {}).get('total_files', 0)}
 - **Lignes**: {report.backend_analysis.get('code_quality', {}).get('total_lines', 0)}
@@ -1200,6 +4475,9 @@ class AgentArchitectePrincipal:
 - **Pages**: {report.dashboard_analysis.get('metrics', {}).get('pages_count', 0)}
 - **Services**: {report.dashboard_analysis.get('metrics', {}).get('services_count', 0)}
 
+### Graphe des Modules
+{self._format_module_graph(report.dashboard_analysis.get('module_graph', {}))}
+
 ### Qualité du Code
 - **Fichiers**: {report.dashboard_analysis.get('code_quality', {}).get('total_files', 0)}
 - **Lignes**: {report.dashboard_analysis.get('code_quality', {}).get('total_lines', 0)}
@@ -1237,6 +4515,10 @@ class AgentArchitectePrincipal:
                 markdown += f"  - {rec.get('description')}\n"
                 markdown += f"  - Impact: {rec.get('impact')}\n\n"
         
+        markdown += self._format_plugin_analyses(report.plugin_analyses)
+        markdown += self._format_changes(report.changes)
+        markdown += self._format_profile(report.profile)
+        
         markdown += """---
 
 ## 📈 Prochaines Étapes
@@ -1273,38 +4555,840 @@ class AgentArchitectePrincipal:
             formatted.append(f"- **{measure}**: {status}")
         return "\n".join(formatted)
     
+    def _format_module_graph(self, graph: Dict) -> str:
+        """Formate le résumé du graphe des imports"""
+        chains = graph.get("longest_chains", [])
+        formatted = [
+            f"- **Modules**: {graph.get('modules', 0)} ({graph.get('edges', 0)} imports)",
+            f"- **Cycles**: {len(graph.get('cycles', []))}",
+            f"- **Profondeur maximale**: {graph.get('max_depth', 0)}"
+        ]
+        for cycle in graph.get("cycles", []):
+            formatted.append(f"  - 🔁 {len(cycle)} modules: {', '.join(cycle[:5])}{' ...' if len(cycle) > 5 else ''}")
+        if chains:
+            formatted.append(f"- **Plus longue chaîne**: {' → '.join(chains[0]['modules'])}")
+        return "\n".join(formatted)
+    
+    def _format_usage_graph(self, graph: Dict) -> str:
+        """Formate le résumé du graphe d'usage SwiftUI"""
+        edges = graph.get("edges", {})
+        singletons = graph.get("singletons", {})
+        formatted = [
+            f"- **Vues MVVM**: {graph.get('mvvm_views', 0)}",
+            f"- **Liens**: {', '.join(f'{link} ({count})' for link, count in edges.items()) or 'aucun'}"
+        ]
+        if singletons:
+            most_used = sorted(singletons.items(), key=lambda item: (-len(item[1]), item[0]))[:5]
+            formatted.append(f"- **Singletons les plus utilisés**: {', '.join(f'{name} ({len(files)})' for name, files in most_used)}")
+        for item in graph.get("render_instantiations", []):
+            formatted.append(f"  - ⚠️ {item['view']}:{item['line']} instancie {item['type']} à chaque rendu")
+        return "\n".join(formatted)
+    
+    def _format_plugin_analyses(self, analyses: Dict) -> str:
+        """Sections Markdown des analyseurs de plugins : leurs métriques (ou valeurs simples)"""
+        formatted = []
+        for name, analysis in analyses.items():
+            values = analysis.get("metrics") if isinstance(analysis.get("metrics"), dict) else analysis
+            formatted += [f"## 🧩 {name}", ""]
+            formatted += [f"- **{key}**: {value}" for key, value in values.items() if isinstance(value, (int, float, str, bool))]
+            formatted.append("")
+        return "\n".join(formatted) + "\n" if formatted else ""
+    
+    def _format_changes(self, changes: Dict) -> str:
+        """Section Markdown des fichiers modifiés (mode --since)"""
+        if not changes:
+            return ""
+        formatted = [
+            f"## 🔀 Changements depuis {changes['since']}",
+            "",
+            f"{len(changes['files'])} fichiers analysés modifiés ({changes['changed_paths']} chemins au total) ; "
+            f"{changes['extracted']} extraits, {changes['reused']} repris de l'analyse de référence.",
+            ""
+        ]
+        for entry in changes["files"]:
+            formatted.append(f"- `{entry['path']}` ({entry['status']})")
+            formatted.extend(f"  - {finding['code']}: {finding['message']}" for finding in entry["findings"])
+        return "\n".join(formatted) + "\n\n"
+    
+    def _format_profile(self, profile: Dict) -> str:
+        """Formate le tableau récapitulatif du profil d'exécution"""
+        phases = profile.get("phases", {})
+        if not phases:
+            return ""
+        
+        formatted = [
+            "---\n",
+            "## ⏱️ Profil d'Exécution\n",
+            f"**Durée totale**: {profile.get('total_seconds', 0):.3f}s (jobs: {profile.get('jobs', 1)})\n",
+            "| Phase | Temps (s) | Fichiers | Octets lus | Regex (s) | Hits cache |",
+            "|-------|-----------|----------|------------|-----------|------------|"
+        ]
+        for name, stats in sorted(phases.items(), key=lambda item: item[1]["wall_time"], reverse=True):
+            formatted.append(
+                f"| {name} | {stats['wall_time']:.4f} | {stats['files_visited']} | {stats['bytes_read']} "
+                f"| {stats['regex_time']:.4f} | {stats['cache_hits']} |"
+            )
+        return "\n".join(formatted) + "\n\n"
+    
     def generate_json_report(self, report: ArchitectureReport, output_file: Optional[str] = None) -> str:
         """Génère un rapport JSON"""
+        from datetime import datetime
         if output_file is None:
             output_file = f"RAPPORT_ARCHITECTURE_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         output_path = self.project_path / output_file
-        report_dict = asdict(report)
+        # Copie superficielle : json.dump sérialise les analyses en place, par morceaux
+        report_dict = report.to_dict()
         
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(report_dict, f, indent=2, ensure_ascii=False)
         
         return str(output_path)
+    
+    def record_history(self, report: ArchitectureReport, report_file: Optional[str] = None) -> Optional[str]:
+        """Ajoute l'exécution à l'historique des métriques du projet (None si l'historique est inaccessible ou l'analyse partielle)"""
+        import sqlite3
+        if self.partial:
+            print("  ℹ️ Analyse partielle (--only) : non ajoutée à l'historique")
+            return None
+        try:
+            commit = _git(self.project_path, "rev-parse", "HEAD").strip()
+        except ValueError:
+            commit = None
+        try:
+            history = HistoryStore(self.project_path)
+        except (OSError, sqlite3.Error) as e:
+            print(f"  ⚠️ Historique désactivé: {e}")
+            return None
+        try:
+            history.record(report.to_dict(), commit, Path(report_file).name if report_file else None)
+        finally:
+            history.close()
+        return str(history.db_path)
+
+class BatchAnalysis:
+    """Analyse de plusieurs racines (branches, forks, copies) avec un pool de processus et un cache par contenu partagés"""
+    
+    def __init__(self, roots: List[str], use_cache: bool = True, jobs: int = 1, project_plugins: bool = False):
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.agents = [AgentArchitectePrincipal(root, use_cache=use_cache, jobs=self.jobs, project_plugins=project_plugins) for root in roots]
+        self.names = self._names([agent.project_path for agent in self.agents])
+        self.stats: Dict[str, int] = {}
+    
+    @staticmethod
+    def _names(paths: List[Path]) -> List[str]:
+        """Nom court et unique de chaque racine"""
+        names = []
+        seen = Counter()
+        for path in paths:
+            name = path.resolve().name or str(path)
+            seen[name] += 1
+            names.append(name if seen[name] == 1 else f"{name}-{seen[name]}")
+        return names
+    
+    def analyze(self) -> List[ArchitectureReport]:
+        """Analyse toutes les racines : extraction commune, puis agrégation racine par racine"""
+        from concurrent.futures import ThreadPoolExecutor
+        start = time.perf_counter()
+        caches = [agent._open_cache() for agent in self.agents]
+        # État git de chaque racine, relevé pendant l'analyse (référence des analyses --since)
+        git_executor = ThreadPoolExecutor(max_workers=min(4, len(self.agents)))
+        baselines = [git_executor.submit(git_baseline, agent.project_path) for agent in self.agents]
+        try:
+            print(f"🏛️ Indexation de {len(self.agents)} racines...")
+            for agent, cache in zip(self.agents, caches):
+                agent._prepare(cache)
+            print(f"  ⚙️ Extraction partagée ({self.jobs} processus)...")
+            self.stats = prefetch_shared([(agent.features, agent.feature_files()) for agent in self.agents], self.jobs)
+            
+            reports = []
+            for name, agent in zip(self.names, self.agents):
+                report = agent._aggregate(time.perf_counter(), verbose=False)
+                print(f"  📊 {name}: {report.quality_score:.1f}/100, {len(report.recommendations)} recommandations")
+                reports.append(report)
+            for cache, baseline in zip(caches, baselines):
+                if cache is not None and baseline.result() is not None:
+                    cache.set_baseline(baseline.result())
+        finally:
+            git_executor.shutdown()
+            for cache in caches:
+                if cache is not None:
+                    cache.close()
+        self.stats["duration_seconds"] = round(time.perf_counter() - start, 3)
+        return reports
+    
+    def summary(self, reports: List[ArchitectureReport], outputs: List[Tuple[str, str]]) -> Dict:
+        """Rapport agrégé : une ligne par racine et recommandations comptées sur l'ensemble du lot"""
+        from datetime import datetime
+        roots = []
+        recommendations: Dict[Tuple[str, str], Dict] = {}
+        for name, agent, report, (markdown_file, json_file) in zip(self.names, self.agents, reports, outputs):
+            roots.append({
+                "name": name,
+                "path": str(agent.project_path),
+                "quality_score": report.quality_score,
+                "files": len(agent.feature_files()),
+                "recommendations": len(report.recommendations),
+                "high_priority": sum(1 for rec in report.recommendations if rec.get("priority") == "high"),
+                "metrics": report.metrics,
+                "reports": {"markdown": markdown_file, "json": json_file}
+            })
+            for rec in report.recommendations:
+                entry = recommendations.setdefault((rec.get("category"), rec.get("title")), {
+                    "category": rec.get("category"), "title": rec.get("title"), "priority": rec.get("priority"), "roots": []
+                })
+                entry["roots"].append(name)
+        
+        scores = [root["quality_score"] for root in roots]
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "version": ANALYZER_VERSION,
+            "average_quality_score": sum(scores) / len(scores) if scores else 0.0,
+            "roots": roots,
+            "recommendations": sorted(recommendations.values(), key=lambda rec: (-len(rec["roots"]), rec["category"] or "", rec["title"] or "")),
+            "shared_cache": self.stats
+        }
+    
+    def generate_reports(self, summary: Dict, output_prefix: Optional[str] = None) -> Tuple[str, str]:
+        """Écrit le rapport agrégé (Markdown et JSON) dans le répertoire courant"""
+        from datetime import datetime
+        if output_prefix is None:
+            output_prefix = f"RAPPORT_ARCHITECTURE_LOT_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
+        stats = summary["shared_cache"]
+        lines = [
+            "# 🏛️ Rapport d'Architecture - Analyse par lot",
+            "",
+            f"**Date**: {summary['timestamp']}  ",
+            f"**Version**: {summary['version']}  ",
+            f"**Racines**: {len(summary['roots'])}  ",
+            f"**Score moyen**: {summary['average_quality_score']:.1f}/100",
+            "",
+            "## 📊 Racines",
+            "",
+            "| Racine | Score | Fichiers | Recommandations | Prioritaires | Rapport |",
+            "|--------|-------|----------|-----------------|--------------|---------|"
+        ]
+        for root in summary["roots"]:
+            lines.append(f"| {root['name']} | {root['quality_score']:.1f} | {root['files']} | {root['recommendations']} | {root['high_priority']} | {root['reports']['markdown']} |")
+        lines += ["", "## 💡 Recommandations", ""]
+        for rec in summary["recommendations"]:
+            lines.append(f"- **[{rec['category']}] {rec['title']}** ({rec['priority']}) — {len(rec['roots'])}/{len(summary['roots'])} racines: {', '.join(rec['roots'])}")
+        lines += [
+            "",
+            "## ⚙️ Extraction partagée",
+            "",
+            f"- Fichiers: {stats.get('files', 0)}",
+            f"- Contenus distincts: {stats.get('unique_contents', 0)}",
+            f"- Extraits: {stats.get('extracted', 0)}",
+            f"- Repris du cache des racines: {stats.get('cache_hits', 0)}",
+            f"- Partagés entre racines: {stats.get('shared_hits', 0)}",
+            f"- Durée totale: {stats.get('duration_seconds', 0)} s",
+            ""
+        ]
+        
+        markdown_file = f"{output_prefix}.md"
+        json_file = f"{output_prefix}.json"
+        with open(markdown_file, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        return markdown_file, json_file
+
+# Collections comparées par `diff` : nom -> chemins possibles dans le rapport (le premier présent l'emporte)
+DIFF_COLLECTIONS = {
+    "routes": (("backend_analysis", "routes", "table"), ("backend_analysis", "routes", "endpoints")),
+    "entities": (("backend_analysis", "entities", "list"),),
+    "backend_services": (("backend_analysis", "services", "list"),),
+    "ios_services": (("ios_analysis", "services", "list"),),
+    "dashboard_services": (("dashboard_analysis", "services", "list"),),
+    "singletons": (("ios_analysis", "services", "singletons"),),
+    "import_cycles": (("backend_analysis", "module_graph", "cycles"), ("dashboard_analysis", "module_graph", "cycles"))
+}
+
+# Sections dont les valeurs numériques sont comparées (en plus des métriques globales)
+DIFF_METRIC_SECTIONS = ("metrics", "code_quality")
+
+def _dig(report: Dict, path: Tuple[str, ...]):
+    """Valeur à un chemin du rapport (None si absent)"""
+    value = report
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+def _keyed_items(report: Dict, name: str) -> Dict[str, object]:
+    """Éléments d'une collection indexés par clé (routes : « MÉTHODE chemin » -> middlewares)"""
+    items: Dict[str, object] = {}
+    for path in DIFF_COLLECTIONS[name]:
+        value = _dig(report, path)
+        if value is None:
+            continue
+        for item in value:
+            if isinstance(item, dict):
+                items[f"{item['method']} {item['path']}"] = item.get("middlewares", [])
+            elif isinstance(item, list):
+                items[" → ".join(item)] = None
+            else:
+                items[item] = None
+        if name != "import_cycles":
+            break
+    return items
+
+def _numeric_metrics(report: Dict) -> Dict[str, float]:
+    """Valeurs numériques comparables : métriques globales, puis métriques et qualité de chaque analyse"""
+    values = {f"metrics.{key}": value for key, value in report.get("metrics", {}).items() if isinstance(value, (int, float)) and not isinstance(value, bool)}
+    for analysis in ("ios_analysis", "backend_analysis", "dashboard_analysis"):
+        for section in DIFF_METRIC_SECTIONS:
+            for key, value in report.get(analysis, {}).get(section, {}).items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    values[f"{analysis.split('_')[0]}.{section}.{key}"] = value
+    return values
+
+def diff_reports(old: Dict, new: Dict, score_tolerance: float = 0.0) -> Dict:
+    """Différences entre deux rapports JSON : jointures par clé (dict/ensembles), aucun parcours imbriqué"""
+    old_score, new_score = old.get("quality_score", 0.0), new.get("quality_score", 0.0)
+    diff = {
+        "old": {"timestamp": old.get("timestamp"), "version": old.get("version")},
+        "new": {"timestamp": new.get("timestamp"), "version": new.get("version")},
+        "quality_score": {"old": old_score, "new": new_score, "delta": round(new_score - old_score, 4)},
+        "metrics": {},
+        "collections": {},
+        "recommendations": {}
+    }
+    
+    old_metrics, new_metrics = _numeric_metrics(old), _numeric_metrics(new)
+    for key in sorted(old_metrics.keys() | new_metrics.keys()):
+        before, after = old_metrics.get(key, 0), new_metrics.get(key, 0)
+        if before != after:
+            diff["metrics"][key] = {"old": before, "new": after, "delta": round(after - before, 4)}
+    
+    for name in DIFF_COLLECTIONS:
+        before, after = _keyed_items(old, name), _keyed_items(new, name)
+        changes = {
+            "added": sorted(after.keys() - before.keys()),
+            "removed": sorted(before.keys() - after.keys())
+        }
+        if name == "routes":
+            # Middlewares modifiés (protection ajoutée ou retirée) sur une route conservée
+            changes["changed"] = [
+                {"route": key, "old": before[key], "new": after[key]}
+                for key in sorted(before.keys() & after.keys()) if before[key] != after[key]
+            ]
+        if any(changes.values()):
+            diff["collections"][name] = changes
+    
+    def keyed(recommendations: List[Dict]) -> Dict[Tuple[str, str], Dict]:
+        return {(rec.get("category", ""), rec.get("title", "")): rec for rec in recommendations}
+    old_recs, new_recs = keyed(old.get("recommendations", [])), keyed(new.get("recommendations", []))
+    diff["recommendations"] = {
+        "added": [new_recs[key] for key in sorted(new_recs.keys() - old_recs.keys())],
+        "resolved": [old_recs[key] for key in sorted(old_recs.keys() - new_recs.keys())]
+    }
+    
+    # Régression : score en baisse (au-delà de la tolérance) ou nouvelle recommandation prioritaire
+    diff["regression"] = new_score < old_score - score_tolerance or any(rec.get("priority") == "high" for rec in diff["recommendations"]["added"])
+    return diff
+
+def format_report_diff(diff: Dict) -> str:
+    """Résumé lisible des différences entre deux rapports"""
+    score = diff["quality_score"]
+    lines = [
+        "🔀 Comparaison des rapports d'architecture",
+        f"   Ancien: {diff['old']['timestamp']} (v{diff['old']['version']})",
+        f"   Nouveau: {diff['new']['timestamp']} (v{diff['new']['version']})",
+        f"📊 Score de Qualité: {score['old']:.1f} → {score['new']:.1f} ({score['delta']:+.1f})"
+    ]
+    
+    if diff["metrics"]:
+        lines.append(f"📈 Métriques modifiées ({len(diff['metrics'])}):")
+        for key, change in diff["metrics"].items():
+            lines.append(f"  - {key}: {change['old']:g} → {change['new']:g} ({change['delta']:+g})")
+    
+    for name, changes in diff["collections"].items():
+        changed = changes.get("changed", [])
+        summary = f"+{len(changes['added'])} / -{len(changes['removed'])}" + (f" / ~{len(changed)}" if changed else "")
+        lines.append(f"🧩 {name}: {summary}")
+        lines.extend(f"  + {item}" for item in changes["added"])
+        lines.extend(f"  - {item}" for item in changes["removed"])
+        lines.extend(f"  ~ {item['route']} (middlewares: {', '.join(item['old']) or 'aucun'} → {', '.join(item['new']) or 'aucun'})" for item in changed)
+    
+    recommendations = diff["recommendations"]
+    if recommendations["added"] or recommendations["resolved"]:
+        lines.append(f"💡 Recommandations: +{len(recommendations['added'])} / ✓{len(recommendations['resolved'])}")
+        lines.extend(f"  + [{rec.get('category')}] {rec.get('title')} ({rec.get('priority')})" for rec in recommendations["added"])
+        lines.extend(f"  ✓ [{rec.get('category')}] {rec.get('title')}" for rec in recommendations["resolved"])
+    
+    if not (diff["metrics"] or diff["collections"] or recommendations["added"] or recommendations["resolved"] or score["delta"]):
+        lines.append("✅ Aucune différence")
+    elif diff["regression"]:
+        lines.append("🔴 Régression détectée")
+    return "\n".join(lines)
+
+def diff_main(argv: List[str]) -> int:
+    """Sous-commande `diff ancien.json nouveau.json`"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="agent_architecte_principal.py diff", description="Compare deux rapports JSON d'architecture")
+    parser.add_argument("old", help="Rapport JSON de référence")
+    parser.add_argument("new", help="Rapport JSON à comparer")
+    parser.add_argument("--json", action="store_true", help="Écrire les différences en JSON")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Code de sortie 1 si le score baisse ou si une recommandation prioritaire apparaît")
+    parser.add_argument("--score-tolerance", type=float, default=0.0, help="Baisse du score tolérée avant de signaler une régression")
+    args = parser.parse_args(argv)
+    
+    reports = []
+    for path in (args.old, args.new):
+        try:
+            with open(path, encoding='utf-8') as f:
+                reports.append(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"❌ Rapport illisible {path}: {e}", file=sys.stderr)
+            return 2
+    
+    diff = diff_reports(*reports, score_tolerance=args.score_tolerance)
+    if args.json:
+        print(json.dumps(diff, indent=2, ensure_ascii=False))
+    else:
+        print(format_report_diff(diff))
+    return 1 if args.fail_on_regression and diff["regression"] else 0
+
+def recommendation_id(rec: Dict) -> str:
+    """Identifiant stable d'une recommandation : catégorie et titre sans accents ni ponctuation"""
+    import unicodedata
+    text = unicodedata.normalize("NFKD", f"{rec.get('category', '')} {rec.get('title', '')}")
+    return re.sub(r"[^a-z0-9]+", "-", text.encode("ascii", "ignore").decode().lower()).strip("-")
+
+def history_metrics(report: Dict) -> Dict[str, float]:
+    """Valeurs historisées d'un rapport : score, métriques, tailles des collections, sécurité, recommandations"""
+    values = {"quality_score": report.get("quality_score", 0.0)}
+    values.update(_numeric_metrics(report))
+    for name in DIFF_COLLECTIONS:
+        values[f"collections.{name}"] = len(_keyed_items(report, name))
+    for flag, enabled in report.get("backend_analysis", {}).get("security", {}).items():
+        values[f"security.{flag}"] = 1.0 if enabled else 0.0
+    priorities = Counter(rec.get("priority") for rec in report.get("recommendations", []))
+    for priority in ("high", "medium", "low"):
+        values[f"recommendations.{priority}"] = priorities[priority]
+    total_seconds = report.get("profile", {}).get("total_seconds")
+    if total_seconds is not None:
+        values["profile.total_seconds"] = total_seconds
+    return values
+
+class HistoryStore:
+    """Historique des exécutions (SQLite, indépendant de la version de l'analyseur) : une ligne par métrique et par exécution"""
+    
+    FILENAME = "history.sqlite"
+    
+    def __init__(self, project_path: Path, read_only: bool = False):
+        import sqlite3
+        self.db_path = project_path / AnalysisCache.CACHE_DIR / self.FILENAME
+        if read_only:
+            self.connection = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.db_path))
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+                "version TEXT, quality_score REAL, git_commit TEXT, report TEXT)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS runs_timestamp ON runs (timestamp)")
+            # Clé (métrique, exécution) : la série d'une métrique est un parcours d'index
+            self.connection.execute("CREATE TABLE IF NOT EXISTS metrics (name TEXT, run_id INTEGER, value REAL, PRIMARY KEY (name, run_id)) WITHOUT ROWID")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS recommendations (rec_id TEXT, run_id INTEGER, category TEXT, priority TEXT, title TEXT, "
+                "PRIMARY KEY (rec_id, run_id)) WITHOUT ROWID"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS recommendations_run ON recommendations (run_id)")
+    
+    def record(self, report: Dict, git_commit: Optional[str] = None, report_file: Optional[str] = None) -> int:
+        """Ajoute une exécution et ses valeurs ; retourne son identifiant"""
+        with self.connection:
+            run_id = self.connection.execute(
+                "INSERT INTO runs (timestamp, version, quality_score, git_commit, report) VALUES (?, ?, ?, ?, ?)",
+                (report.get("timestamp"), report.get("version"), report.get("quality_score"), git_commit, report_file)
+            ).lastrowid
+            self.connection.executemany("INSERT INTO metrics VALUES (?, ?, ?)", [(name, run_id, value) for name, value in history_metrics(report).items()])
+            recommendations = {recommendation_id(rec): rec for rec in report.get("recommendations", [])}
+            self.connection.executemany(
+                "INSERT INTO recommendations VALUES (?, ?, ?, ?, ?)",
+                [(rec_id, run_id, rec.get("category"), rec.get("priority"), rec.get("title")) for rec_id, rec in recommendations.items()]
+            )
+        return run_id
+    
+    def recorded_timestamps(self) -> set:
+        """Horodatages déjà historisés (import des anciens rapports)"""
+        return {timestamp for (timestamp,) in self.connection.execute("SELECT timestamp FROM runs")}
+    
+    def runs(self, last: int) -> List[Tuple[int, str, Optional[str]]]:
+        """(id, horodatage, commit) des dernières exécutions, de la plus ancienne à la plus récente"""
+        rows = self.connection.execute("SELECT id, timestamp, git_commit FROM runs ORDER BY id DESC LIMIT ?", (last,)).fetchall()
+        return rows[::-1]
+    
+    def series(self, pattern: str, first_run: int) -> Dict[str, Dict[int, float]]:
+        """Valeurs des métriques correspondant au motif (GLOB) depuis une exécution donnée"""
+        series: Dict[str, Dict[int, float]] = {}
+        for name, run_id, value in self.connection.execute(
+            "SELECT name, run_id, value FROM metrics WHERE name GLOB ? AND run_id >= ? ORDER BY name, run_id", (pattern, first_run)
+        ):
+            series.setdefault(name, {})[run_id] = value
+        return series
+    
+    def metric_names(self) -> List[Tuple[str, float]]:
+        """Métriques connues et leur dernière valeur"""
+        return self.connection.execute(
+            "SELECT name, value FROM metrics WHERE run_id = (SELECT MAX(id) FROM runs) ORDER BY name"
+        ).fetchall()
+    
+    def recommendations(self, first_run: int) -> Dict[int, Dict[str, Tuple[str, str, str]]]:
+        """Recommandations de chaque exécution depuis une exécution donnée : id -> (catégorie, priorité, titre)"""
+        by_run: Dict[int, Dict[str, Tuple[str, str, str]]] = defaultdict(dict)
+        for rec_id, run_id, category, priority, title in self.connection.execute(
+            "SELECT rec_id, run_id, category, priority, title FROM recommendations WHERE run_id >= ?", (first_run,)
+        ):
+            by_run[run_id][rec_id] = (category, priority, title)
+        return by_run
+    
+    def close(self):
+        """Ferme la connexion"""
+        self.connection.close()
+
+# Échelle des mini-graphiques de tendance
+SPARK_CHARACTERS = "▁▂▃▄▅▆▇█"
+
+def sparkline(values: List[float]) -> str:
+    """Mini-graphique d'une série de valeurs"""
+    low, high = min(values), max(values)
+    scale = (len(SPARK_CHARACTERS) - 1) / (high - low) if high > low else 0
+    return "".join(SPARK_CHARACTERS[round((value - low) * scale)] for value in values)
+
+def trend_data(history: HistoryStore, patterns: List[str], last: int) -> Dict:
+    """Séries des métriques demandées sur les dernières exécutions, avec la plus forte variation de chacune"""
+    runs = history.runs(last)
+    data = {"runs": [{"id": run_id, "timestamp": timestamp, "git_commit": commit} for run_id, timestamp, commit in runs], "metrics": {}}
+    if not runs:
+        return data
+    for pattern in patterns:
+        for name, values in history.series(pattern, runs[0][0]).items():
+            points = [{"run": run_id, "value": values[run_id]} for run_id, _, _ in runs if run_id in values]
+            jumps = [(points[i]["value"] - points[i - 1]["value"], points[i]["run"]) for i in range(1, len(points))]
+            largest = max(jumps, key=lambda jump: abs(jump[0]), default=(0, None))
+            data["metrics"][name] = {"points": points, "largest_change": {"run": largest[1], "delta": largest[0]} if largest[0] else None}
+    return data
+
+def format_trend(data: Dict) -> str:
+    """Tableau texte (et mini-graphique) de chaque série"""
+    runs = {run["id"]: run for run in data["runs"]}
+    lines = []
+    for name, series in data["metrics"].items():
+        points = series["points"]
+        largest = series["largest_change"]
+        lines.append(f"📈 {name} — {len(points)} exécution(s)  {sparkline([point['value'] for point in points])}")
+        previous = None
+        for point in points:
+            run = runs[point["run"]]
+            delta = f"{point['value'] - previous:+g}" if previous is not None and point["value"] != previous else ""
+            marker = "  ◀ plus forte variation" if largest and largest["run"] == point["run"] else ""
+            lines.append(f"  {run['timestamp'][:19].replace('T', ' ')}  {(run['git_commit'] or '')[:8]:<8}  {point['value']:>12g}  {delta:>10}{marker}")
+            previous = point["value"]
+        lines.append("")
+    return "\n".join(lines).rstrip() or "Aucune métrique correspondante"
+
+def format_recommendation_trend(history: HistoryStore, last: int) -> str:
+    """Apparitions et résolutions de recommandations d'une exécution à l'autre"""
+    runs = history.runs(last)
+    if not runs:
+        return "Aucune exécution historisée"
+    by_run = history.recommendations(runs[0][0])
+    lines = []
+    previous = None
+    for run_id, timestamp, commit in runs:
+        current = by_run.get(run_id, {})
+        if previous is not None:
+            events = [f"  + [{current[rec_id][0]}] {current[rec_id][2]} ({current[rec_id][1]})" for rec_id in sorted(current.keys() - previous.keys())]
+            events += [f"  ✓ [{previous[rec_id][0]}] {previous[rec_id][2]}" for rec_id in sorted(previous.keys() - current.keys())]
+            if events:
+                lines.append(f"{timestamp[:19].replace('T', ' ')}  {(commit or '')[:8]}")
+                lines.extend(events)
+        previous = current
+    return "\n".join(lines) or "Aucun changement de recommandations"
+
+def trend_main(argv: List[str]) -> int:
+    """Sous-commande `trend [MÉTRIQUE...]` : évolution des métriques sur les dernières exécutions"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="agent_architecte_principal.py trend", description="Évolution des métriques d'architecture (historique SQLite)")
+    parser.add_argument("metrics", nargs="*", default=["quality_score"], help="Métriques ou motifs glob (ex. 'backend.*lines')")
+    parser.add_argument("--project", default=".", help="Racine du projet analysé")
+    parser.add_argument("-n", "--last", type=int, default=20, help="Nombre d'exécutions (les plus récentes)")
+    parser.add_argument("--list", action="store_true", help="Lister les métriques historisées et leur dernière valeur")
+    parser.add_argument("--recommendations", action="store_true", help="Afficher les recommandations apparues et résolues")
+    parser.add_argument("--import-reports", action="store_true", help="Historiser d'abord les rapports JSON existants du projet")
+    parser.add_argument("--json", action="store_true", help="Écrire les séries en JSON")
+    args = parser.parse_args(argv)
+    
+    project_path = Path(args.project)
+    if args.import_reports:
+        history = HistoryStore(project_path)
+        try:
+            known = history.recorded_timestamps()
+            imported = 0
+            for path in sorted(project_path.glob("RAPPORT_ARCHITECTURE_2*.json")):
+                try:
+                    with open(path, encoding='utf-8') as f:
+                        report = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Rapport ignoré {path.name}: {e}", file=sys.stderr)
+                    continue
+                if report.get("timestamp") not in known:
+                    history.record(report, report_file=path.name)
+                    imported += 1
+            print(f"📥 {imported} rapport(s) importé(s)", file=sys.stderr)
+        finally:
+            history.close()
+    
+    if not (project_path / AnalysisCache.CACHE_DIR / HistoryStore.FILENAME).is_file():
+        print(f"❌ Aucun historique dans {project_path / AnalysisCache.CACHE_DIR} : lancez une analyse (ou --import-reports)", file=sys.stderr)
+        return 2
+    history = HistoryStore(project_path, read_only=True)
+    try:
+        if args.list:
+            names = history.metric_names()
+            if args.json:
+                print(json.dumps(dict(names), indent=2, ensure_ascii=False))
+            else:
+                print("\n".join(f"{name:<50} {value:g}" for name, value in names))
+        elif args.recommendations:
+            print(format_recommendation_trend(history, args.last))
+        else:
+            data = trend_data(history, args.metrics, args.last)
+            print(json.dumps(data, indent=2, ensure_ascii=False) if args.json else format_trend(data))
+    finally:
+        history.close()
+    return 0
+
+def format_query_result(topic: str, result) -> str:
+    """Mise en forme texte d'une réponse de la sous-commande `query`"""
+    if topic == "routes":
+        lines = [f"{row['method']:<7} {row['path']}  ({row['file']})" + (f"  [{', '.join(row['middlewares'])}]" if row["middlewares"] else "") for row in result]
+    elif topic == "singletons":
+        lines = [f"{row['name']}{' (var)' if row['mutable'] else ''} — {row['file']} — {len(row['users'])} utilisateur(s)" for row in result]
+        lines += [f"    {user}" for row in result for user in row["users"]] if len(result) == 1 else []
+    elif topic == "files":
+        lines = [f"{row['lines']:>6}  {row['path']}" for row in result]
+    elif topic == "entity":
+        lines = []
+        for definition in result:
+            lines.append(f"{definition['name']} — table {definition['table'] or '?'} — {definition['columns']} colonne(s) — {definition['file']}")
+            lines += [f"  → {row['property']}: {row['type']} {row['target']}" for row in definition["relations"]]
+        referenced_by = result[0].get("referenced_by", []) if result else []
+        lines += [f"  ← {row['entity']}.{row['property']} ({row['type']}, {row['file']})" for row in referenced_by]
+    else:
+        lines = [f"{file}:{line} ({kind})" for file, line, kind in result["definitions"]]
+        lines += [f"  ← {file}" for file in result["references"]]
+    return "\n".join(lines) if lines else "Aucun résultat"
+
+def query_main(argv: List[str]) -> int:
+    """Sous-commande `query` : interroge l'index de la dernière analyse sans relire les sources"""
+    import argparse
+    
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--project", default=".", help="Racine du projet analysé")
+    common.add_argument("--json", action="store_true", help="Écrire la réponse en JSON")
+    
+    parser = argparse.ArgumentParser(prog="agent_architecte_principal.py query", description="Interroge l'index de la dernière analyse (sans rescanner le projet)")
+    topics = parser.add_subparsers(dest="topic", required=True)
+    routes = topics.add_parser("routes", parents=[common], help="Routes backend")
+    routes.add_argument("--method", help="Méthode HTTP (GET, POST...)")
+    routes.add_argument("--prefix", default="", help="Préfixe du chemin (/api/rides...)")
+    routes.add_argument("--file", default="", help="Fichier de routes (sous-chaîne)")
+    topics.add_parser("singletons", parents=[common], help="Singletons iOS (static shared) et leurs utilisateurs")
+    files = topics.add_parser("files", parents=[common], help="Fichiers analysés, du plus long au plus court")
+    files.add_argument("--min-lines", type=int, default=0, help="Nombre minimal de lignes")
+    files.add_argument("--kind", choices=("swift", "js"), help="Langage")
+    files.add_argument("--subproject", help="Sous-projet (ios, backend, dashboard ou plugin)")
+    files.add_argument("--limit", type=int, help="Nombre maximal de fichiers")
+    entity = topics.add_parser("entity", parents=[common], help="Entité TypeORM et ses relations")
+    entity.add_argument("name", help="Nom de l'entité")
+    entity.add_argument("--relations", action="store_true", help="Inclure aussi les entités qui la référencent")
+    symbol = topics.add_parser("symbol", parents=[common], help="Définitions et références d'un symbole")
+    symbol.add_argument("name", help="Nom du symbole")
+    args = parser.parse_args(argv)
+    
+    index = QueryIndex.open(Path(args.project))
+    if index is None:
+        print(f"❌ Aucun index à jour dans {Path(args.project) / AnalysisCache.CACHE_DIR} : lancez d'abord une analyse avec le cache activé", file=sys.stderr)
+        return 2
+    
+    try:
+        if args.topic == "routes":
+            result = index.routes(args.method, args.prefix, args.file)
+        elif args.topic == "singletons":
+            result = index.singletons()
+        elif args.topic == "files":
+            result = index.files(args.min_lines, args.kind, args.subproject, args.limit)
+        elif args.topic == "entity":
+            result = index.entity(args.name)
+            if not result:
+                print(f"❌ Entité inconnue: {args.name} (indexées: {', '.join(index.entity_names())})", file=sys.stderr)
+                return 1
+            if not args.relations:
+                result = [{key: value for key, value in definition.items() if key != "referenced_by"} for definition in result]
+        else:
+            symbols = index.symbols()
+            if symbols is None:
+                print("❌ Index des symboles absent", file=sys.stderr)
+                return 2
+            result = {"definitions": symbols.definitions_of(args.name), "references": symbols.references_to(args.name)}
+    finally:
+        index.close()
+    
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print(f"📇 Index du {index.timestamp}")
+        print(format_query_result(args.topic, result))
+    return 0
+
+def read_manifest(path: str) -> List[str]:
+    """Racines listées dans un manifeste : une par ligne, # pour les commentaires, chemins relatifs au manifeste"""
+    base = Path(path).parent
+    roots = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                roots.append(str(base / Path(line).expanduser()))
+    return roots
+
+def batch_main(argv: List[str]) -> int:
+    """Sous-commande `batch racine... [--manifest FICHIER]`"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="agent_architecte_principal.py batch", description="Analyse plusieurs racines avec un pool de processus et un cache par contenu partagés")
+    parser.add_argument("roots", nargs="*", help="Racines de projet à analyser")
+    parser.add_argument("--manifest", help="Fichier listant les racines (une par ligne)")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="Nombre de processus d'extraction (0 = tous les cœurs)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignorer les caches d'analyse persistants")
+    parser.add_argument("--no-history", action="store_true", help="Ne pas ajouter les exécutions à l'historique des métriques")
+    parser.add_argument("--project-plugins", action="store_true", help=f"Charger les analyseurs déclarés par le {ANALYZER_CONFIG_FILE} de chaque racine (exécute leur code)")
+    args = parser.parse_args(argv)
+    
+    roots = list(args.roots)
+    if args.manifest:
+        try:
+            roots += read_manifest(args.manifest)
+        except OSError as e:
+            print(f"❌ Manifeste illisible {args.manifest}: {e}", file=sys.stderr)
+            return 2
+    missing = [root for root in roots if not Path(root).is_dir()]
+    if not roots or missing:
+        print(f"❌ Racines introuvables: {', '.join(missing)}" if missing else "❌ Aucune racine à analyser", file=sys.stderr)
+        return 2
+    
+    print("🏛️ Agent Architecte Principal - Analyse par lot")
+    print("=" * 60)
+    
+    batch = BatchAnalysis(roots, use_cache=not args.no_cache, jobs=args.jobs, project_plugins=args.project_plugins)
+    reports = batch.analyze()
+    
+    print("\n📄 Génération des rapports...")
+    outputs = [(agent.generate_report(report), agent.generate_json_report(report)) for agent, report in zip(batch.agents, reports)]
+    if not args.no_history:
+        for agent, report, (_, json_file) in zip(batch.agents, reports, outputs):
+            agent.record_history(report, json_file)
+    markdown_file, json_file = batch.generate_reports(batch.summary(reports, outputs))
+    
+    print(f"\n✅ Rapport agrégé Markdown: {markdown_file}")
+    print(f"✅ Rapport agrégé JSON: {json_file}")
+    stats = batch.stats
+    print(f"⚙️ {stats.get('files', 0)} fichiers, {stats.get('unique_contents', 0)} contenus distincts, "
+          f"{stats.get('extracted', 0)} extraits, {stats.get('shared_hits', 0)} partagés entre racines ({stats['duration_seconds']} s)")
+    return 0
+
+# Sous-commandes : premier argument -> fonction (arguments restants) -> code de sortie
+SUBCOMMANDS = {
+    "diff": diff_main,
+    "query": query_main,
+    "batch": batch_main,
+    "trend": trend_main
+}
 
 def main():
     """Point d'entrée principal"""
-    import sys
+    # Chemins rapides : ni argparse ni analyseurs pour --version, chaque sous-commande n'importe que ce qu'elle utilise
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print(f"agent_architecte_principal {ANALYZER_VERSION}")
+        return
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        sys.exit(SUBCOMMANDS[sys.argv[1]](sys.argv[2:]))
+    
+    import argparse
+    from datetime import datetime
     
-    project_path = sys.argv[1] if len(sys.argv) > 1 else "."
+    parser = argparse.ArgumentParser(description="Agent Architecte Principal - Tshiakani VTC")
+    parser.add_argument("project_path", nargs="?", default=".", help="Racine du projet à analyser")
+    parser.add_argument("-V", "--version", action="version", version=f"agent_architecte_principal {ANALYZER_VERSION}")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Nombre de processus d'extraction (0 = tous les cœurs)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignorer le cache d'analyse persistant")
+    parser.add_argument("--profile", action="store_true", help="Écrire les profils cProfile/tracemalloc (piles repliées pour flamegraph)")
+    parser.add_argument("--ndjson", nargs="?", const="", default=None, metavar="FICHIER",
+                        help="Écrire aussi un enregistrement JSON par fichier analysé, au fil de l'analyse (NDJSON)")
+    parser.add_argument("--no-history", action="store_true", help="Ne pas ajouter l'exécution à l'historique des métriques")
+    parser.add_argument("--project-plugins", action="store_true", help=f"Charger les analyseurs déclarés par le {ANALYZER_CONFIG_FILE} du projet (exécute leur code)")
+    parser.add_argument("--only", metavar="NOMS", help="Analyseurs à exécuter, séparés par des virgules (ex. backend) ; le reste du projet n'est pas parcouru")
+    parser.add_argument("--since", metavar="REF", help="Ne relire que les fichiers modifiés depuis une référence git (le reste vient de la dernière analyse)")
+    parser.add_argument("--watch", action="store_true", help="Rester actif et régénérer les rapports à chaque modification")
+    parser.add_argument("--poll-interval", type=float, default=WATCH_POLL_INTERVAL, help="Période de scrutation si inotify est indisponible (secondes)")
+    args = parser.parse_args()
     
     print("🏛️ Agent Architecte Principal - Tshiakani VTC")
     print("=" * 60)
     
-    agent = AgentArchitectePrincipal(project_path)
-    report = agent.analyze()
+    only = [name.strip() for name in args.only.split(",") if name.strip()] if args.only else None
+    agent = AgentArchitectePrincipal(args.project_path, use_cache=not args.no_cache, jobs=args.jobs, only=only, project_plugins=args.project_plugins)
+    if args.watch:
+        agent.watch(args.poll_interval)
+        return
+    if args.since is not None:
+        try:
+            _git(agent.project_path, "rev-parse", "--verify", "--quiet", f"{args.since}^{{commit}}")
+        except ValueError as e:
+            print(f"❌ Référence git inutilisable {args.since}: {e}", file=sys.stderr)
+            sys.exit(2)
+        agent.since = args.since
+    if args.ndjson is not None:
+        ndjson_file = args.ndjson or f"RAPPORT_ARCHITECTURE_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+        agent.stream = NDJSONReportWriter(agent.project_path, agent.project_path / ndjson_file, {spec.name: spec.root for spec in agent.specs})
+    
+    profile_files = []
+    report = None
+    try:
+        if args.profile:
+            report, profile_files = agent.analyze_profiled()
+        else:
+            report = agent.analyze()
+    finally:
+        if agent.stream is not None:
+            agent.stream.close(report)
     
     # Générer les rapports
     print("\n📄 Génération des rapports...")
     markdown_file = agent.generate_report(report)
     json_file = agent.generate_json_report(report)
     
+    history_file = None if args.no_history else agent.record_history(report, json_file)
+    
     print(f"\n✅ Rapport Markdown généré: {markdown_file}")
     print(f"✅ Rapport JSON généré: {json_file}")
+    if history_file is not None:
+        print(f"✅ Historique mis à jour: {history_file}")
+    if agent.stream is not None:
+        print(f"✅ Rapport NDJSON généré: {agent.stream.output_path} ({agent.stream.records} fichiers)")
+    for profile_file in profile_files:
+        print(f"✅ Profil généré: {profile_file}")
     print(f"\n📊 Score de Qualité: {report.quality_score:.1f}/100")
     print(f"💡 Recommandations: {len(report.recommendations)}")
     
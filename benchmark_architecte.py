@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⏱️ Benchmark de l'Agent Architecte Principal - Tshiakani VTC
+
+Génère des projets synthétiques ayant la forme de Tshiakani VTC (iOS, backend, dashboard)
+à 1k, 10k et 100k fichiers, relève la durée de chaque phase des analyseurs (section « profile » du rapport), mesure le pic
+mémoire et compare les résultats à une référence enregistrée.
+
+Le démarrage est mesuré à part (python -X importtime) et doit tenir dans son budget, et les
+comptages de FeatureDetector sont vérifiés contre re.findall : --startup-only se limite à ces
+vérifications rapides, utilisables avant chaque commit.
+"""
+
+import os
+import sys
+import json
+import re
+import time
+import random
+import shutil
+import tempfile
+import contextlib
+import io
+import resource
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+import agent_architecte_principal as agent
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_BASELINE = "benchmark_architecte_baseline.json"
+
+# Seuil de régression signalé lors d'une comparaison (en %)
+REGRESSION_THRESHOLD = 20.0
+
+# Budget d'import du module (temps cumulé relevé par python -X importtime, en ms)
+STARTUP_BUDGET_MS = 40.0
+STARTUP_RUNS = 7
+
+# Modules réservés à l'analyse : leur import au démarrage ralentit --version, query, trend et diff
+STARTUP_FORBIDDEN_MODULES = ("sqlite3", "subprocess", "hashlib", "datetime", "dataclasses", "argparse",
+                             "concurrent.futures", "multiprocessing", "unicodedata")
+
+# Répartition des fichiers : (sous-projet, dossier, extension, part du total)
+LAYOUT = [
+    ("ios", "Tshiakani VTC/Services", ".swift", 0.05),
+    ("ios", "Tshiakani VTC/Views", ".swift", 0.20),
+    ("ios", "Tshiakani VTC/Models", ".swift", 0.07),
+    ("ios", "Tshiakani VTC/ViewModels", ".swift", 0.07),
+    ("ios", "Tshiakani VTC/Extensions", ".swift", 0.03),
+    ("backend", "backend/routes.postgres", ".js", 0.08),
+    ("backend", "backend/services", ".js", 0.10),
+    ("backend", "backend/entities", ".js", 0.05),
+    ("backend", "backend/middlewares.postgres", ".js", 0.02),
+    ("backend", "backend/utils", ".js", 0.03),
+    ("backend", "backend/modules", ".js", 0.08),
+    ("dashboard", "admin-dashboard/src/components", ".jsx", 0.10),
+    ("dashboard", "admin-dashboard/src/pages", ".jsx", 0.06),
+    ("dashboard", "admin-dashboard/src/services", ".js", 0.04),
+    ("dashboard", "admin-dashboard/src/utils", ".js", 0.02)
+]
+
+# Dossiers récursifs répartis en sous-dossiers pour rester réalistes
+NESTED_FOLDERS = {"Tshiakani VTC/Views", "backend/modules", "admin-dashboard/src/components"}
+FILES_PER_SUBFOLDER = 200
+
+# Part de fichiers « bruit » (node_modules, Pods) qui doivent être élagués
+NOISE_RATIO = 0.10
+
+SWIFT_SERVICE = '''import Foundation
+import Combine
+
+/// Service {name}
+class {name}: ObservableObject {{
+    static let shared = {name}()
+    @Published var isLoading = false
+    @Published var items: [String] = []
+    private var cancellables = Set<AnyCancellable>()
+
+    func fetch() async throws -> [String] {{
+        let result = try await APIService.shared.request("/api/{slug}")
+        return result
+    }}
+{extra}}}
+'''
+
+SWIFT_VIEW = '''import SwiftUI
+
+struct {name}: View {{
+    @StateObject private var viewModel = {name}Model()
+    @State private var isPresented = false
+
+    var body: some View {{
+        VStack {{
+            Text("{name}")
+{extra}        }}
+    }}
+}}
+'''
+
+SWIFT_MODEL = '''import Foundation
+
+/// Modèle {name}
+struct {name}: Codable, Identifiable {{
+    let id: String
+    var name: String
+    var createdAt: Date
+{extra}}}
+'''
+
+SWIFT_VIEWMODEL = '''import Foundation
+import Combine
+
+@MainActor
+class {name}: ObservableObject {{
+    @Published var state: String = ""
+    @Published var errorMessage: String?
+
+    func load() async {{
+        state = "loading"
+    }}
+{extra}}}
+'''
+
+SWIFT_EXTENSION = '''import SwiftUI
+
+extension View {{
+    func {slug}Style() -> some View {{
+        self.padding()
+    }}
+{extra}}}
+'''
+
+JS_ROUTE = '''const express = require('express');
+const router = express.Router();
+const {{ auth }} = require('../middlewares.postgres/auth');
+
+/**
+ * Routes {name}
+ */
+router.get('/api/{slug}', auth, async (req, res) => {{
+  try {{
+    res.json({{ ok: true }});
+  }} catch (error) {{
+    res.status(500).json({{ error: error.message }});
+  }}
+}});
+
+router.post('/api/{slug}', auth, async (req, res) => {{
+  res.status(201).json({{}});
+}});
+{extra}
+module.exports = router;
+'''
+
+JS_SERVICE = '''/**
+ * Service {name}
+ */
+class {name} {{
+  async find(id) {{
+    try {{
+      return await this.repository.findOne(id);
+    }} catch (error) {{
+      throw error;
+    }}
+  }}
+
+  async save(entity) {{
+    return this.repository.save(entity);
+  }}
+{extra}}}
+
+module.exports = new {name}();
+'''
+
+JS_ENTITY = '''const {{ EntitySchema }} = require('typeorm');
+
+// @ManyToOne User
+// @OneToMany Ride
+module.exports = new EntitySchema({{
+  name: '{name}',
+  columns: {{ id: {{ primary: true, type: 'int' }} }}
+}});
+{extra}'''
+
+JS_MODULE = '''const {slug} = require('./{slug}');
+
+async function handle{name}(req, res) {{
+  return res.json({{}});
+}}
+{extra}
+module.exports = {{ handle{name} }};
+'''
+
+JSX_COMPONENT = '''import React, {{ useState, useEffect }} from 'react';
+
+/** Composant {name} */
+export default function {name}() {{
+  const [data, setData] = useState([]);
+  useEffect(() => {{
+    fetch('/api/{slug}').then((r) => r.json()).then(setData);
+  }}, []);
+  return <div>{name}</div>;
+}}
+{extra}'''
+
+JS_DASHBOARD_SERVICE = '''import axios from 'axios';
+
+export const {slug}Api = {{
+  list: () => axios.get('/api/{slug}'),
+  create: (payload) => axios.post('/api/{slug}', payload)
+}};
+{extra}'''
+
+TEMPLATES = {
+    "Tshiakani VTC/Services": SWIFT_SERVICE,
+    "Tshiakani VTC/Views": SWIFT_VIEW,
+    "Tshiakani VTC/Models": SWIFT_MODEL,
+    "Tshiakani VTC/ViewModels": SWIFT_VIEWMODEL,
+    "Tshiakani VTC/Extensions": SWIFT_EXTENSION,
+    "backend/routes.postgres": JS_ROUTE,
+    "backend/services": JS_SERVICE,
+    "backend/entities": JS_ENTITY,
+    "backend/middlewares.postgres": JS_MODULE,
+    "backend/utils": JS_MODULE,
+    "backend/modules": JS_MODULE,
+    "admin-dashboard/src/components": JSX_COMPONENT,
+    "admin-dashboard/src/pages": JSX_COMPONENT,
+    "admin-dashboard/src/services": JS_DASHBOARD_SERVICE,
+    "admin-dashboard/src/utils": JS_MODULE
+}
+
+def generate_project(root: Path, total_files: int, seed: int = 42) -> Dict:
+    """Génère un projet synthétique de total_files fichiers sources (plus le bruit à élaguer)"""
+    rng = random.Random(seed)
+    counts = {}
+
+    for _, folder, extension, share in LAYOUT:
+        count = max(1, int(total_files * share))
+        counts[folder] = count
+        base = root / folder
+        suffix = "Service" if folder.endswith("Services") else "ViewModel" if folder.endswith("ViewModels") else ""
+        for index in range(count):
+            name = f"Gen{index}{suffix}"
+            directory = base / f"Group{index // FILES_PER_SUBFOLDER}" if folder in NESTED_FOLDERS else base
+            directory.mkdir(parents=True, exist_ok=True)
+
+            # Longueur variable : quelques lignes supplémentaires aléatoires
+            extra = "".join(f"    // ligne {n}\n" for n in range(rng.randint(0, 40)))
+            content = TEMPLATES[folder].format(name=name, slug=name.lower(), extra=extra)
+            (directory / f"{name}{extension}").write_text(content, encoding='utf-8')
+
+    # Fichiers de configuration lus par les analyseurs
+    (root / "backend" / "config").mkdir(parents=True, exist_ok=True)
+    (root / "backend" / "config" / "database.js").write_text("// PostGIS\nmodule.exports = { type: 'postgres' };\n", encoding='utf-8')
+    (root / "backend" / "server.postgres.js").write_text(
+        "const helmet = require('helmet');\nconst cors = require('cors');\nconst rateLimit = require('express-rate-limit');\n"
+        "const jwt = require('jsonwebtoken');\napp.use('/api/rides', require('./routes.postgres/Gen0'));\n", encoding='utf-8')
+    for package_dir in (root / "backend", root / "admin-dashboard"):
+        (package_dir / "package.json").write_text(json.dumps({"dependencies": {"express": "^4.18.0"}}), encoding='utf-8')
+
+    # Bruit : dépendances installées, jamais analysées
+    noise = int(total_files * NOISE_RATIO)
+    for index in range(noise):
+        directory = root / "backend" / "node_modules" / f"pkg{index // FILES_PER_SUBFOLDER}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"index{index}.js").write_text("module.exports = {};\n", encoding='utf-8')
+
+    return {"source_files": sum(counts.values()), "noise_files": noise}
+
+def run_scenario(project_path: str, jobs: int, use_cache: bool) -> Dict:
+    """Exécute une analyse complète (dans un processus dédié) et retourne ses mesures"""
+    architecte = agent.AgentArchitectePrincipal(project_path, use_cache=use_cache, jobs=jobs)
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = architecte.analyze()
+
+    # ru_maxrss est en kio sous Linux, en octets sous macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+    return {
+        "total_seconds": round(report.profile["total_seconds"], 4),
+        "phases": {name: round(stats["wall_time"], 4) for name, stats in sorted(report.profile["phases"].items())},
+        "peak_rss_mb": round(peak_mb, 1),
+        "files": report.metrics,
+        "extracted": architecte.features.extracted,
+        "cache_hits": architecte.features.cache_hits
+    }
+
+def _run_isolated(project_path: str, jobs: int, use_cache: bool) -> Dict:
+    """Lance un scénario dans un processus neuf pour isoler le pic mémoire"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_scenario, project_path, jobs, use_cache).result()
+
+def check_detectors() -> List[str]:
+    """Vérifie que FeatureDetector compte et capture chaque caractéristique comme re.findall sur son motif"""
+    cases = [
+        # Littéral et motif commençant à la même position
+        (agent.FeatureDetector(literals={"use": ["use"]}, patterns={"hooks": (r"use(\w+)", 0)}), "useState useEffect"),
+        # Deux motifs commençant à la même position
+        (agent.FeatureDetector(patterns={"get": (r"get(\w+)", 0), "item": (r"(get|set)Item", 0)}), "getItem setItem"),
+        # Littéraux imbriqués, drapeaux propres à chaque motif (pas de DOTALL implicite)
+        (agent.FeatureDetector(literals={"state": ["@State"], "object": ["@StateObject"]},
+                               patterns={"line": (r"^@\w+", re.MULTILINE), "call": (r"@.+?\)", 0),
+                                         "block": (r"@.+?\)", re.DOTALL), "verbose": (r"@ state \( # appel", re.VERBOSE | re.IGNORECASE)}),
+         "@StateObject var a\n@State(x\n) b @state(y)"),
+        # Référence arrière : l'expression combinée n'est pas utilisable
+        (agent.FeatureDetector(patterns={"double": (r"(\w)\1", 0), "word": (r"\w+", 0)}), "aab cdd")
+    ]
+    cases += [(agent.JS_DETECTOR, text) for text in TEMPLATES.values()]
+
+    mismatches = []
+    for detector, text in cases:
+        counts, captures = detector.scan(text)
+        expected = {name: re.findall("|".join(re.escape(t) for t in texts), text) for name, texts in detector.literals.items()}
+        expected.update((name, re.findall(pattern, text, flags)) for name, (pattern, flags) in detector.patterns.items())
+        for name, found in expected.items():
+            if counts[name] != len(found) or captures.get(name, found) != found:
+                mismatches.append(f"{name}: {counts[name]} {captures.get(name, '')} au lieu de {len(found)} {found} sur {text[:30]!r}")
+    return mismatches
+
+def _best_wall_time(command: List[str], runs: int) -> float:
+    """Meilleure durée (ms) d'une commande sur plusieurs exécutions"""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        durations.append(time.perf_counter() - start)
+    return round(min(durations) * 1000, 1)
+
+def measure_startup(runs: int = STARTUP_RUNS) -> Dict:
+    """Temps d'import du module (python -X importtime), modules chargés au démarrage et chemins rapides"""
+    module = agent.__name__
+    cwd = Path(agent.__file__).resolve().parent
+    imports = []
+    loaded = set()
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                cwd=cwd, capture_output=True, text=True, check=True)
+        # Lignes « import time: propre | cumulé | [indentation]module »
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if name.strip() == module:
+                imports.append(int(cumulative) / 1000)
+            loaded.add(name.strip())
+
+    with tempfile.TemporaryDirectory(prefix="architecte_startup_") as empty:
+        return {
+            "import_ms": round(min(imports), 2),
+            "forbidden_modules": sorted(name for name in STARTUP_FORBIDDEN_MODULES if name in loaded),
+            "version_ms": _best_wall_time([sys.executable, "-m", module, "--version"], runs),
+            "query_ms": _best_wall_time([sys.executable, "-m", module, "query", "files", "--project", empty], runs)
+        }
+
+def check_startup(startup: Dict, budget_ms: float, baseline: Optional[Dict] = None) -> List[str]:
+    """Affiche les mesures de démarrage et retourne les dépassements (budget, modules lourds, référence)"""
+    violations = []
+    print(f"\n🚀 Démarrage: import {startup['import_ms']:.1f} ms (budget {budget_ms:.0f} ms), "
+          f"--version {startup['version_ms']:.1f} ms, query {startup['query_ms']:.1f} ms")
+    if startup["import_ms"] > budget_ms:
+        violations.append(f"import {startup['import_ms']:.1f} ms > {budget_ms:.0f} ms")
+    if startup["forbidden_modules"]:
+        violations.append(f"modules importés au démarrage: {', '.join(startup['forbidden_modules'])}")
+    reference = (baseline or {}).get("startup")
+    if reference:
+        delta = _delta(reference["import_ms"], startup["import_ms"])
+        print(f"  ({delta:+.1f}% vs référence)")
+        if delta > REGRESSION_THRESHOLD:
+            violations.append(f"import: {delta:+.1f}%")
+    return violations
+
+def run_benchmarks(sizes: List[int], jobs: int, workdir: Optional[Path] = None) -> Dict:
+    """Génère chaque projet et mesure une exécution à froid puis à chaud (cache persistant)"""
+    results = {
+        "analyzer_version": agent.ANALYZER_VERSION,
+        "python": sys.version.split()[0],
+        "cpu_count": os.cpu_count(),
+        "jobs": jobs,
+        "scenarios": {}
+    }
+
+    if workdir is not None:
+        workdir.mkdir(parents=True, exist_ok=True)
+    base = Path(tempfile.mkdtemp(prefix="architecte_bench_", dir=workdir))
+    try:
+        for size in sizes:
+            project = base / f"projet_{size}"
+            print(f"📦 Génération d'un projet de {size} fichiers...")
+            start = time.perf_counter()
+            generated = generate_project(project, size)
+            generation = time.perf_counter() - start
+
+            print(f"  ⏱️ Analyse à froid...")
+            cold = _run_isolated(str(project), jobs, True)
+            print(f"  ⏱️ Analyse à chaud...")
+            warm = _run_isolated(str(project), jobs, True)
+
+            results["scenarios"][str(size)] = {
+                "generated": generated,
+                "generation_seconds": round(generation, 2),
+                "cold": cold,
+                "warm": warm
+            }
+            shutil.rmtree(project, ignore_errors=True)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    return results
+
+def print_results(results: Dict, baseline: Optional[Dict] = None) -> List[str]:
+    """Affiche un tableau des mesures et retourne la liste des régressions détectées"""
+    regressions = []
+    print(f"\n📊 Résultats (analyseur {results['analyzer_version']}, jobs={results['jobs']})")
+    print("=" * 72)
+
+    for size, scenario in results["scenarios"].items():
+        print(f"\n### {size} fichiers ({scenario['generated']['noise_files']} fichiers de bruit élagués)")
+        for mode in ("cold", "warm"):
+            run = scenario[mode]
+            line = f"- {mode:<5} total {run['total_seconds']:>8.3f}s  pic RSS {run['peak_rss_mb']:>7.1f} Mo  extraits {run['extracted']:>6}  cache {run['cache_hits']:>6}"
+            reference = (baseline or {}).get("scenarios", {}).get(size, {}).get(mode)
+            if reference:
+                delta = _delta(reference["total_seconds"], run["total_seconds"])
+                line += f"  ({delta:+.1f}% vs référence)"
+                if delta > REGRESSION_THRESHOLD:
+                    regressions.append(f"{size}/{mode}: {delta:+.1f}%")
+            print(line)
+
+        print("  Phases (à froid):")
+        for phase, seconds in scenario["cold"]["phases"].items():
+            print(f"    {phase:<45} {seconds:>8.4f}s")
+
+    return regressions
+
+def _delta(reference: float, value: float) -> float:
+    """Écart relatif en pourcentage"""
+    return ((value - reference) / reference * 100) if reference else 0.0
+
+def main():
+    """Point d'entrée principal"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark de l'Agent Architecte Principal")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Tailles des projets synthétiques")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Nombre de processus d'extraction")
+    parser.add_argument("--workdir", help="Dossier où générer les projets (défaut: dossier temporaire)")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, help="Enregistrer les résultats comme référence")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, help="Comparer à une référence enregistrée")
+    parser.add_argument("--output", help="Écrire les résultats bruts en JSON")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS, help="Budget d'import du module (ms)")
+    parser.add_argument("--startup-only", action="store_true", help="Seulement le démarrage et les détecteurs (vérification rapide)")
+    args = parser.parse_args()
+
+    print("⏱️ Benchmark - Agent Architecte Principal")
+    print("=" * 60)
+
+    if args.startup_only:
+        results = {"analyzer_version": agent.ANALYZER_VERSION, "python": sys.version.split()[0], "scenarios": {}}
+    else:
+        results = run_benchmarks(args.sizes, args.jobs, Path(args.workdir) if args.workdir else None)
+    results["startup"] = measure_startup()
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+    regressions = [] if args.startup_only else print_results(results, baseline)
+    startup_violations = check_startup(results["startup"], args.startup_budget, baseline)
+    detector_mismatches = check_detectors()
+    print(f"\n🔎 Détecteurs: {'conformes à re.findall' if not detector_mismatches else f'{len(detector_mismatches)} écart(s)'}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding='utf-8')
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"\n✅ Référence enregistrée: {args.save_baseline}")
+
+    if regressions:
+        print(f"\n🔴 Régressions (> {REGRESSION_THRESHOLD:.0f}%): {', '.join(regressions)}")
+    if startup_violations:
+        print(f"\n🔴 Démarrage hors budget: {', '.join(startup_violations)}")
+    for mismatch in detector_mismatches:
+        print(f"🔴 Détecteur: {mismatch}")
+    if regressions or startup_violations or detector_mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()